@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.env import SnakeEnv
+from snake_game.sim.vec import VecSnake
+
+
+def _env_steps_per_second(config: GameConfig, powerups_enabled: bool, steps: int) -> float:
+    env = SnakeEnv(config, UserSettings(), seed=0, powerups_enabled=powerups_enabled, max_steps=500)
+    env.reset()
+    rng = random.Random(0)
+    actions = [rng.randrange(-1, 4) for _ in range(4096)]
+    started = time.perf_counter()
+    for index in range(steps):
+        _, _, done = env.step(actions[index & 4095])
+        if done:
+            env.reset()
+    return steps / (time.perf_counter() - started)
+
+
+def _vec_steps_per_second(config: GameConfig, games: int, batches: int) -> float:
+    vec = VecSnake(games, config, UserSettings(), seed=0)
+    vec.reset()
+    rng = np.random.default_rng(0)
+    stepped = 0
+    elapsed = 0.0
+    for _ in range(batches):
+        if vec.done.all():
+            stepped += int(vec.steps.sum())
+            vec.reset()
+        actions = rng.integers(-1, 4, size=games)
+        started = time.perf_counter()
+        vec.step(actions)
+        elapsed += time.perf_counter() - started
+    stepped += int(vec.steps.sum())
+    return stepped / elapsed
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure SnakeEnv and VecSnake simulation throughput.")
+    parser.add_argument("--steps", type=int, default=200_000)
+    parser.add_argument("--games", type=int, default=4096)
+    parser.add_argument("--batches", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    config = GameConfig(window_width=400, window_height=400, cell_size=20)
+    config.validate()
+    for label, powerups_enabled in (("SnakeEnv, power-ups on", True), ("SnakeEnv, power-ups off", False)):
+        print(f"{label:28} {_env_steps_per_second(config, powerups_enabled, args.steps):12,.0f} steps/s")
+    rate = _vec_steps_per_second(config, args.games, args.batches)
+    print(f"{f'VecSnake, {args.games} games':28} {rate:12,.0f} steps/s")
+
+
+if __name__ == "__main__":
+    main()
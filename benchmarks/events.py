@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+from collections.abc import Callable
+
+from snake_game.events import EventBus, GameEvent, GameEventType, StepAdvanced
+
+FRAME_EVENTS = 4
+
+
+def _legacy_event(index: int) -> GameEvent:
+    return GameEvent(
+        type=GameEventType.STEP_ADVANCED,
+        payload={"score": index, "speed": 8.0, "status": "running", "head_x": index, "head_y": 3},
+    )
+
+
+def _legacy_round(bus: EventBus, count: int) -> int:
+    handled = 0
+    for index in range(count):
+        bus.emit(_legacy_event(index))
+        if index % FRAME_EVENTS == FRAME_EVENTS - 1:
+            for event in bus.drain():
+                if event.type == GameEventType.FOOD_EATEN:
+                    pass
+                elif event.type == GameEventType.STEP_ADVANCED:
+                    handled += int(event.payload.get("head_x", 0))
+    return handled
+
+
+def _pooled_round(bus: EventBus, count: int) -> int:
+    handled = [0]
+
+    def on_step(event: StepAdvanced) -> None:
+        handled[0] += event.head_x
+
+    bus.subscribe(GameEventType.STEP_ADVANCED, on_step)
+    event = StepAdvanced()
+    for index in range(count):
+        event.score = index
+        event.speed = 8.0
+        event.status = "running"
+        event.head_x = index
+        event.head_y = 3
+        bus.emit(event)
+    bus.unsubscribe(GameEventType.STEP_ADVANCED, on_step)
+    return handled[0]
+
+
+def _events_per_second(run: Callable[[EventBus, int], int], count: int) -> float:
+    started = time.perf_counter()
+    run(EventBus(), count)
+    return count / (time.perf_counter() - started)
+
+
+def _blocks_per_event(count: int, pooled: bool) -> float:
+    bus = EventBus()
+    gc.collect()
+    before = sys.getallocatedblocks()
+    if pooled:
+        _pooled_round(bus, count)
+    else:
+        for index in range(count):
+            bus.emit(_legacy_event(index))
+    retained = sys.getallocatedblocks() - before
+    bus.drain()
+    return retained / count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare dict-payload drained events with pooled typed dispatch.")
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    variants = (("drain + dict payload", _legacy_round, False), ("pooled + subscribe", _pooled_round, True))
+    for label, run, pooled in variants:
+        rate = _events_per_second(run, args.events)
+        blocks = _blocks_per_event(args.events, pooled)
+        print(f"{label:22} {rate:12,.0f} events/s   {blocks:5.2f} allocations/event")
+
+
+if __name__ == "__main__":
+    main()
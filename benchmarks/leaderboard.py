@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from snake_game.config import UserSettings
+from snake_game.leaderboard import Leaderboard
+from snake_game.persistence import PersistentData, leaderboard_key, record_score
+
+
+def _legacy_insert(table: list[int], score: int, limit: int) -> list[int]:
+    table = list(table)
+    table.append(score)
+    table.sort(reverse=True)
+    return table[:limit]
+
+
+def _legacy_rank(table: list[int], score: int) -> int:
+    return sum(1 for value in table if value > score) + 1
+
+
+def _per_operation(run: Callable[[int], object], scores: list[int]) -> float:
+    started = time.perf_counter()
+    for score in scores:
+        run(score)
+    return (time.perf_counter() - started) / len(scores)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare sorted-list leaderboards with the bisect Leaderboard.")
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--operations", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    history = [rng.randrange(100_000) for _ in range(args.entries)]
+    scores = [rng.randrange(100_000) for _ in range(args.operations)]
+    limit = args.entries + args.operations
+
+    legacy = sorted(history, reverse=True)
+    board = Leaderboard(history)
+    settings = UserSettings()
+    data = PersistentData(leaderboard={leaderboard_key(settings): Leaderboard(history)})
+
+    def legacy_insert(score: int) -> None:
+        nonlocal legacy
+        legacy = _legacy_insert(legacy, score, limit)
+
+    rows = (
+        ("insert", legacy_insert, board.insert),
+        ("record", legacy_insert, lambda score: record_score(data, settings, score, None)),
+        ("rank", lambda score: _legacy_rank(legacy, score), board.rank_of),
+        ("best", lambda score: max(legacy), lambda score: board.best),
+    )
+    print(f"{args.entries} entries, {args.operations} operations")
+    for label, legacy_run, board_run in rows:
+        before = _per_operation(legacy_run, scores)
+        after = _per_operation(board_run, scores)
+        print(f"{label:>7}: list {before * 1e6:10.1f} us   leaderboard {after * 1e6:8.2f} us   x{before / after:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from snake_game.net.client import LeaderboardClient
+from snake_game.net.protocol import DEFAULT_HOST
+
+KEYS = [
+    f"{difficulty}|{mode}|{obstacles}"
+    for difficulty in ("easy", "normal", "hard")
+    for mode in ("bounded", "wrap")
+    for obstacles in ("obs", "clear")
+]
+
+
+def _raise_file_limit(clients: int) -> None:
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = min(hard, max(soft, clients * 2 + 64))
+    if wanted > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+
+
+async def _client(host: str, port: int, requests: int, seed: int, latencies: list[float]) -> None:
+    rng = random.Random(seed)
+    client = await LeaderboardClient.connect(host, port)
+    try:
+        for _ in range(requests):
+            key = rng.choice(KEYS)
+            roll = rng.random()
+            started = time.perf_counter()
+            if roll < 0.5:
+                await client.submit(key, rng.randrange(10_000))
+            elif roll < 0.8:
+                await client.rank(key, rng.randrange(10_000))
+            else:
+                await client.top(key, 10)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        await client.close()
+
+
+async def _run(host: str, port: int, clients: int, requests: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, requests, seed, latencies) for seed in range(clients)))
+    return time.perf_counter() - started, latencies
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Drive the leaderboard server with many concurrent clients.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=None, help="use a running server instead of spawning one")
+    parser.add_argument("--clients", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    args = parser.parse_args(argv)
+
+    _raise_file_limit(args.clients)
+    server: subprocess.Popen[str] | None = None
+    with tempfile.TemporaryDirectory() as directory:
+        port = args.port
+        if port is None:
+            server = subprocess.Popen(
+                [sys.executable, "-m", "snake_game.net.server", "--port", "0", "--data-dir", directory],
+                stdout=subprocess.PIPE,
+                text=True,
+            )
+            assert server.stdout is not None
+            port = int(server.stdout.readline().rsplit(":", 1)[1])
+        try:
+            elapsed, latencies = asyncio.run(_run(args.host, port, args.clients, args.requests))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"{args.clients} clients x {args.requests} requests: {total / elapsed:,.0f} requests/s")
+    print(f"latency p50 {latencies[total // 2] * 1000:.2f} ms   p99 {latencies[int(total * 0.99)] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
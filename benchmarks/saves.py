@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from snake_game.config import UserSettings
+from snake_game.leaderboard import Leaderboard
+from snake_game.persistence import (
+    PersistentData,
+    best_score_for_settings,
+    leaderboard_key,
+    load_persistent_data,
+    save_persistent_data,
+    update_run_stats,
+)
+from snake_game.types import Difficulty, MapMode
+
+
+def _history(keys: int, entries: int) -> PersistentData:
+    rng = random.Random(0)
+    settings = [
+        UserSettings(difficulty=difficulty, map_mode=map_mode, obstacles_enabled=obstacles)
+        for difficulty in Difficulty
+        for map_mode in MapMode
+        for obstacles in (False, True)
+    ]
+    data = PersistentData()
+    for setup in settings[:keys]:
+        key = leaderboard_key(setup)
+        scores = [rng.randrange(5_000) for _ in range(entries)]
+        data.leaderboard[key] = Leaderboard(scores)
+        for score in scores[:2_000]:
+            update_run_stats(data, score, key, score // 100 + 1, score // 3, score / 7)
+    return data
+
+
+def _best_of(repeats: int, run: Callable[[], None]) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON and binary save size and startup parse time.")
+    parser.add_argument("--keys", type=int, default=18)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    data = _history(args.keys, args.entries)
+    print(f"{len(data.leaderboard)} leaderboards x {args.entries} scores")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("save.json", "save.snks"):
+            path = Path(directory) / name
+            save_persistent_data(data, path)
+
+            def startup() -> None:
+                loaded = load_persistent_data(path)
+                best_score_for_settings(loaded, loaded.settings)
+
+            def full() -> None:
+                loaded = load_persistent_data(path)
+                for _ in loaded.leaderboard.items():
+                    pass
+                for _ in loaded.run_stats.items():
+                    pass
+
+            startup_seconds = _best_of(args.repeats, startup)
+            full_seconds = _best_of(args.repeats, full)
+            print(
+                f"{name:>10}: {path.stat().st_size / 1024:9.1f} KiB   "
+                f"startup {startup_seconds * 1000:8.2f} ms   full decode {full_seconds * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import time
+
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.replay import Replay, ReplayRecorder
+from snake_game.sim.session import GameSession
+from snake_game.sim.verify import VerificationRequest, verify_all, verify_batch
+from snake_game.types import Difficulty, MapMode
+
+
+def _record(config: GameConfig, settings: UserSettings, seed: int, max_ticks: int) -> Replay:
+    session = GameSession(config, settings, seed=seed)
+    recorder = ReplayRecorder(session)
+    noise = random.Random(seed)
+    while not session.finished and session.tick < max_ticks:
+        direction = greedy_policy(session.state, config)
+        if direction is not None and noise.random() < 0.95:
+            recorder.queue_direction(direction)
+        session.step()
+    return recorder.finish()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure replay verification throughput, serial and on a pool.")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--max-ticks", type=int, default=3000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    config = GameConfig()
+    combos = [
+        UserSettings(difficulty=difficulty, map_mode=map_mode, obstacles_enabled=obstacles)
+        for difficulty in Difficulty
+        for map_mode in MapMode
+        for obstacles in (False, True)
+    ]
+    replays = [_record(config, combos[seed % len(combos)], seed, args.max_ticks) for seed in range(args.runs)]
+    requests = [
+        VerificationRequest(index, replay.to_bytes(), replay.final_score) for index, replay in enumerate(replays)
+    ]
+    steps = sum(replay.final_tick for replay in replays)
+    print(f"{args.runs} replays, {steps:,} steps, {sum(len(request.replay) for request in requests):,} bytes")
+
+    started = time.perf_counter()
+    serial = verify_batch(requests, config)
+    elapsed = time.perf_counter() - started
+    assert all(result.accepted for result in serial)
+    print(f"{'serial':>10}: {steps / elapsed:12,.0f} steps/s {60 * args.runs / elapsed:10,.0f} runs/min")
+
+    _, report = verify_all(requests, max_workers=args.workers, config=config)
+    assert report.rejected == 0
+    label = f"{args.workers} workers"
+    print(f"{label:>10}: {report.steps_per_second:12,.0f} steps/s {report.runs_per_minute:10,.0f} runs/min")
+
+
+if __name__ == "__main__":
+    main()
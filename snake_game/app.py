@@ -4,10 +4,12 @@ from pathlib import Path
 import pygame
 
 from snake_game.audio import AudioManager
+from snake_game.bots.mcts import shutdown_executors
 from snake_game.config import GameConfig
-from snake_game.events import EventBus
-from snake_game.persistence import load_persistent_data, save_persistent_data
+from snake_game.net.outbox import ScoreOutbox
+from snake_game.persistence import load_persistent_data
 from snake_game.rendering.effects import draw_fade_overlay
+from snake_game.save_writer import SaveWriter
 from snake_game.scenes.base import AppContext, Scene
 from snake_game.scenes.game_over_scene import GameOverScene
 from snake_game.scenes.menu_scene import MenuScene
@@ -23,6 +25,8 @@ def _build_scene(scene_id: SceneId, ctx: AppContext) -> Scene:
         return SettingsScene(ctx)
     if scene_id == SceneId.PLAY:
         return PlayScene(ctx)
+    if scene_id == SceneId.DEMO:
+        return PlayScene(ctx, demo=True)
     if scene_id == SceneId.GAME_OVER:
         return GameOverScene(ctx)
     raise ValueError(f"Unsupported scene id: {scene_id}")
@@ -33,7 +37,7 @@ def run() -> None:
 
     config = GameConfig()
     data_path = Path(config.data_file)
-    persistent_data = load_persistent_data(data_path)
+    persistent_data = load_persistent_data(data_path, config.leaderboard_limit)
     config.graphics = persistent_data.graphics
     config.validate()
 
@@ -46,59 +50,70 @@ def run() -> None:
     small_font = pygame.font.Font(None, 28)
 
     audio = AudioManager(muted=persistent_data.settings.muted)
+    save_writer = SaveWriter(data_path)
+    score_outbox = None
+    if config.leaderboard_server is not None:
+        host, _, port = config.leaderboard_server.rpartition(":")
+        score_outbox = ScoreOutbox.for_server(data_path.parent, host, int(port))
 
     ctx = AppContext(
         config=config,
         data_path=data_path,
         persistent_data=persistent_data,
         audio=audio,
-        event_bus=EventBus(),
         rng=random.Random(),
         title_font=title_font,
         body_font=body_font,
         small_font=small_font,
+        save_writer=save_writer,
+        score_outbox=score_outbox,
     )
 
-    scene: Scene = _build_scene(SceneId.MENU, ctx)
-    running = True
-    transition_alpha = 0 if config.graphics.reduced_motion else 255
+    try:
+        scene: Scene = _build_scene(SceneId.MENU, ctx)
+        running = True
+        transition_alpha = 0 if config.graphics.reduced_motion else 255
 
-    while running:
-        delta_seconds = clock.tick(config.render_fps) / 1000.0
+        while running:
+            delta_seconds = clock.tick(config.render_fps) / 1000.0
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-                break
-            scene.handle_event(event)
-
-        if not running:
-            break
-
-        next_scene = scene.consume_next_scene()
-        if next_scene is not None:
-            scene = _build_scene(next_scene, ctx)
-            if not config.graphics.reduced_motion:
-                transition_alpha = 180
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                    break
+                scene.handle_event(event)
 
-        if scene.quit_requested:
-            break
+            if not running:
+                break
 
-        scene.update(delta_seconds)
-        if scene.quit_requested:
-            break
+            next_scene = scene.consume_next_scene()
+            if next_scene is not None:
+                scene = _build_scene(next_scene, ctx)
+                if not config.graphics.reduced_motion:
+                    transition_alpha = 180
 
-        post_update_scene = scene.consume_next_scene()
-        if post_update_scene is not None:
-            scene = _build_scene(post_update_scene, ctx)
-            if not config.graphics.reduced_motion:
-                transition_alpha = 180
+            if scene.quit_requested:
+                break
 
-        scene.render(screen)
-        if transition_alpha > 0:
-            draw_fade_overlay(screen, transition_alpha)
-            transition_alpha = max(0, transition_alpha - int(420 * delta_seconds))
-        pygame.display.flip()
+            scene.update(delta_seconds)
+            if scene.quit_requested:
+                break
 
-    save_persistent_data(ctx.persistent_data, data_path)
+            post_update_scene = scene.consume_next_scene()
+            if post_update_scene is not None:
+                scene = _build_scene(post_update_scene, ctx)
+                if not config.graphics.reduced_motion:
+                    transition_alpha = 180
+
+            scene.render(screen)
+            if transition_alpha > 0:
+                draw_fade_overlay(screen, transition_alpha)
+                transition_alpha = max(0, transition_alpha - int(420 * delta_seconds))
+            pygame.display.flip()
+    finally:
+        ctx.save()
+        save_writer.close()
+        if score_outbox is not None:
+            score_outbox.close()
+        shutdown_executors()
     pygame.quit()
@@ -0,0 +1,2 @@
+"""Built-in bot policies for headless runs and attract mode."""
+
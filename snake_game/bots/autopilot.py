@@ -0,0 +1,254 @@
+from collections import deque
+
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig
+from snake_game.state import GameState, SnakeBody
+from snake_game.types import Direction, MapMode, Point
+
+UNREACHABLE = 1 << 30
+
+_DIRECTIONS: tuple[Direction, ...] = tuple(Direction)
+_VECTORS: tuple[tuple[int, int], ...] = tuple(direction.vector for direction in _DIRECTIONS)
+
+
+class DistanceField:
+    __slots__ = (
+        "width",
+        "height",
+        "wrap",
+        "points",
+        "neighbors",
+        "blocked",
+        "full_mask",
+        "first_column",
+        "last_column",
+        "first_row",
+        "obstacle_bits",
+        "body_bits",
+        "distances",
+        "queue",
+        "target",
+        "obstacles",
+        "tracked_body",
+        "body_head",
+        "body_tail",
+        "body_length",
+    )
+
+    def __init__(self, width: int, height: int, wrap: bool) -> None:
+        self.width = width
+        self.height = height
+        self.wrap = wrap
+        self.points: list[Point] = [(x, y) for y in range(height) for x in range(width)]
+        self.neighbors: list[tuple[int, ...]] = [self._neighbors_of(x, y) for x, y in self.points]
+        self.blocked = bytearray(width * height)
+        self.full_mask = (1 << (width * height)) - 1
+        self.first_column = sum(1 << (y * width) for y in range(height))
+        self.last_column = self.first_column << (width - 1)
+        self.first_row = (1 << width) - 1
+        self.obstacle_bits = 0
+        self.body_bits = 0
+        self.distances: list[int] = [UNREACHABLE] * (width * height)
+        self.queue: deque[int] = deque()
+        self.target: Point | None = None
+        self.obstacles: set[Point] | None = None
+        self.tracked_body: SnakeBody | None = None
+        self.body_head: Point | None = None
+        self.body_tail: Point | None = None
+        self.body_length = 0
+
+    def _neighbors_of(self, x: int, y: int) -> tuple[int, ...]:
+        width = self.width
+        height = self.height
+        flats: list[int] = []
+        for move_x, move_y in _VECTORS:
+            new_x, new_y = x + move_x, y + move_y
+            if self.wrap:
+                new_x %= width
+                new_y %= height
+            elif not (0 <= new_x < width and 0 <= new_y < height):
+                flats.append(-1)
+                continue
+            flats.append(new_y * width + new_x)
+        return tuple(flats)
+
+    def matches(self, width: int, height: int, wrap: bool) -> bool:
+        return self.width == width and self.height == height and self.wrap == wrap
+
+    def update(self, target: Point, obstacles: set[Point]) -> bool:
+        if target == self.target and obstacles is self.obstacles:
+            return False
+        if obstacles is not self.obstacles:
+            blocked = self.blocked
+            blocked[:] = bytes(len(blocked))
+            obstacle_bits = 0
+            for x, y in obstacles:
+                blocked[y * self.width + x] = 1
+                obstacle_bits |= 1 << (y * self.width + x)
+            self.obstacle_bits = obstacle_bits
+            self.obstacles = obstacles
+            self.body_head = None
+        self.target = target
+        start = target[1] * self.width + target[0]
+        distances = self.distances
+        distances[:] = [UNREACHABLE] * len(distances)
+        distances[start] = 0
+        self.queue = deque((start,))
+        return True
+
+    def settle(self, flat: int, budget: int) -> bool:
+        distances = self.distances
+        neighbors = self.neighbors
+        blocked = self.blocked
+        queue = self.queue
+        while queue:
+            known = distances[flat]
+            if known != UNREACHABLE and distances[queue[0]] > known:
+                return True
+            if budget <= 0:
+                return False
+            budget -= 1
+            current = queue.popleft()
+            distance = distances[current] + 1
+            for neighbor in neighbors[current]:
+                if neighbor >= 0 and distances[neighbor] == UNREACHABLE and not blocked[neighbor]:
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return True
+
+    def track_body(self, body: SnakeBody) -> None:
+        head = body.head
+        tail = body.tail
+        length = len(body)
+        if body is not self.tracked_body:
+            self.tracked_body = body
+            self.body_head = None
+        elif head == self.body_head and tail == self.body_tail and length == self.body_length:
+            return
+        width = self.width
+        if length > 1 and body[1] == self.body_head and length - self.body_length in (0, 1):
+            body_bits = self.body_bits
+            if length == self.body_length and self.body_tail is not None:
+                old_x, old_y = self.body_tail
+                body_bits &= ~(1 << (old_y * width + old_x))
+            self.body_bits = body_bits | (1 << (head[1] * width + head[0]))
+        else:
+            body_bits = 0
+            for x, y in body:
+                body_bits |= 1 << (y * width + x)
+            self.body_bits = body_bits
+        self.body_head = head
+        self.body_tail = tail
+        self.body_length = length
+
+    def open_space(self, start: int, limit: int) -> int:
+        tail_x, tail_y = self.body_tail or (0, 0)
+        free = self.full_mask & ~(self.obstacle_bits | self.body_bits)
+        free |= (1 << (tail_y * self.width + tail_x)) & ~self.obstacle_bits
+        width = self.width
+        last_row_shift = self.full_mask.bit_length() - width
+        not_first_column = self.full_mask & ~self.first_column
+        not_last_column = self.full_mask & ~self.last_column
+        first_column = self.first_column
+        last_column = self.last_column
+        first_row = self.first_row
+        wrap = self.wrap
+
+        region = 1 << start
+        count = 1
+        while count < limit:
+            grown = (
+                region
+                | ((region << 1) & not_first_column)
+                | ((region >> 1) & not_last_column)
+                | (region << width)
+                | (region >> width)
+            )
+            if wrap:
+                grown |= (
+                    ((region & last_column) >> (width - 1))
+                    | ((region & first_column) << (width - 1))
+                    | (region >> last_row_shift)
+                    | ((region & first_row) << last_row_shift)
+                )
+            grown &= free | region
+            if grown == region:
+                break
+            region = grown
+            count = region.bit_count()
+        return count
+
+
+class AutopilotPolicy:
+    __slots__ = ("field", "searches", "search_budget")
+
+    def __init__(self, search_budget: int = 64) -> None:
+        self.field: DistanceField | None = None
+        self.searches = 0
+        self.search_budget = search_budget
+
+    def distance_field(self, state: GameState, config: GameConfig) -> DistanceField:
+        wrap = state.map_mode == MapMode.WRAP
+        field = self.field
+        if field is None or not field.matches(config.grid_width, config.grid_height, wrap):
+            field = DistanceField(config.grid_width, config.grid_height, wrap)
+            self.field = field
+        if field.update(state.food, state.obstacle_cells):
+            self.searches += 1
+        return field
+
+    def __call__(self, state: GameState, config: GameConfig) -> Direction | None:
+        if state.world is not None:
+            return greedy_policy(state, config)
+        field = self.distance_field(state, config)
+        body = state.body
+        field.track_body(body)
+        head_x, head_y = body.head
+        head_flat = head_y * field.width + head_x
+        settled = field.settle(head_flat, self.search_budget)
+        tail = body.tail
+        food_x, food_y = food = state.food
+        points = field.points
+        distances = field.distances
+        width = field.width
+        height = field.height
+        reverse_x, reverse_y = state.direction.vector
+
+        candidates: list[tuple[int, int, int]] = []
+        for index, neighbor in enumerate(field.neighbors[head_flat]):
+            if neighbor < 0 or field.blocked[neighbor]:
+                continue
+            move_x, move_y = _VECTORS[index]
+            if move_x + reverse_x == 0 and move_y + reverse_y == 0:
+                continue
+            cell = points[neighbor]
+            if cell in body and (cell != tail or cell == food):
+                continue
+            if settled:
+                distance = distances[neighbor]
+            else:
+                delta_x = abs(cell[0] - food_x)
+                delta_y = abs(cell[1] - food_y)
+                if field.wrap:
+                    delta_x = min(delta_x, width - delta_x)
+                    delta_y = min(delta_y, height - delta_y)
+                distance = delta_x + delta_y
+            candidates.append((distance, index, neighbor))
+        if not candidates:
+            return None
+        candidates.sort()
+
+        needed = len(body)
+        best_index = candidates[0][1]
+        best_space = -1
+        for _, index, neighbor in candidates:
+            space = field.open_space(neighbor, needed)
+            if space >= needed:
+                return _DIRECTIONS[index]
+            if space > best_space:
+                best_index = index
+                best_space = space
+        return _DIRECTIONS[best_index]
+
+
+autopilot_policy = AutopilotPolicy()
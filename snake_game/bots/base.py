@@ -0,0 +1,43 @@
+from collections.abc import Callable
+
+from snake_game.config import GameConfig
+from snake_game.logic import is_opposite
+from snake_game.state import GameState
+from snake_game.types import Direction, MapMode, Point
+
+type Policy = Callable[[GameState, GameConfig], Direction | None]
+
+
+def step_cell(state: GameState, config: GameConfig, direction: Direction) -> Point | None:
+    head_x, head_y = state.snake.head
+    move_x, move_y = direction.vector
+    new_x, new_y = head_x + move_x, head_y + move_y
+    if state.map_mode == MapMode.WRAP:
+        return (new_x % config.grid_width, new_y % config.grid_height)
+    if state.map_mode == MapMode.OPEN:
+        return (new_x, new_y)
+    if 0 <= new_x < config.grid_width and 0 <= new_y < config.grid_height:
+        return (new_x, new_y)
+    return None
+
+
+def is_safe_move(state: GameState, config: GameConfig, direction: Direction) -> bool:
+    if is_opposite(state.direction, direction):
+        return False
+    cell = step_cell(state, config, direction)
+    if cell is None or cell in state.obstacles:
+        return False
+    if state.world is not None and cell in state.world:
+        return False
+    if cell in state.snake:
+        return cell == state.snake.tail and cell != state.food
+    return True
+
+
+def grid_distance(state: GameState, config: GameConfig, start: Point, end: Point) -> int:
+    delta_x = abs(start[0] - end[0])
+    delta_y = abs(start[1] - end[1])
+    if state.map_mode == MapMode.WRAP:
+        delta_x = min(delta_x, config.grid_width - delta_x)
+        delta_y = min(delta_y, config.grid_height - delta_y)
+    return delta_x + delta_y
@@ -0,0 +1,20 @@
+from snake_game.bots.base import grid_distance, is_safe_move, step_cell
+from snake_game.config import GameConfig
+from snake_game.state import GameState
+from snake_game.types import Direction
+
+
+def greedy_policy(state: GameState, config: GameConfig) -> Direction | None:
+    best: Direction | None = None
+    best_distance = 0
+    for direction in Direction:
+        if not is_safe_move(state, config, direction):
+            continue
+        cell = step_cell(state, config, direction)
+        if cell is None:
+            continue
+        distance = grid_distance(state, config, cell, state.food)
+        if best is None or distance < best_distance:
+            best = direction
+            best_distance = distance
+    return best
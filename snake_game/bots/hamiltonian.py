@@ -0,0 +1,181 @@
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from snake_game.bots.autopilot import AutopilotPolicy
+from snake_game.config import GameConfig
+from snake_game.state import GameState, SnakeBody
+from snake_game.types import Direction, Point
+
+DEFAULT_CYCLE_DIR = Path("data/cycles")
+SHORTCUT_BUFFER = 3
+
+_DIRECTIONS: tuple[Direction, ...] = tuple(Direction)
+
+
+@dataclass(frozen=True, slots=True)
+class HamiltonianCycle:
+    width: int
+    height: int
+    order: array
+    index: array
+
+    @classmethod
+    def from_order(cls, width: int, height: int, order: array) -> "HamiltonianCycle":
+        index = array("I", bytes(4 * len(order)))
+        for position, flat in enumerate(order):
+            index[flat] = position
+        return cls(width=width, height=height, order=order, index=index)
+
+    def position(self, cell: Point) -> int:
+        return self.index[cell[1] * self.width + cell[0]]
+
+
+def build_cycle(width: int, height: int) -> array:
+    if width < 2 or height < 2 or (width % 2 and height % 2):
+        raise ValueError(f"no Hamiltonian cycle exists on a {width}x{height} grid")
+    if height % 2:
+        transposed = build_cycle(height, width)
+        return array("I", ((flat % height) * width + flat // height for flat in transposed))
+
+    order = array("I")
+    for y in range(height):
+        columns = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+        order.extend(y * width + x for x in columns)
+    order.extend(y * width for y in range(height - 1, -1, -1))
+    return order
+
+
+def is_hamiltonian_cycle(width: int, height: int, order: array) -> bool:
+    size = width * height
+    if len(order) != size:
+        return False
+    seen = bytearray(size)
+    previous = order[-1] if size else 0
+    for flat in order:
+        if flat >= size or seen[flat]:
+            return False
+        seen[flat] = 1
+        if abs(flat % width - previous % width) + abs(flat // width - previous // width) != 1:
+            return False
+        previous = flat
+    return True
+
+
+_CYCLES: dict[tuple[int, int], HamiltonianCycle] = {}
+
+
+def load_cycle(width: int, height: int, cache_dir: Path | None = DEFAULT_CYCLE_DIR) -> HamiltonianCycle:
+    key = (width, height)
+    cycle = _CYCLES.get(key)
+    if cycle is not None:
+        return cycle
+
+    order: array | None = None
+    path = cache_dir / f"{width}x{height}.cycle" if cache_dir is not None else None
+    if path is not None and path.exists():
+        try:
+            stored = array("I")
+            stored.frombytes(path.read_bytes())
+            if is_hamiltonian_cycle(width, height, stored):
+                order = stored
+        except (OSError, ValueError):
+            order = None
+    if order is None:
+        order = build_cycle(width, height)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(order.tobytes())
+            except OSError:
+                pass
+
+    cycle = HamiltonianCycle.from_order(width, height, order)
+    _CYCLES[key] = cycle
+    return cycle
+
+
+class HamiltonianPolicy:
+    __slots__ = ("cache_dir", "cycle", "reverse", "tracked_body", "last_head", "fallback")
+
+    def __init__(self, cache_dir: Path | None = DEFAULT_CYCLE_DIR) -> None:
+        self.cache_dir = cache_dir
+        self.cycle: HamiltonianCycle | None = None
+        self.reverse: bool | None = None
+        self.tracked_body: SnakeBody | None = None
+        self.last_head: Point | None = None
+        self.fallback = AutopilotPolicy()
+
+    def _cycle_for(self, config: GameConfig) -> HamiltonianCycle | None:
+        cycle = self.cycle
+        if cycle is None or cycle.width != config.grid_width or cycle.height != config.grid_height:
+            try:
+                cycle = load_cycle(config.grid_width, config.grid_height, self.cache_dir)
+            except ValueError:
+                return None
+            self.cycle = cycle
+        return cycle
+
+    def _orientation(self, cycle: HamiltonianCycle, body: SnakeBody) -> bool | None:
+        if body is not self.tracked_body:
+            self.tracked_body = body
+        elif len(body) > 1 and body[1] == self.last_head:
+            return self.reverse
+        size = len(cycle.order)
+        positions = [cycle.position(cell) for cell in body]
+        for reverse in (False, True):
+            total = 0
+            for ahead, behind in zip(positions, positions[1:]):
+                step = (behind - ahead) % size if reverse else (ahead - behind) % size
+                if step == 0:
+                    break
+                total += step
+            else:
+                if total < size:
+                    return reverse
+        return None
+
+    def __call__(self, state: GameState, config: GameConfig) -> Direction | None:
+        cycle = self._cycle_for(config)
+        if cycle is None or state.obstacle_cells or state.world is not None:
+            return self.fallback(state, config)
+
+        body = state.body
+        self.reverse = self._orientation(cycle, body)
+        self.last_head = body.head
+        if self.reverse is None:
+            return self.fallback(state, config)
+
+        size = len(cycle.order)
+        sign = -1 if self.reverse else 1
+        head_x, head_y = body.head
+        head_position = cycle.position(body.head)
+
+        def ahead(cell: Point) -> int:
+            return (sign * (cycle.position(cell) - head_position)) % size
+
+        max_skip = 1
+        if len(body) * 2 < size:
+            tail_gap = ahead(body.tail)
+            food_gap = ahead(state.food)
+            max_skip = max(1, tail_gap - SHORTCUT_BUFFER)
+            if food_gap < tail_gap:
+                max_skip = max(1, min(max_skip, food_gap))
+
+        best: Direction | None = None
+        best_gap = 0
+        for direction in _DIRECTIONS:
+            move_x, move_y = direction.vector
+            cell = ((head_x + move_x) % config.grid_width, (head_y + move_y) % config.grid_height)
+            if abs(cell[0] - head_x) + abs(cell[1] - head_y) != 1:
+                continue
+            gap = ahead(cell)
+            if gap == 0 or gap > max_skip or (cell in body and gap != 1):
+                continue
+            if gap > best_gap:
+                best = direction
+                best_gap = gap
+        return best
+
+
+hamiltonian_policy = HamiltonianPolicy()
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import math
+import os
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from snake_game.bots.base import grid_distance, is_safe_move, step_cell
+from snake_game.config import GameConfig
+from snake_game.logic import StepUndo, advance_one_step, undo_step
+from snake_game.sim.codec import pack_state, unpack_state
+from snake_game.state import GameState
+from snake_game.types import Direction, GameStatus
+
+DEFAULT_TIME_BUDGET = 0.030
+
+_DIRECTIONS: tuple[Direction, ...] = tuple(Direction)
+_EXECUTORS: dict[int, ProcessPoolExecutor] = {}
+_WORKER_CONFIGS: dict[tuple[int, int], GameConfig] = {}
+
+type ActionStats = list[tuple[int, float]]
+
+
+class _Node:
+    __slots__ = ("visits", "value", "children")
+
+    def __init__(self) -> None:
+        self.visits = 0
+        self.value = 0.0
+        self.children: list[_Node | None] = [None, None, None, None]
+
+
+def _legal_actions(state: GameState) -> list[int]:
+    reverse_x, reverse_y = state.direction.vector
+    actions: list[int] = []
+    for index, direction in enumerate(_DIRECTIONS):
+        move_x, move_y = direction.vector
+        if move_x + reverse_x != 0 or move_y + reverse_y != 0:
+            actions.append(index)
+    return actions
+
+
+def _rollout_action(state: GameState, config: GameConfig, rng: random.Random) -> Direction | None:
+    safe = [direction for direction in _DIRECTIONS if is_safe_move(state, config, direction)]
+    if not safe:
+        return None
+    if rng.random() < 0.2:
+        return rng.choice(safe)
+    best = safe[0]
+    best_distance = -1
+    for direction in safe:
+        cell = step_cell(state, config, direction)
+        if cell is None:
+            continue
+        distance = grid_distance(state, config, cell, state.food)
+        if best_distance < 0 or distance < best_distance:
+            best = direction
+            best_distance = distance
+    return best
+
+
+def _evaluate(state: GameState, config: GameConfig, food_reward: float, start_distance: int, depth: int) -> float:
+    if state.status != GameStatus.RUNNING:
+        return 0.0
+    distance = grid_distance(state, config, state.snake.head, state.food)
+    progress = (start_distance - distance) / max(1, depth)
+    return 0.4 + 0.5 * min(1.0, food_reward) + 0.1 * progress
+
+
+def search(
+    state: GameState,
+    config: GameConfig,
+    time_budget: float,
+    rng: random.Random,
+    rollout_depth: int = 8,
+    exploration: float = 1.4,
+) -> ActionStats:
+    deadline = time.perf_counter() + time_budget
+    root = _Node()
+    records = [StepUndo() for _ in range(rollout_depth * 4 + 8)]
+    start_distance = grid_distance(state, config, state.snake.head, state.food)
+
+    while time.perf_counter() < deadline:
+        path = [root]
+        node = root
+        depth = 0
+        food_reward = 0.0
+
+        while state.status == GameStatus.RUNNING and depth < len(records) - rollout_depth:
+            actions = _legal_actions(state)
+            untried = [action for action in actions if node.children[action] is None]
+            if untried:
+                action = rng.choice(untried)
+                child = _Node()
+                node.children[action] = child
+            else:
+                log_visits = math.log(node.visits)
+                action = actions[0]
+                best_score = -1.0
+                for candidate in actions:
+                    child = node.children[candidate]
+                    assert child is not None
+                    score = child.value / child.visits + exploration * math.sqrt(log_visits / child.visits)
+                    if score > best_score:
+                        action = candidate
+                        best_score = score
+                child = node.children[action]
+                assert child is not None
+            state.pending_direction = _DIRECTIONS[action]
+            advance_one_step(state, config, rng, undo=records[depth])
+            if state.score != records[depth].score:
+                food_reward += 0.9**depth
+            depth += 1
+            path.append(child)
+            node = child
+            if untried:
+                break
+
+        for _ in range(rollout_depth):
+            if state.status != GameStatus.RUNNING:
+                break
+            state.pending_direction = _rollout_action(state, config, rng)
+            advance_one_step(state, config, rng, undo=records[depth])
+            if state.score != records[depth].score:
+                food_reward += 0.9**depth
+            depth += 1
+
+        value = _evaluate(state, config, food_reward, start_distance, depth)
+        while depth > 0:
+            depth -= 1
+            undo_step(state, records[depth], rng)
+        for visited in path:
+            visited.visits += 1
+            visited.value += value
+
+    stats: ActionStats = []
+    for child in root.children:
+        stats.append((child.visits, child.value) if child is not None else (0, 0.0))
+    return stats
+
+
+def search_packed(
+    packed: bytes,
+    time_budget: float,
+    seed: int,
+    rollout_depth: int = 8,
+    exploration: float = 1.4,
+) -> ActionStats:
+    state, width, height = unpack_state(packed)
+    config = _WORKER_CONFIGS.get((width, height))
+    if config is None:
+        config = GameConfig(window_width=width, window_height=height, cell_size=1)
+        _WORKER_CONFIGS[(width, height)] = config
+    return search(state, config, time_budget, random.Random(seed), rollout_depth, exploration)
+
+
+def merge_stats(results: list[ActionStats]) -> ActionStats:
+    merged: ActionStats = [(0, 0.0)] * len(_DIRECTIONS)
+    for stats in results:
+        merged = [
+            (visits + extra_visits, value + extra_value)
+            for (visits, value), (extra_visits, extra_value) in zip(merged, stats)
+        ]
+    return merged
+
+
+def shared_executor(workers: int) -> ProcessPoolExecutor:
+    executor = _EXECUTORS.get(workers)
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        _EXECUTORS[workers] = executor
+    return executor
+
+
+def shutdown_executors() -> None:
+    for executor in _EXECUTORS.values():
+        executor.shutdown(cancel_futures=True)
+    _EXECUTORS.clear()
+
+
+class MCTSPolicy:
+    def __init__(
+        self,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        workers: int | None = None,
+        rollout_depth: int = 8,
+        exploration: float = 1.4,
+        seed: int = 0,
+    ) -> None:
+        self.time_budget = time_budget
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.rollout_depth = rollout_depth
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.last_stats: ActionStats = []
+        self.pack_seconds = 0.0
+        self.pipelined = 0
+        self._ahead: tuple[bytes, list[Future[ActionStats]]] | None = None
+
+    def __call__(self, state: GameState, config: GameConfig) -> Direction | None:
+        ahead = self._ahead
+        self._ahead = None
+        if state.status != GameStatus.RUNNING:
+            self._cancel(ahead)
+            return None
+        started = time.perf_counter()
+        packed = pack_state(state, config)
+        self.pack_seconds = time.perf_counter() - started
+
+        if self.workers <= 1:
+            seed = self.rng.getrandbits(63)
+            results = [search_packed(packed, self.time_budget, seed, self.rollout_depth, self.exploration)]
+        else:
+            if ahead is not None and ahead[0] == packed:
+                futures = ahead[1]
+                self.pipelined += 1
+            else:
+                self._cancel(ahead)
+                futures = self._submit(packed)
+            results = [future.result() for future in futures]
+
+        self.last_stats = merge_stats(results)
+        best_index = max(range(len(_DIRECTIONS)), key=lambda index: self.last_stats[index])
+        if self.last_stats[best_index][0] == 0:
+            return None
+        direction = _DIRECTIONS[best_index]
+        if self.workers > 1:
+            self._search_ahead(state, config, direction)
+        return direction
+
+    def _submit(self, packed: bytes) -> list[Future[ActionStats]]:
+        executor = shared_executor(self.workers)
+        return [
+            executor.submit(
+                search_packed, packed, self.time_budget, self.rng.getrandbits(63), self.rollout_depth, self.exploration
+            )
+            for _ in range(self.workers)
+        ]
+
+    def _search_ahead(self, state: GameState, config: GameConfig, direction: Direction) -> None:
+        predicted, _, _ = unpack_state(pack_state(state, config))
+        predicted.pending_direction = direction
+        advance_one_step(predicted, config, random.Random(0))
+        if predicted.status == GameStatus.RUNNING:
+            packed = pack_state(predicted, config)
+            self._ahead = (packed, self._submit(packed))
+
+    def _cancel(self, ahead: tuple[bytes, list[Future[ActionStats]]] | None) -> None:
+        if ahead is not None:
+            for future in ahead[1]:
+                future.cancel()
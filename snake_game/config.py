@@ -63,11 +63,16 @@ class GameConfig:
     cell_size: int = 20
     render_fps: int = 60
     max_steps_per_frame: int = 5
+    turbo_steps_per_frame: int = 2000
     countdown_seconds: float = 3.0
     obstacle_count: int = 14
-    leaderboard_limit: int = 10
+    leaderboard_limit: int | None = 10
     stage_points_interval: int = 25
     data_file: str = "data/save.json"
+    leaderboard_server: str | None = None
+    demo_policy: str = "autopilot"
+    board_width: int | None = None
+    board_height: int | None = None
     graphics: GraphicsSettings = field(default_factory=GraphicsSettings)
 
     background_color: tuple[int, int, int] = (16, 18, 22)
@@ -83,10 +88,22 @@ class GameConfig:
 
     @property
     def grid_width(self) -> int:
+        if self.board_width is not None:
+            return self.board_width
         return self.window_width // self.cell_size
 
     @property
     def grid_height(self) -> int:
+        if self.board_height is not None:
+            return self.board_height
+        return self.window_height // self.cell_size
+
+    @property
+    def view_width(self) -> int:
+        return self.window_width // self.cell_size
+
+    @property
+    def view_height(self) -> int:
         return self.window_height // self.cell_size
 
     def validate(self) -> None:
@@ -98,12 +115,18 @@ class GameConfig:
             raise ValueError("grid dimensions must be at least 8x8 cells")
         if self.max_steps_per_frame < 1:
             raise ValueError("max_steps_per_frame must be >= 1")
+        if self.turbo_steps_per_frame < 1:
+            raise ValueError("turbo_steps_per_frame must be >= 1")
         if self.countdown_seconds < 0:
             raise ValueError("countdown_seconds must be >= 0")
         if self.obstacle_count < 0:
             raise ValueError("obstacle_count must be >= 0")
-        if self.leaderboard_limit < 1:
-            raise ValueError("leaderboard_limit must be >= 1")
+        if self.leaderboard_limit is not None and self.leaderboard_limit < 1:
+            raise ValueError("leaderboard_limit must be >= 1 or None")
+        if self.leaderboard_server is not None:
+            host, _, port = self.leaderboard_server.rpartition(":")
+            if not host or not port.isdigit():
+                raise ValueError("leaderboard_server must be 'host:port'")
         if self.stage_points_interval < 1:
             raise ValueError("stage_points_interval must be >= 1")
         if self.graphics.ui_scale <= 0:
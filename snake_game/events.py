@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable
+from typing import Callable, ClassVar
 
 
 class GameEventType(Enum):
@@ -12,6 +12,7 @@ class GameEventType(Enum):
     PLAYER_DIED = "player_died"
     STAGE_ADVANCED = "stage_advanced"
     POWERUP_COLLECTED = "powerup_collected"
+    STEPS_BATCHED = "steps_batched"
 
 
 @dataclass(frozen=True, slots=True)
@@ -19,19 +20,118 @@ class GameEvent:
     type: GameEventType
     payload: dict[str, int | float | str | bool] = field(default_factory=dict)
 
+    def copy(self) -> GameEvent:
+        return self
 
-EventEmitter = Callable[[GameEvent], None]
 
+class PooledEvent:
+    __slots__ = ()
+    type: ClassVar[GameEventType]
+
+    @property
+    def payload(self) -> dict[str, int | float | str | bool]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def copy(self) -> PooledEvent:
+        clone = object.__new__(type(self))
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+
+class StepAdvanced(PooledEvent):
+    __slots__ = ("score", "speed", "status", "head_x", "head_y")
+    type = GameEventType.STEP_ADVANCED
+
+    def __init__(self) -> None:
+        self.score = 0
+        self.speed = 0.0
+        self.status = ""
+        self.head_x = 0
+        self.head_y = 0
+
+
+class FoodEaten(PooledEvent):
+    __slots__ = ("score", "speed", "score_multiplier", "head_x", "head_y")
+    type = GameEventType.FOOD_EATEN
+
+    def __init__(self) -> None:
+        self.score = 0
+        self.speed = 0.0
+        self.score_multiplier = 1
+        self.head_x = 0
+        self.head_y = 0
+
+
+class PlayerDied(PooledEvent):
+    __slots__ = ("reason", "score")
+    type = GameEventType.PLAYER_DIED
+
+    def __init__(self) -> None:
+        self.reason = ""
+        self.score = 0
+
+
+class StageAdvanced(PooledEvent):
+    __slots__ = ("stage", "score")
+    type = GameEventType.STAGE_ADVANCED
 
-class EventBus:
     def __init__(self) -> None:
-        self._queue: deque[GameEvent] = deque()
+        self.stage = 1
+        self.score = 0
 
-    def emit(self, event: GameEvent) -> None:
-        self._queue.append(event)
 
-    def drain(self) -> list[GameEvent]:
+class PowerUpCollected(PooledEvent):
+    __slots__ = ("powerup", "duration_seconds")
+    type = GameEventType.POWERUP_COLLECTED
+
+    def __init__(self) -> None:
+        self.powerup = ""
+        self.duration_seconds = 0.0
+
+
+class StepsBatched(PooledEvent):
+    __slots__ = ("steps", "food_eaten", "score", "head_x", "head_y")
+    type = GameEventType.STEPS_BATCHED
+
+    def __init__(self) -> None:
+        self.steps = 0
+        self.food_eaten = 0
+        self.score = 0
+        self.head_x = 0
+        self.head_y = 0
+
+
+type Event = GameEvent | PooledEvent
+EventEmitter = Callable[[Event], None]
+EventHandler = Callable[[Event], None]
+
+
+class EventBus:
+    def __init__(self, queue_unhandled: bool = True) -> None:
+        self.queue_unhandled = queue_unhandled
+        self._queue: deque[Event] = deque()
+        self._handlers: dict[GameEventType, list[EventHandler]] = {}
+
+    def subscribe(self, event_type: GameEventType, handler: EventHandler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: GameEventType, handler: EventHandler) -> None:
+        handlers = self._handlers.get(event_type)
+        if handlers is not None and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event_type]
+
+    def emit(self, event: Event) -> None:
+        handlers = self._handlers.get(event.type)
+        if handlers is not None:
+            for handler in handlers:
+                handler(event)
+        elif self.queue_unhandled:
+            self._queue.append(event.copy())
+
+    def drain(self) -> list[Event]:
         events = list(self._queue)
         self._queue.clear()
         return events
-
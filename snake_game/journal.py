@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from snake_game.config import UserSettings
+from snake_game.types import Difficulty, MapMode
+
+JOURNAL_FILE_NAME = "runs.journal"
+JOURNAL_COMPACT_RECORDS = 256
+
+_RECORD = struct.Struct("<QBBBxIIIIfd")
+_CHECKSUM = struct.Struct("<I")
+RECORD_SIZE = _RECORD.size + _CHECKSUM.size
+
+_DIFFICULTIES: tuple[Difficulty, ...] = tuple(Difficulty)
+_MAP_MODES: tuple[MapMode, ...] = tuple(MapMode)
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    seq: int
+    settings: UserSettings
+    score: int
+    limit: int | None
+    stage: int = 1
+    food_eaten: int = 0
+    run_seconds: float = 0.0
+    played_at: float = 0.0
+
+    def to_bytes(self) -> bytes:
+        body = _RECORD.pack(
+            self.seq,
+            _DIFFICULTIES.index(self.settings.difficulty),
+            _MAP_MODES.index(self.settings.map_mode),
+            int(self.settings.obstacles_enabled),
+            max(self.score, 0),
+            self.limit or 0,
+            self.stage,
+            self.food_eaten,
+            self.run_seconds,
+            self.played_at,
+        )
+        return body + _CHECKSUM.pack(zlib.crc32(body))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> RunRecord | None:
+        body = data[: _RECORD.size]
+        (checksum,) = _CHECKSUM.unpack_from(data, _RECORD.size)
+        if zlib.crc32(body) != checksum:
+            return None
+        seq, difficulty, map_mode, obstacles, score, limit, stage, food_eaten, run_seconds, played_at = _RECORD.unpack(
+            body
+        )
+        if difficulty >= len(_DIFFICULTIES) or map_mode >= len(_MAP_MODES) or obstacles > 1:
+            return None
+        settings = UserSettings(
+            difficulty=_DIFFICULTIES[difficulty],
+            map_mode=_MAP_MODES[map_mode],
+            obstacles_enabled=bool(obstacles),
+        )
+        return cls(
+            seq=seq,
+            settings=settings,
+            score=score,
+            limit=limit or None,
+            stage=stage,
+            food_eaten=food_eaten,
+            run_seconds=run_seconds,
+            played_at=played_at,
+        )
+
+
+def journal_path(save_path: Path) -> Path:
+    return save_path.with_name(JOURNAL_FILE_NAME)
+
+
+def append_records(path: Path, records: Iterable[RunRecord]) -> None:
+    data = b"".join(record.to_bytes() for record in records)
+    if not data:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def read_records(path: Path) -> tuple[list[RunRecord], bool]:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return [], True
+    records: list[RunRecord] = []
+    offset = 0
+    while offset + RECORD_SIZE <= len(data):
+        record = RunRecord.from_bytes(data[offset : offset + RECORD_SIZE])
+        if record is None or (records and record.seq <= records[-1].seq):
+            break
+        records.append(record)
+        offset += RECORD_SIZE
+    return records, offset == len(data)
+
+
+def rewrite_records(path: Path, records: list[RunRecord]) -> None:
+    if not records:
+        if path.exists():
+            with path.open("wb") as handle:
+                os.fsync(handle.fileno())
+        return
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(b"".join(record.to_bytes() for record in records))
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+def discard_through(path: Path, seq: int) -> None:
+    records, clean = read_records(path)
+    kept = [record for record in records if record.seq > seq]
+    if clean and len(kept) == len(records):
+        return
+    rewrite_records(path, kept)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+
+class Leaderboard(Sequence[int]):
+    __slots__ = ("_keys", "limit")
+
+    def __init__(self, scores: Iterable[int] = (), limit: int | None = None) -> None:
+        self._keys = sorted(-score for score in scores)
+        self.limit = limit
+        self._trim()
+
+    @overload
+    def __getitem__(self, index: int) -> int: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[int]: ...
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        if isinstance(index, slice):
+            return [-key for key in self._keys[index]]
+        return -self._keys[index]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[int]:
+        return (-key for key in self._keys)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Leaderboard):
+            return self._keys == other._keys
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Leaderboard({self.top(5)}{', ...' if len(self) > 5 else ''}, size={len(self)}, limit={self.limit})"
+
+    def copy(self) -> Leaderboard:
+        duplicate = Leaderboard(limit=self.limit)
+        duplicate._keys = self._keys.copy()
+        return duplicate
+
+    @property
+    def best(self) -> int:
+        return -self._keys[0] if self._keys else 0
+
+    def insert(self, score: int) -> int | None:
+        index = bisect_right(self._keys, -score)
+        if self.limit is not None and index >= self.limit:
+            return None
+        self._keys.insert(index, -score)
+        self._trim()
+        return index + 1
+
+    def set_limit(self, limit: int | None) -> None:
+        self.limit = limit
+        self._trim()
+
+    def rank_of(self, score: int) -> int:
+        return bisect_left(self._keys, -score) + 1
+
+    def count_below(self, score: int) -> int:
+        return len(self._keys) - bisect_right(self._keys, -score)
+
+    def percentile(self, score: int) -> float:
+        if not self._keys:
+            return 0.0
+        return 100.0 * self.count_below(score) / len(self._keys)
+
+    def top(self, count: int) -> list[int]:
+        return [-key for key in self._keys[:count]]
+
+    def _trim(self) -> None:
+        if self.limit is not None and len(self._keys) > self.limit:
+            del self._keys[self.limit :]
@@ -1,44 +1,149 @@
 import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
 
 from snake_game.config import GameConfig, UserSettings, rules_for_difficulty
-from snake_game.events import EventEmitter, GameEvent, GameEventType
-from snake_game.state import GameState
+from snake_game.events import EventEmitter, FoodEaten, PlayerDied, StepAdvanced
+from snake_game.state import FreeCellIndex, GameState, SnakeBody
+from snake_game.systems.world import DEFAULT_CHUNK_SIZE, ChunkedWorld
 from snake_game.types import Direction, GameStatus, MapMode, Point
 
 
+@dataclass(slots=True)
+class StateSnapshot:
+    body: tuple[Point, ...]
+    direction: Direction
+    pending_direction: Direction | None
+    food: Point
+    score: int
+    status: GameStatus
+    steps_per_second: float
+    accumulator_seconds: float
+    obstacle_cells: frozenset[Point]
+    free_cells: FreeCellIndex | None
+
+
+@dataclass(slots=True)
+class StepUndo:
+    direction: Direction = Direction.RIGHT
+    pending_direction: Direction | None = None
+    food: Point = (0, 0)
+    score: int = 0
+    status: GameStatus = GameStatus.RUNNING
+    steps_per_second: float = 0.0
+    new_head: Point | None = None
+    head_slot: int = -1
+    vacated: Point | None = None
+    vacated_released: bool = False
+    rng_state: Any = None
+
+
+def snapshot_state(state: GameState) -> StateSnapshot:
+    free_cells = state.free_cells
+    return StateSnapshot(
+        body=tuple(state.body),
+        direction=state.direction,
+        pending_direction=state.pending_direction,
+        food=state.food,
+        score=state.score,
+        status=state.status,
+        steps_per_second=state.steps_per_second,
+        accumulator_seconds=state.accumulator_seconds,
+        obstacle_cells=frozenset(state.obstacle_cells),
+        free_cells=free_cells.copy() if free_cells is not None else None,
+    )
+
+
+def restore_state(state: GameState, snapshot: StateSnapshot) -> None:
+    state.body = SnakeBody(snapshot.body)
+    state.direction = snapshot.direction
+    state.pending_direction = snapshot.pending_direction
+    state.food = snapshot.food
+    state.score = snapshot.score
+    state.status = snapshot.status
+    state.steps_per_second = snapshot.steps_per_second
+    state.accumulator_seconds = snapshot.accumulator_seconds
+    if state.obstacle_cells != snapshot.obstacle_cells:
+        state.obstacle_cells = set(snapshot.obstacle_cells)
+    if snapshot.free_cells is None:
+        state.free_cells = None
+    elif state.free_cells is None:
+        state.free_cells = snapshot.free_cells.copy()
+    else:
+        state.free_cells.copy_from(snapshot.free_cells)
+
+
+def undo_step(state: GameState, undo: StepUndo, rng: random.Random | None = None) -> None:
+    new_head = undo.new_head
+    if new_head is not None:
+        body = state.body
+        free_cells = state.free_cells
+        body.pop_head()
+        if free_cells is not None and undo.head_slot >= 0:
+            free_cells.reinsert(new_head, undo.head_slot)
+        vacated = undo.vacated
+        if vacated is not None:
+            body.push_tail(vacated)
+            if free_cells is not None and undo.vacated_released:
+                free_cells.take(vacated)
+    state.direction = undo.direction
+    state.pending_direction = undo.pending_direction
+    state.food = undo.food
+    state.score = undo.score
+    state.status = undo.status
+    state.steps_per_second = undo.steps_per_second
+    if rng is not None and undo.rng_state is not None:
+        rng.setstate(undo.rng_state)
+
+
+_OPPOSITE_DIRECTION = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
+
 def is_opposite(current: Direction, next_direction: Direction) -> bool:
-    dx1, dy1 = current.vector
-    dx2, dy2 = next_direction.vector
-    return dx1 + dx2 == 0 and dy1 + dy2 == 0
+    return _OPPOSITE_DIRECTION[current] is next_direction
 
 
-def _emit(
-    emit: EventEmitter | None,
-    event_type: GameEventType,
-    **payload: int | float | str | bool,
-) -> None:
+_STEP_ADVANCED = StepAdvanced()
+_FOOD_EATEN = FoodEaten()
+_PLAYER_DIED = PlayerDied()
+
+
+def _emit_died(emit: EventEmitter | None, reason: str, score: int) -> None:
     if emit is None:
         return
-    emit(GameEvent(type=event_type, payload=payload))
+    event = _PLAYER_DIED
+    event.reason = reason
+    event.score = score
+    emit(event)
 
 
 def spawn_food(
-    snake_cells: list[Point] | set[Point],
+    snake_cells: list[Point] | set[Point] | SnakeBody,
     obstacle_cells: set[Point],
     grid_width: int,
     grid_height: int,
     rng: random.Random,
+    free_cells: FreeCellIndex | None = None,
 ) -> Point:
-    occupied = set(snake_cells) | obstacle_cells
-    candidates = [
-        (x, y)
-        for y in range(grid_height)
-        for x in range(grid_width)
-        if (x, y) not in occupied
-    ]
-    if not candidates:
+    if free_cells is None:
+        free_cells = FreeCellIndex(grid_width, grid_height, occupied=chain(snake_cells, obstacle_cells))
+    if not free_cells:
         raise RuntimeError("board is full, no free cell for food")
-    return rng.choice(candidates)
+    return free_cells.sample(rng)
+
+
+def spawn_world_food(world: ChunkedWorld, snake_cells: SnakeBody | set[Point], rng: random.Random) -> Point:
+    food = world.sample_excluding(rng, snake_cells)
+    if food is None:
+        raise RuntimeError("no free cell for food near the snake")
+    return food
 
 
 def spawn_obstacles(
@@ -47,15 +152,36 @@ def spawn_obstacles(
     grid_width: int,
     grid_height: int,
     rng: random.Random,
+    free_cells: FreeCellIndex | None = None,
 ) -> set[Point]:
-    candidates = [
-        (x, y)
-        for y in range(grid_height)
-        for x in range(grid_width)
-        if (x, y) not in forbidden_cells
-    ]
-    rng.shuffle(candidates)
-    return set(candidates[: min(len(candidates), obstacle_count)])
+    if free_cells is None:
+        free_cells = FreeCellIndex(grid_width, grid_height)
+
+    reserved: list[tuple[Point, int]] = []
+    for cell in sorted(forbidden_cells):
+        slot = free_cells.take(cell)
+        if slot >= 0:
+            reserved.append((cell, slot))
+
+    obstacles: set[Point] = set()
+    while len(obstacles) < obstacle_count and free_cells:
+        obstacles.add(free_cells.pop_random(rng))
+
+    for cell, slot in reversed(reserved):
+        free_cells.reinsert(cell, slot)
+    return obstacles
+
+
+def free_cell_index(state: GameState, config: GameConfig) -> FreeCellIndex:
+    index = state.free_cells
+    if index is None or index.width != config.grid_width or index.height != config.grid_height:
+        index = FreeCellIndex(
+            config.grid_width,
+            config.grid_height,
+            occupied=chain(state.snake, state.obstacles),
+        )
+        state.free_cells = index
+    return index
 
 
 def _initial_snake(config: GameConfig) -> list[Point]:
@@ -64,6 +190,18 @@ def _initial_snake(config: GameConfig) -> list[Point]:
     return [(center_x, center_y), (center_x - 1, center_y), (center_x - 2, center_y)]
 
 
+def _create_world(config: GameConfig, settings: UserSettings, rng: random.Random) -> ChunkedWorld:
+    obstacles_per_chunk = 0
+    if settings.obstacles_enabled:
+        chunk_area = DEFAULT_CHUNK_SIZE * DEFAULT_CHUNK_SIZE
+        obstacles_per_chunk = round(config.obstacle_count * chunk_area / (config.grid_width * config.grid_height))
+    return ChunkedWorld(
+        seed=rng.getrandbits(63),
+        obstacles_per_chunk=obstacles_per_chunk,
+        safe_center=(config.grid_width // 2, config.grid_height // 2),
+    )
+
+
 def create_initial_state(
     config: GameConfig,
     settings: UserSettings,
@@ -73,6 +211,28 @@ def create_initial_state(
     rules = rules_for_difficulty(settings.difficulty)
 
     snake = _initial_snake(config)
+    if settings.map_mode == MapMode.OPEN:
+        world = _create_world(config, settings, local_rng)
+        world.focus = snake[0]
+        return GameState(
+            body=SnakeBody(snake),
+            direction=Direction.RIGHT,
+            pending_direction=None,
+            food=spawn_world_food(world, set(snake), local_rng),
+            score=0,
+            status=GameStatus.RUNNING,
+            steps_per_second=rules.base_steps_per_second,
+            speed_increment_per_food=rules.speed_increment_per_food,
+            max_steps_per_second=rules.max_steps_per_second,
+            score_per_food=rules.score_per_food,
+            difficulty=settings.difficulty,
+            map_mode=settings.map_mode,
+            obstacle_cells=set(),
+            accumulator_seconds=0.0,
+            world=world,
+        )
+
+    free_cells = FreeCellIndex(config.grid_width, config.grid_height, occupied=snake)
     obstacles: set[Point] = set()
     if settings.obstacles_enabled:
         center_x = config.grid_width // 2
@@ -89,11 +249,12 @@ def create_initial_state(
             grid_width=config.grid_width,
             grid_height=config.grid_height,
             rng=local_rng,
+            free_cells=free_cells,
         )
 
-    food = spawn_food(snake, obstacles, config.grid_width, config.grid_height, local_rng)
+    food = spawn_food(snake, obstacles, config.grid_width, config.grid_height, local_rng, free_cells)
     return GameState(
-        snake=snake,
+        body=SnakeBody(snake),
         direction=Direction.RIGHT,
         pending_direction=None,
         food=food,
@@ -105,8 +266,9 @@ def create_initial_state(
         score_per_food=rules.score_per_food,
         difficulty=settings.difficulty,
         map_mode=settings.map_mode,
-        obstacles=obstacles,
+        obstacle_cells=obstacles,
         accumulator_seconds=0.0,
+        free_cells=free_cells,
     )
 
 
@@ -117,7 +279,7 @@ def reset_state(
     rng: random.Random | None = None,
 ) -> None:
     fresh = create_initial_state(config, settings, rng)
-    state.snake = fresh.snake
+    state.body = fresh.body
     state.direction = fresh.direction
     state.pending_direction = fresh.pending_direction
     state.food = fresh.food
@@ -129,8 +291,10 @@ def reset_state(
     state.score_per_food = fresh.score_per_food
     state.difficulty = fresh.difficulty
     state.map_mode = fresh.map_mode
-    state.obstacles = fresh.obstacles
+    state.obstacle_cells = fresh.obstacle_cells
     state.accumulator_seconds = fresh.accumulator_seconds
+    state.free_cells = fresh.free_cells
+    state.world = fresh.world
 
 
 def queue_direction_change(state: GameState, next_direction: Direction) -> None:
@@ -142,19 +306,22 @@ def queue_direction_change(state: GameState, next_direction: Direction) -> None:
 
 
 def _next_head_position(state: GameState, config: GameConfig, phase_active: bool = False) -> Point | None:
-    head_x, head_y = state.snake[0]
-    move_x, move_y = state.direction.vector
+    head_x, head_y = state.body.head
+    move_x, move_y = state.direction.value
     new_x, new_y = (head_x + move_x, head_y + move_y)
+    grid_width = config.grid_width
+    grid_height = config.grid_height
 
     if state.map_mode == MapMode.WRAP:
-        return (new_x % config.grid_width, new_y % config.grid_height)
-
-    if phase_active and (new_x < 0 or new_x >= config.grid_width or new_y < 0 or new_y >= config.grid_height):
-        return (new_x % config.grid_width, new_y % config.grid_height)
+        return (new_x % grid_width, new_y % grid_height)
+    if state.map_mode == MapMode.OPEN:
+        return (new_x, new_y)
 
-    if new_x < 0 or new_x >= config.grid_width or new_y < 0 or new_y >= config.grid_height:
-        return None
-    return (new_x, new_y)
+    if 0 <= new_x < grid_width and 0 <= new_y < grid_height:
+        return (new_x, new_y)
+    if phase_active:
+        return (new_x % grid_width, new_y % grid_height)
+    return None
 
 
 def advance_one_step(
@@ -164,7 +331,20 @@ def advance_one_step(
     score_multiplier: int = 1,
     phase_active: bool = False,
     emit: EventEmitter | None = None,
+    undo: StepUndo | None = None,
 ) -> None:
+    if undo is not None:
+        undo.direction = state.direction
+        undo.pending_direction = state.pending_direction
+        undo.food = state.food
+        undo.score = state.score
+        undo.status = state.status
+        undo.steps_per_second = state.steps_per_second
+        undo.new_head = None
+        undo.head_slot = -1
+        undo.vacated = None
+        undo.vacated_released = False
+        undo.rng_state = None
     if state.status != GameStatus.RUNNING:
         return
 
@@ -175,22 +355,38 @@ def advance_one_step(
     new_head = _next_head_position(state, config, phase_active=phase_active)
     if new_head is None:
         state.status = GameStatus.GAME_OVER
-        _emit(emit, GameEventType.PLAYER_DIED, reason="wall", score=state.score)
+        _emit_died(emit, "wall", state.score)
         return
 
-    if new_head in state.obstacles and not phase_active:
+    world = state.world
+    if (new_head in state.obstacle_cells or (world is not None and new_head in world)) and not phase_active:
         state.status = GameStatus.GAME_OVER
-        _emit(emit, GameEventType.PLAYER_DIED, reason="obstacle", score=state.score)
+        _emit_died(emit, "obstacle", state.score)
         return
 
+    body = state.body
+    free_cells = state.free_cells
+    if free_cells is None and world is None:
+        free_cells = free_cell_index(state, config)
     will_grow = new_head == state.food
-    body_to_check = state.snake if will_grow else state.snake[:-1]
-    if new_head in body_to_check:
+    if new_head in body and (will_grow or new_head != body.tail):
         state.status = GameStatus.GAME_OVER
-        _emit(emit, GameEventType.PLAYER_DIED, reason="self_collision", score=state.score)
+        _emit_died(emit, "self_collision", state.score)
         return
 
-    state.snake.insert(0, new_head)
+    vacated: Point | None = None
+    released = False
+    if not will_grow:
+        vacated = body.pop_tail()
+        if free_cells is not None and vacated not in state.obstacle_cells:
+            released = free_cells.release(vacated)
+    body.push_head(new_head)
+    head_slot = free_cells.take(new_head) if free_cells is not None else -1
+    if undo is not None:
+        undo.new_head = new_head
+        undo.head_slot = head_slot
+        undo.vacated = vacated
+        undo.vacated_released = released
 
     if will_grow:
         applied_score_multiplier = max(1, score_multiplier)
@@ -199,38 +395,39 @@ def advance_one_step(
             state.max_steps_per_second,
             state.steps_per_second + state.speed_increment_per_food,
         )
-        _emit(
-            emit,
-            GameEventType.FOOD_EATEN,
-            score=state.score,
-            speed=state.steps_per_second,
-            score_multiplier=applied_score_multiplier,
-            head_x=new_head[0],
-            head_y=new_head[1],
-        )
+        if emit is not None:
+            eaten = _FOOD_EATEN
+            eaten.score = state.score
+            eaten.speed = state.steps_per_second
+            eaten.score_multiplier = applied_score_multiplier
+            eaten.head_x, eaten.head_y = new_head
+            emit(eaten)
+        if undo is not None:
+            undo.rng_state = rng.getstate()
         try:
-            state.food = spawn_food(
-                snake_cells=state.snake,
-                obstacle_cells=state.obstacles,
-                grid_width=config.grid_width,
-                grid_height=config.grid_height,
-                rng=rng,
-            )
+            if world is not None:
+                world.focus = new_head
+                state.food = spawn_world_food(world, body, rng)
+            else:
+                state.food = spawn_food(
+                    snake_cells=state.snake,
+                    obstacle_cells=state.obstacles,
+                    grid_width=config.grid_width,
+                    grid_height=config.grid_height,
+                    rng=rng,
+                    free_cells=free_cells,
+                )
         except RuntimeError:
             state.status = GameStatus.GAME_OVER
-            _emit(emit, GameEventType.PLAYER_DIED, reason="board_full", score=state.score)
-    else:
-        state.snake.pop()
+            _emit_died(emit, "board_full", state.score)
 
 
-def advance_simulation(
+def advance_fixed_steps(
     state: GameState,
     config: GameConfig,
     delta_seconds: float,
-    rng: random.Random,
-    score_multiplier: int = 1,
-    speed_multiplier: float = 1.0,
-    phase_active: bool = False,
+    tick_seconds: Callable[[], float],
+    step: Callable[[], object],
     emit: EventEmitter | None = None,
 ) -> int:
     if state.status != GameStatus.RUNNING:
@@ -240,36 +437,51 @@ def advance_simulation(
     steps_taken = 0
 
     while steps_taken < config.max_steps_per_frame:
-        effective_steps_per_second = max(0.1, state.steps_per_second * max(0.1, speed_multiplier))
-        step_interval = 1.0 / effective_steps_per_second
+        step_interval = tick_seconds()
         if state.accumulator_seconds < step_interval:
             break
         state.accumulator_seconds -= step_interval
-        advance_one_step(
-            state,
-            config,
-            rng,
-            score_multiplier=score_multiplier,
-            phase_active=phase_active,
-            emit=emit,
-        )
+        step()
         steps_taken += 1
-        head_x, head_y = state.snake[0]
-        _emit(
-            emit,
-            GameEventType.STEP_ADVANCED,
-            score=state.score,
-            speed=effective_steps_per_second,
-            status=state.status.value,
-            head_x=head_x,
-            head_y=head_y,
-        )
+        if emit is not None:
+            stepped = _STEP_ADVANCED
+            stepped.score = state.score
+            stepped.speed = 1.0 / step_interval
+            stepped.status = state.status.value
+            stepped.head_x, stepped.head_y = state.body.head
+            emit(stepped)
         if state.status != GameStatus.RUNNING:
             break
 
-    effective_steps_per_second = max(0.1, state.steps_per_second * max(0.1, speed_multiplier))
-    max_carryover = config.max_steps_per_frame * (1.0 / effective_steps_per_second)
+    max_carryover = config.max_steps_per_frame * tick_seconds()
     if state.accumulator_seconds > max_carryover:
         state.accumulator_seconds = max_carryover
 
     return steps_taken
+
+
+def advance_simulation(
+    state: GameState,
+    config: GameConfig,
+    delta_seconds: float,
+    rng: random.Random,
+    score_multiplier: int = 1,
+    speed_multiplier: float = 1.0,
+    phase_active: bool = False,
+    emit: EventEmitter | None = None,
+) -> int:
+    return advance_fixed_steps(
+        state,
+        config,
+        delta_seconds,
+        lambda: 1.0 / max(0.1, state.steps_per_second * max(0.1, speed_multiplier)),
+        lambda: advance_one_step(
+            state,
+            config,
+            rng,
+            score_multiplier=score_multiplier,
+            phase_active=phase_active,
+            emit=emit,
+        ),
+        emit,
+    )
@@ -0,0 +1 @@
+"""Networked leaderboard service and clients for shared cabinets."""
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import socket
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from snake_game.net.protocol import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MAX_LINE_BYTES,
+    Message,
+    ProtocolError,
+    decode_message,
+    encode_message,
+)
+
+DEFAULT_TIMEOUT_SECONDS = 2.0
+
+
+@dataclass(frozen=True, slots=True)
+class RankInfo:
+    rank: int
+    size: int
+    percentile: float
+
+
+class LeaderboardClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> LeaderboardClient:
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+        return cls(reader, writer)
+
+    async def request(self, message: Message) -> Message:
+        self._writer.write(encode_message(message))
+        await self._writer.drain()
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("leaderboard server closed the connection")
+        response = decode_message(line)
+        if not response.get("ok"):
+            raise ProtocolError(str(response.get("error", "request failed")))
+        return response
+
+    async def submit(self, key: str, score: int, submission_id: str | None = None) -> int | None:
+        message: Message = {"op": "submit", "key": key, "score": score}
+        if submission_id is not None:
+            message["id"] = submission_id
+        response = await self.request(message)
+        rank = response.get("rank")
+        return rank if isinstance(rank, int) else None
+
+    async def top(self, key: str, count: int = 10) -> list[int]:
+        response = await self.request({"op": "top", "key": key, "count": count})
+        return [int(score) for score in response.get("scores", [])]  # type: ignore[union-attr]
+
+    async def rank(self, key: str, score: int) -> RankInfo:
+        response = await self.request({"op": "rank", "key": key, "score": score})
+        return RankInfo(
+            rank=int(response["rank"]),  # type: ignore[arg-type]
+            size=int(response["size"]),  # type: ignore[arg-type]
+            percentile=float(response["percentile"]),  # type: ignore[arg-type]
+        )
+
+    async def close(self) -> None:
+        self._writer.close()
+        with contextlib.suppress(ConnectionError):
+            await self._writer.wait_closed()
+
+
+def submit_batch(
+    host: str,
+    port: int,
+    entries: Sequence[tuple[str, int, str]],
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+) -> list[Message]:
+    request = b"".join(
+        encode_message({"op": "submit", "key": key, "score": score, "id": submission_id})
+        for key, score, submission_id in entries
+    )
+    responses: list[Message] = []
+    with socket.create_connection((host, port), timeout=timeout) as connection:
+        connection.sendall(request)
+        with connection.makefile("rb") as reader:
+            for _ in entries:
+                line = reader.readline(MAX_LINE_BYTES)
+                if not line.endswith(b"\n"):
+                    raise ConnectionError("leaderboard server closed the connection")
+                responses.append(decode_message(line))
+    return responses
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from snake_game.net.client import submit_batch
+from snake_game.net.protocol import Message, ProtocolError
+
+OUTBOX_FILE_NAME = "outbox.jsonl"
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BACKOFF_SECONDS = 0.5
+DEFAULT_MAX_BACKOFF_SECONDS = 30.0
+
+type BatchSender = Callable[[Sequence[tuple[str, int, str]]], list[Message]]
+
+
+@dataclass(frozen=True, slots=True)
+class Submission:
+    id: int
+    key: str
+    score: int
+    uuid: str
+
+
+@dataclass(frozen=True, slots=True)
+class RemoteRank:
+    rank: int | None
+    size: int
+    error: str | None = None
+
+
+def read_outbox(path: Path) -> list[Submission]:
+    return _read_outbox(path)[0]
+
+
+def _read_outbox(path: Path) -> tuple[list[Submission], bool]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return [], False
+    submissions: list[Submission] = []
+    assigned = False
+    for line in lines:
+        try:
+            entry = json.loads(line)
+            submission_uuid = entry.get("uuid")
+            if not submission_uuid:
+                submission_uuid = uuid.uuid4().hex
+                assigned = True
+            submissions.append(
+                Submission(
+                    id=int(entry["id"]),
+                    key=str(entry["key"]),
+                    score=int(entry["score"]),
+                    uuid=str(submission_uuid),
+                )
+            )
+        except (ValueError, TypeError, KeyError, AttributeError):
+            continue
+    return submissions, assigned
+
+
+def _encode_submissions(submissions: Sequence[Submission]) -> bytes:
+    return "".join(
+        json.dumps({"id": item.id, "key": item.key, "score": item.score, "uuid": item.uuid}) + "\n"
+        for item in submissions
+    ).encode("utf-8")
+
+
+def _remote_rank(response: Message) -> RemoteRank:
+    if not response.get("ok"):
+        return RemoteRank(rank=None, size=0, error=str(response.get("error") or "rejected"))
+    rank = response.get("rank")
+    size = response.get("size", 0)
+    if not isinstance(size, int):
+        raise ProtocolError("leaderboard server sent a malformed size")
+    return RemoteRank(rank=rank if isinstance(rank, int) else None, size=size)
+
+
+class ScoreOutbox:
+    def __init__(
+        self,
+        path: Path,
+        send: BatchSender,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+    ) -> None:
+        self.path = path
+        self.send = send
+        self.batch_size = batch_size
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.sent = 0
+        self.rejected = 0
+        self.failures = 0
+        self.last_error: Exception | None = None
+        self._pending, assigned = _read_outbox(path)
+        self._next_id = max((item.id for item in self._pending), default=0) + 1
+        self._incoming: list[Submission] = []
+        self._results: dict[int, RemoteRank] = {}
+        self._retry_at = 0.0
+        self._condition = threading.Condition()
+        self._closed = False
+        if assigned:
+            self._rewrite(self._pending)
+        self._thread = threading.Thread(target=self._run, name="score-outbox", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def for_server(cls, data_dir: Path, host: str, port: int) -> ScoreOutbox:
+        return cls(data_dir / OUTBOX_FILE_NAME, lambda entries: submit_batch(host, port, entries))
+
+    def submit(self, key: str, score: int) -> int:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("score outbox is closed")
+            submission = Submission(id=self._next_id, key=key, score=max(score, 0), uuid=uuid.uuid4().hex)
+            self._next_id += 1
+            self._incoming.append(submission)
+            self._condition.notify_all()
+        return submission.id
+
+    def result(self, submission_id: int) -> RemoteRank | None:
+        with self._condition:
+            return self._results.get(submission_id)
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending) + len(self._incoming)
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _backoff(self) -> float:
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (self.failures - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                while not self._closed and not self._incoming:
+                    if self._pending:
+                        delay = self._retry_at - time.monotonic()
+                        if delay <= 0:
+                            break
+                        condition.wait(delay)
+                    else:
+                        condition.wait()
+                incoming = self._incoming
+                self._incoming = []
+                closed = self._closed
+            if incoming:
+                self._persist(incoming)
+            if closed:
+                return
+            if time.monotonic() >= self._retry_at:
+                self._send_batch()
+
+    def _persist(self, incoming: list[Submission]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as handle:
+                handle.write(_encode_submissions(incoming))
+                handle.flush()
+                os.fsync(handle.fileno())
+        except OSError as error:
+            self.last_error = error
+        with self._condition:
+            self._pending.extend(incoming)
+
+    def _send_batch(self) -> None:
+        with self._condition:
+            batch = self._pending[: self.batch_size]
+        if not batch:
+            return
+        try:
+            responses = self.send([(item.key, item.score, item.uuid) for item in batch])
+            if len(responses) != len(batch):
+                raise ProtocolError("leaderboard server answered a partial batch")
+            results = [_remote_rank(response) for response in responses]
+        except Exception as error:
+            self.failures += 1
+            self.last_error = error
+            self._retry_at = time.monotonic() + self._backoff()
+            return
+
+        self.failures = 0
+        self._retry_at = 0.0
+        with self._condition:
+            for item, result in zip(batch, results):
+                self._results[item.id] = result
+                if result.error is None:
+                    self.sent += 1
+                else:
+                    self.rejected += 1
+            del self._pending[: len(batch)]
+            remaining = list(self._pending)
+        self._rewrite(remaining)
+
+    def _rewrite(self, remaining: list[Submission]) -> None:
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            with temp_path.open("wb") as handle:
+                handle.write(_encode_submissions(remaining))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temp_path, self.path)
+        except OSError as error:
+            self.last_error = error
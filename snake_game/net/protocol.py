@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import re
+
+from snake_game.config import UserSettings
+from snake_game.persistence import leaderboard_key
+from snake_game.types import Difficulty, MapMode
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE_BYTES = 4096
+MAX_SCORE = 2**31 - 1
+MAX_TOP_COUNT = 100
+
+_SUBMISSION_ID = re.compile(r"[0-9A-Za-z_-]{1,64}")
+
+LEADERBOARD_KEYS = frozenset(
+    leaderboard_key(UserSettings(difficulty=difficulty, map_mode=map_mode, obstacles_enabled=obstacles))
+    for difficulty in Difficulty
+    for map_mode in MapMode
+    for obstacles in (False, True)
+)
+
+type Message = dict[str, object]
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+def encode_message(message: Message) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> Message:
+    try:
+        message = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise ProtocolError(f"malformed message: {error}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("message must be an object")
+    return message
+
+
+def require_key(message: Message) -> str:
+    key = message.get("key")
+    if not isinstance(key, str) or key not in LEADERBOARD_KEYS:
+        raise ProtocolError("key must be a 'difficulty|map|obstacles' leaderboard key")
+    return key
+
+
+def require_int(message: Message, field: str, low: int, high: int) -> int:
+    value = message.get(field)
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        raise ProtocolError(f"{field} must be an integer in [{low}, {high}]")
+    return value
+
+
+def optional_submission_id(message: Message) -> str:
+    value = message.get("id")
+    if value is None:
+        return ""
+    if not isinstance(value, str) or not _SUBMISSION_ID.fullmatch(value):
+        raise ProtocolError("id must be 1-64 characters from [0-9A-Za-z_-]")
+    return value
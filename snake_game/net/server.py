@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+from snake_game.leaderboard import Leaderboard
+from snake_game.net.protocol import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    LEADERBOARD_KEYS,
+    MAX_LINE_BYTES,
+    MAX_SCORE,
+    MAX_TOP_COUNT,
+    Message,
+    ProtocolError,
+    decode_message,
+    encode_message,
+    optional_submission_id,
+    require_int,
+    require_key,
+)
+
+SCORE_LOG_FILE_NAME = "scores.log"
+DEFAULT_FLUSH_SECONDS = 0.5
+DEFAULT_FLUSH_BATCH = 1024
+DEFAULT_DEDUPE_WINDOW = 1_000_000
+
+type ScoreEntry = tuple[str, int, str]
+
+
+def append_scores(path: Path, entries: list[ScoreEntry]) -> None:
+    data = "".join(f"{key}\t{score}\t{submission_id}\n" for key, score, submission_id in entries).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("ab") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def read_scores(path: Path) -> list[ScoreEntry]:
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return []
+    complete = data.rfind(b"\n") + 1
+    if complete != len(data):
+        with path.open("r+b") as handle:
+            handle.truncate(complete)
+    entries: list[ScoreEntry] = []
+    for line in data[:complete].decode("utf-8", errors="replace").splitlines():
+        key, _, rest = line.partition("\t")
+        score, _, submission_id = rest.partition("\t")
+        if key in LEADERBOARD_KEYS and score.isdigit():
+            entries.append((key, int(score), submission_id))
+    return entries
+
+
+class LeaderboardServer:
+    def __init__(
+        self,
+        data_dir: Path,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+        flush_batch: int = DEFAULT_FLUSH_BATCH,
+        limit: int | None = None,
+        dedupe_window: int = DEFAULT_DEDUPE_WINDOW,
+    ) -> None:
+        self.log_path = data_dir / SCORE_LOG_FILE_NAME
+        self.flush_seconds = flush_seconds
+        self.flush_batch = flush_batch
+        self.limit = limit
+        self.dedupe_window = dedupe_window
+        self.boards: dict[str, Leaderboard] = {}
+        self.submission_ids: dict[str, None] = {}
+        self.duplicates = 0
+        self.pending: list[ScoreEntry] = []
+        self.requests = 0
+        self.flushes = 0
+        self.flushed = 0
+        self.connections = 0
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._server: asyncio.Server | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def load(self) -> None:
+        scores: dict[str, list[int]] = {}
+        self.submission_ids = {}
+        for key, score, submission_id in read_scores(self.log_path):
+            scores.setdefault(key, []).append(score)
+            if submission_id:
+                self._remember(submission_id)
+        self.boards = {key: Leaderboard(values, self.limit) for key, values in scores.items()}
+
+    def board(self, key: str) -> Leaderboard:
+        board = self.boards.get(key)
+        if board is None:
+            board = self.boards[key] = Leaderboard(limit=self.limit)
+        return board
+
+    def _remember(self, submission_id: str) -> None:
+        self.submission_ids[submission_id] = None
+        if len(self.submission_ids) > self.dedupe_window:
+            del self.submission_ids[next(iter(self.submission_ids))]
+
+    def handle_message(self, message: Message) -> Message:
+        self.requests += 1
+        op = message.get("op")
+        key = require_key(message)
+        if op == "submit":
+            score = require_int(message, "score", 0, MAX_SCORE)
+            submission_id = optional_submission_id(message)
+            board = self.board(key)
+            if submission_id in self.submission_ids:
+                self.duplicates += 1
+                rank: int | None = board.rank_of(score)
+                if board.limit is not None and rank > board.limit:
+                    rank = None
+                return {"ok": True, "rank": rank, "size": len(board), "duplicate": True}
+            rank = board.insert(score)
+            if submission_id:
+                self._remember(submission_id)
+            self.pending.append((key, score, submission_id))
+            if len(self.pending) >= self.flush_batch:
+                self._flush_requested.set()
+            return {"ok": True, "rank": rank, "size": len(board)}
+        if op == "top":
+            count = require_int(message, "count", 1, MAX_TOP_COUNT)
+            board = self.boards.get(key)
+            return {"ok": True, "scores": board.top(count) if board is not None else []}
+        if op == "rank":
+            score = require_int(message, "score", 0, MAX_SCORE)
+            board = self.boards.get(key) or Leaderboard()
+            return {"ok": True, "rank": board.rank_of(score), "size": len(board), "percentile": board.percentile(score)}
+        raise ProtocolError(f"unknown op {op!r}")
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> int:
+        self.load()
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE_BYTES)
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self.pending:
+                return
+            batch = self.pending
+            self.pending = []
+            try:
+                await asyncio.to_thread(append_scores, self.log_path, batch)
+            except BaseException:
+                self.pending[:0] = batch
+                raise
+            self.flushes += 1
+            self.flushed += len(batch)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_seconds)
+            self._flush_requested.clear()
+            try:
+                await self.flush()
+            except OSError:
+                pass
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while line := await reader.readline():
+                try:
+                    response = self.handle_message(decode_message(line))
+                except ProtocolError as error:
+                    response = {"ok": False, "error": str(error)}
+                writer.write(encode_message(response))
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+async def _serve(host: str, port: int, server: LeaderboardServer) -> None:
+    bound_port = await server.start(host, port)
+    print(f"listening on {host}:{bound_port}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve shared leaderboards over line-delimited JSON on TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--data-dir", type=Path, default=Path("data/server"))
+    parser.add_argument("--flush-seconds", type=float, default=DEFAULT_FLUSH_SECONDS)
+    parser.add_argument("--limit", type=int, default=None, help="keep only the top N scores per leaderboard")
+    args = parser.parse_args(argv)
+
+    server = LeaderboardServer(args.data_dir, flush_seconds=args.flush_seconds, limit=args.limit)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(args.host, args.port, server))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,36 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+import os
+import sqlite3
+import struct
+import time
+from collections.abc import Callable, MutableMapping, Sequence
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
 
 from snake_game.config import GraphicsSettings, UserSettings
+from snake_game import sqlite_store
+from snake_game.journal import (
+    RunRecord,
+    append_records,
+    discard_through,
+    journal_path,
+    read_records,
+    rewrite_records,
+)
+from snake_game.leaderboard import Leaderboard
+from snake_game.run_stats import RunStats
+from snake_game.save_codec import LazyMap, decode_save, encode_save, is_binary_save_path
+from snake_game.sqlite_store import RunRow, RunStanding, is_sqlite_path
 from snake_game.types import Difficulty, MapMode, ThemeId
 
-SAVE_SCHEMA_VERSION = 4
+SAVE_SCHEMA_VERSION = 6
+
+type Migration = Callable[[dict[str, object]], None]
+
+_MIGRATIONS: dict[int, Migration] = {}
 
 
 @dataclass(slots=True)
@@ -22,25 +44,29 @@ class PlayerStats:
 class PersistentData:
     settings: UserSettings = field(default_factory=UserSettings)
     graphics: GraphicsSettings = field(default_factory=GraphicsSettings)
-    leaderboard: dict[str, list[int]] = field(default_factory=dict)
+    leaderboard: MutableMapping[str, Leaderboard] = field(default_factory=dict)
     stats: PlayerStats = field(default_factory=PlayerStats)
+    run_stats: MutableMapping[str, RunStats] = field(default_factory=dict)
     achievements: list[str] = field(default_factory=list)
     onboarding_seen: bool = False
+    journal_seq: int = 0
     schema_version: int = SAVE_SCHEMA_VERSION
+    owned_leaderboards: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    owned_run_stats: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
 
 
-def is_new_high_score(existing_scores: list[int], candidate_score: int) -> bool:
+def is_new_high_score(existing_scores: Sequence[int], candidate_score: int) -> bool:
     if candidate_score <= 0:
         return False
     if not existing_scores:
         return True
-    return candidate_score > max(existing_scores)
+    return candidate_score > existing_scores[0]
 
 
 def best_score_for_settings(data: PersistentData, settings: UserSettings) -> int:
     key = leaderboard_key(settings)
-    scores = data.leaderboard.get(key, [])
-    return scores[0] if scores else 0
+    board = data.leaderboard.get(key)
+    return board.best if board is not None else 0
 
 
 def leaderboard_key(settings: UserSettings) -> str:
@@ -48,11 +74,24 @@ def leaderboard_key(settings: UserSettings) -> str:
     return f"{settings.difficulty.value}|{settings.map_mode.value}|{obstacle_tag}"
 
 
-def update_run_stats(data: PersistentData, score: int) -> None:
+def update_run_stats(
+    data: PersistentData,
+    score: int,
+    key: str | None = None,
+    stage: int = 1,
+    food_eaten: int = 0,
+    run_seconds: float = 0.0,
+) -> None:
     safe_score = max(score, 0)
     data.stats.total_runs += 1
     data.stats.total_score += safe_score
     data.stats.best_score_global = max(data.stats.best_score_global, safe_score)
+    if key is not None:
+        run_stats = data.run_stats.get(key)
+        if run_stats is None or key not in data.owned_run_stats:
+            run_stats = data.run_stats[key] = RunStats() if run_stats is None else run_stats.copy()
+            data.owned_run_stats.add(key)
+        run_stats.add(safe_score, stage, food_eaten, run_seconds)
 
 
 def _settings_to_dict(settings: UserSettings) -> dict[str, object]:
@@ -177,22 +216,26 @@ def _stats_from_dict(data: object) -> PlayerStats:
     )
 
 
-def _normalize_leaderboard(data: object) -> dict[str, list[int]]:
+def _normalize_leaderboard(data: object, limit: int | None = None) -> dict[str, Leaderboard]:
     if not isinstance(data, dict):
         return {}
 
-    normalized: dict[str, list[int]] = {}
+    normalized: dict[str, Leaderboard] = {}
     for key, values in data.items():
         if not isinstance(key, str):
             continue
         if not isinstance(values, list):
             continue
-        clean_values = [int(value) for value in values if isinstance(value, (int, float))]
-        clean_values.sort(reverse=True)
-        normalized[key] = clean_values[:10]
+        normalized[key] = Leaderboard((int(value) for value in values if isinstance(value, (int, float))), limit)
     return normalized
 
 
+def _run_stats_from_dict(data: object) -> dict[str, RunStats]:
+    if not isinstance(data, dict):
+        return {}
+    return {key: RunStats.from_payload(payload) for key, payload in data.items() if isinstance(key, str)}
+
+
 def _normalize_achievements(data: object) -> list[str]:
     if not isinstance(data, list):
         return []
@@ -207,22 +250,56 @@ def _normalize_achievements(data: object) -> list[str]:
     return unique
 
 
-def _backup_corrupt_file(path: Path) -> None:
+def _backup_corrupt_file(path: Path, reason: str = "corrupt") -> None:
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    backup_path = path.with_suffix(f"{path.suffix}.corrupt-{timestamp}")
+    backup_path = path.with_suffix(f"{path.suffix}.{reason}-{timestamp}")
     try:
         path.replace(backup_path)
     except OSError:
         pass
 
 
-def _best_global_from_leaderboard(leaderboard: dict[str, list[int]]) -> int:
-    best = 0
-    for scores in leaderboard.values():
-        if not scores:
-            continue
-        best = max(best, scores[0])
-    return best
+def _best_global_from_leaderboard(leaderboard: dict[str, Leaderboard]) -> int:
+    return max((board.best for board in leaderboard.values()), default=0)
+
+
+def migration(from_version: int) -> Callable[[Migration], Migration]:
+    def register(migrate: Migration) -> Migration:
+        if from_version in _MIGRATIONS:
+            raise ValueError(f"migration from schema {from_version} is already registered")
+        _MIGRATIONS[from_version] = migrate
+        return migrate
+
+    return register
+
+
+@migration(2)
+def _add_stats_and_achievements(payload: dict[str, object]) -> None:
+    leaderboard = _normalize_leaderboard(payload.get("leaderboard"))
+    payload.setdefault(
+        "stats",
+        {
+            "total_runs": 0,
+            "total_score": 0,
+            "best_score_global": _best_global_from_leaderboard(leaderboard),
+        },
+    )
+    payload.setdefault("achievements", [])
+
+
+@migration(3)
+def _add_graphics(payload: dict[str, object]) -> None:
+    payload.setdefault("graphics", _graphics_to_dict(GraphicsSettings()))
+
+
+@migration(4)
+def _add_journal_seq(payload: dict[str, object]) -> None:
+    payload.setdefault("journal_seq", 0)
+
+
+@migration(5)
+def _add_run_stats(payload: dict[str, object]) -> None:
+    payload.setdefault("run_stats", {})
 
 
 def _migrate_payload(payload: dict[str, object]) -> dict[str, object]:
@@ -231,26 +308,108 @@ def _migrate_payload(payload: dict[str, object]) -> dict[str, object]:
     if not isinstance(version, int):
         version = 2
 
-    if version < 3:
-        leaderboard = _normalize_leaderboard(payload.get("leaderboard"))
-        migrated.setdefault(
-            "stats",
-            {
-                "total_runs": 0,
-                "total_score": 0,
-                "best_score_global": _best_global_from_leaderboard(leaderboard),
-            },
-        )
-        migrated.setdefault("achievements", [])
-    if version < 4:
-        migrated.setdefault("graphics", _graphics_to_dict(GraphicsSettings()))
+    for step in range(version, SAVE_SCHEMA_VERSION):
+        migrate = _MIGRATIONS.get(step)
+        if migrate is not None:
+            migrate(migrated)
     migrated.setdefault("onboarding_seen", False)
 
     migrated["schema_version"] = SAVE_SCHEMA_VERSION
     return migrated
 
 
-def load_persistent_data(path: Path) -> PersistentData:
+def load_persistent_data(path: Path, leaderboard_limit: int | None = None) -> PersistentData:
+    if is_sqlite_path(path):
+        return _load_sqlite(path, leaderboard_limit)
+    if is_binary_save_path(path):
+        data = _load_binary(path, leaderboard_limit)
+    else:
+        data = _load_snapshot(path, leaderboard_limit)
+    _replay_journal(data, journal_path(path))
+    return data
+
+
+def _load_binary(path: Path, leaderboard_limit: int | None) -> PersistentData:
+    if not path.exists():
+        legacy_path = path.with_suffix(".json")
+        return _load_snapshot(legacy_path, leaderboard_limit)
+
+    try:
+        image = decode_save(path.read_bytes(), leaderboard_limit)
+    except (OSError, ValueError, IndexError, UnicodeDecodeError, struct.error):
+        _backup_corrupt_file(path)
+        return PersistentData()
+    if image.schema_version > SAVE_SCHEMA_VERSION:
+        _backup_corrupt_file(path, "unsupported")
+        return _load_snapshot(path.with_suffix(".json"), leaderboard_limit)
+
+    data = PersistentData(
+        settings=image.settings,
+        graphics=image.graphics,
+        leaderboard=image.leaderboard,
+        stats=PlayerStats(
+            total_runs=image.total_runs,
+            total_score=image.total_score,
+            best_score_global=image.best_score_global,
+        ),
+        run_stats=image.run_stats,
+        achievements=image.achievements,
+        onboarding_seen=image.onboarding_seen,
+        journal_seq=image.journal_seq,
+        schema_version=SAVE_SCHEMA_VERSION,
+    )
+    if image.schema_version == SAVE_SCHEMA_VERSION:
+        return data
+    payload = persistent_payload(data)
+    payload["schema_version"] = image.schema_version
+    return _data_from_payload(payload, leaderboard_limit)
+
+
+def _load_sqlite(path: Path, leaderboard_limit: int | None) -> PersistentData:
+    try:
+        contents = sqlite_store.read_contents(path, leaderboard_limit)
+    except sqlite3.DatabaseError:
+        _backup_corrupt_file(path)
+        return PersistentData()
+    if contents.payload is None:
+        legacy_path = path.with_suffix(".json")
+        if not legacy_path.exists():
+            return PersistentData()
+        data = load_persistent_data(legacy_path, leaderboard_limit)
+        sqlite_store.import_payload(persistent_payload(data), path)
+        return data
+
+    payload = dict(contents.payload)
+    payload["leaderboard"] = contents.leaderboard
+    data = _data_from_payload(payload, leaderboard_limit)
+    for run in contents.unsnapshotted:
+        update_run_stats(data, run.score, run.leaderboard_key, run.stage, run.food_eaten, run.run_seconds)
+        data.journal_seq = run.seq
+    return data
+
+
+def history_standing(path: Path, key: str, score: int, top: int = 5) -> RunStanding | None:
+    if not is_sqlite_path(path):
+        return None
+    try:
+        return sqlite_store.run_standing(path, key, score, top)
+    except sqlite3.Error:
+        return None
+
+
+def _replay_journal(data: PersistentData, path: Path) -> None:
+    records, clean = read_records(path)
+    if not clean:
+        try:
+            rewrite_records(path, records)
+        except OSError:
+            pass
+    for record in records:
+        if record.seq > data.journal_seq:
+            apply_run_record(data, record)
+
+
+def _load_snapshot(path: Path, leaderboard_limit: int | None) -> PersistentData:
     if not path.exists():
         return PersistentData()
 
@@ -265,8 +424,12 @@ def load_persistent_data(path: Path) -> PersistentData:
         _backup_corrupt_file(path)
         return PersistentData()
 
+    return _data_from_payload(payload, leaderboard_limit)
+
+
+def _data_from_payload(payload: dict[str, object], leaderboard_limit: int | None) -> PersistentData:
     migrated = _migrate_payload(payload)
-    leaderboard = _normalize_leaderboard(migrated.get("leaderboard"))
+    leaderboard = _normalize_leaderboard(migrated.get("leaderboard"), leaderboard_limit)
     settings = _settings_from_dict(migrated.get("settings"))
     graphics = _graphics_from_dict(migrated.get("graphics"))
     stats = _stats_from_dict(migrated.get("stats"))
@@ -277,31 +440,140 @@ def load_persistent_data(path: Path) -> PersistentData:
         graphics=graphics,
         leaderboard=leaderboard,
         stats=stats,
+        run_stats=_run_stats_from_dict(migrated.get("run_stats")),
         achievements=achievements,
         onboarding_seen=onboarding_seen,
+        journal_seq=_coerce_non_negative_int(migrated.get("journal_seq")),
         schema_version=SAVE_SCHEMA_VERSION,
     )
 
 
-def save_persistent_data(data: PersistentData, path: Path) -> None:
-    payload = {
+def persistent_payload(data: PersistentData) -> dict[str, object]:
+    return {
         "schema_version": SAVE_SCHEMA_VERSION,
         "settings": _settings_to_dict(data.settings),
         "graphics": _graphics_to_dict(data.graphics),
-        "leaderboard": data.leaderboard,
+        "leaderboard": {key: list(scores) for key, scores in data.leaderboard.items()},
         "stats": _stats_to_dict(data.stats),
-        "achievements": data.achievements,
+        "run_stats": {key: run_stats.to_payload() for key, run_stats in data.run_stats.items()},
+        "achievements": list(data.achievements),
         "onboarding_seen": data.onboarding_seen,
+        "journal_seq": data.journal_seq,
     }
+
+
+def snapshot_persistent_data(data: PersistentData) -> PersistentData:
+    data.owned_leaderboards = set()
+    data.owned_run_stats = set()
+    return replace(
+        data,
+        settings=replace(data.settings),
+        graphics=replace(data.graphics),
+        leaderboard=_copy_mapping(data.leaderboard),
+        stats=replace(data.stats),
+        run_stats=_copy_mapping(data.run_stats),
+        achievements=list(data.achievements),
+    )
+
+
+def _copy_mapping[V](mapping: MutableMapping[str, V]) -> MutableMapping[str, V]:
+    if isinstance(mapping, (dict, LazyMap)):
+        return mapping.copy()
+    return dict(mapping)
+
+
+def write_save_payload(payload: dict[str, object], path: Path) -> None:
+    if is_sqlite_path(path):
+        sqlite_store.write_payload(payload, path)
+        return
+    if is_binary_save_path(path):
+        content = encode_save(payload)
+    else:
+        content = json.dumps(payload, indent=2).encode("utf-8")
+    write_file_atomic(path, content)
+
+
+def write_file_atomic(path: Path, content: bytes) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with temp_path.open("wb") as handle:
+        handle.write(content)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+def save_persistent_data(data: PersistentData, path: Path) -> None:
+    write_save_payload(persistent_payload(data), path)
+    compact_run_records(path, data.journal_seq)
+
 
+def append_run_records(path: Path, records: list[RunRecord]) -> None:
+    if is_sqlite_path(path):
+        sqlite_store.append_runs(path, [_run_row(record) for record in records])
+    else:
+        append_records(journal_path(path), records)
 
-def record_score(data: PersistentData, settings: UserSettings, score: int, limit: int) -> list[int]:
+
+def compact_run_records(path: Path, seq: int) -> None:
+    if not is_sqlite_path(path):
+        discard_through(journal_path(path), seq)
+
+
+def _run_row(record: RunRecord) -> RunRow:
+    return RunRow(
+        seq=record.seq,
+        leaderboard_key=leaderboard_key(record.settings),
+        score=record.score,
+        stage=record.stage,
+        food_eaten=record.food_eaten,
+        run_seconds=record.run_seconds,
+        played_at=record.played_at,
+    )
+
+
+def record_score(data: PersistentData, settings: UserSettings, score: int, limit: int | None) -> Leaderboard:
     key = leaderboard_key(settings)
-    table = list(data.leaderboard.get(key, []))
-    table.append(max(score, 0))
-    table.sort(reverse=True)
-    trimmed = table[:limit]
-    data.leaderboard[key] = trimmed
-    return trimmed
+    board = data.leaderboard.get(key)
+    if board is None or key not in data.owned_leaderboards:
+        board = data.leaderboard[key] = Leaderboard(limit=limit) if board is None else board.copy()
+        data.owned_leaderboards.add(key)
+    if board.limit != limit:
+        board.set_limit(limit)
+    board.insert(max(score, 0))
+    return board
+
+
+def apply_run_record(data: PersistentData, record: RunRecord) -> Leaderboard:
+    leaderboard = record_score(data, record.settings, record.score, record.limit)
+    update_run_stats(
+        data,
+        record.score,
+        leaderboard_key(record.settings),
+        record.stage,
+        record.food_eaten,
+        record.run_seconds,
+    )
+    data.journal_seq = record.seq
+    return leaderboard
+
+
+def next_run_record(
+    data: PersistentData,
+    settings: UserSettings,
+    score: int,
+    limit: int | None,
+    stage: int = 1,
+    food_eaten: int = 0,
+    run_seconds: float = 0.0,
+) -> RunRecord:
+    return RunRecord(
+        seq=data.journal_seq + 1,
+        settings=replace(settings),
+        score=max(score, 0),
+        limit=limit,
+        stage=stage,
+        food_eaten=food_eaten,
+        run_seconds=run_seconds,
+        played_at=time.time(),
+    )
@@ -2,13 +2,13 @@ import pygame
 
 from snake_game.config import GameConfig
 from snake_game.rendering.assets import RenderAssets
-from snake_game.rendering.layers import PlayfieldRenderer
+from snake_game.rendering.layers import PlayfieldRenderer, StepMotion
 from snake_game.state import GameState
 from snake_game.types import Point
 from snake_game.ui.theme import resolve_theme
 
 _SHARED_ASSETS = RenderAssets()
-_PLAYFIELD_RENDERERS: dict[tuple[int, int, int, str, bool], PlayfieldRenderer] = {}
+_PLAYFIELD_RENDERERS: dict[tuple[int, int, int, int, int, str, bool], PlayfieldRenderer] = {}
 
 
 def draw_centered_text(
@@ -45,6 +45,8 @@ def _playfield_renderer(config: GameConfig) -> PlayfieldRenderer:
         config.window_width,
         config.window_height,
         config.cell_size,
+        config.grid_width,
+        config.grid_height,
         f"{theme.theme_id.value}:{config.graphics.colorblind_mode}",
         config.graphics.show_grid,
     )
@@ -71,6 +73,7 @@ def draw_playfield(
     flash_alpha: int = 0,
     camera_offset: tuple[int, int] = (0, 0),
     particles: list[tuple[float, float, int, tuple[int, int, int]]] | None = None,
+    motion: StepMotion | None = None,
 ) -> None:
     renderer = _playfield_renderer(config)
     renderer.render(
@@ -88,4 +91,5 @@ def draw_playfield(
         flash_alpha=flash_alpha,
         camera_offset=camera_offset,
         particles=particles,
+        motion=motion,
     )
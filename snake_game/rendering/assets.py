@@ -19,11 +19,13 @@ class RenderAssets:
         if cached is not None:
             return cached
 
-        surface = pygame.Surface((config.window_width, config.window_height), pygame.SRCALPHA)
-        for x in range(0, config.window_width, config.cell_size):
-            pygame.draw.line(surface, grid_color, (x, 0), (x, config.window_height), 1)
-        for y in range(0, config.window_height, config.cell_size):
-            pygame.draw.line(surface, grid_color, (0, y), (config.window_width, y), 1)
+        width = config.window_width + config.cell_size
+        height = config.window_height + config.cell_size
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for x in range(0, width, config.cell_size):
+            pygame.draw.line(surface, grid_color, (x, 0), (x, height), 1)
+        for y in range(0, height, config.cell_size):
+            pygame.draw.line(surface, grid_color, (0, y), (width, y), 1)
         self._grid_cache[key] = surface
         return surface
 
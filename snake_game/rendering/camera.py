@@ -0,0 +1,41 @@
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+
+from snake_game.types import Point
+
+
+@dataclass(frozen=True, slots=True)
+class Viewport:
+    left: int
+    top: int
+    width: int
+    height: int
+
+    @property
+    def cell_count(self) -> int:
+        return self.width * self.height
+
+    def contains(self, cell: Point) -> bool:
+        return self.left <= cell[0] < self.left + self.width and self.top <= cell[1] < self.top + self.height
+
+
+def follow_viewport(focus: Point, grid_width: int, grid_height: int, view_width: int, view_height: int) -> Viewport:
+    left = min(max(0, focus[0] - view_width // 2), max(0, grid_width - view_width))
+    top = min(max(0, focus[1] - view_height // 2), max(0, grid_height - view_height))
+    return Viewport(left, top, min(view_width, grid_width), min(view_height, grid_height))
+
+
+def visible_cells(cells: Collection[Point], viewport: Viewport) -> Iterator[Point]:
+    left = viewport.left
+    top = viewport.top
+    right = left + viewport.width
+    bottom = top + viewport.height
+    if len(cells) <= viewport.cell_count:
+        for cell in cells:
+            if left <= cell[0] < right and top <= cell[1] < bottom:
+                yield cell
+        return
+    for y in range(top, bottom):
+        for x in range(left, right):
+            if (x, y) in cells:
+                yield (x, y)
@@ -1,16 +1,28 @@
+from dataclasses import dataclass
 from enum import Enum
 
 import pygame
 
 from snake_game.config import GameConfig
 from snake_game.rendering.assets import RenderAssets
+from snake_game.rendering.camera import Viewport, follow_viewport, visible_cells
 from snake_game.state import GameState
 from snake_game.types import GameStatus, Point
-from snake_game.ui.components import draw_panel
+from snake_game.ui.components import build_panel_surface
 from snake_game.ui.theme import UiTheme
 
 type Color = tuple[int, int, int]
 
+TEXT_CACHE_LIMIT = 64
+BANNER_HEIGHT = 56
+
+
+@dataclass(frozen=True, slots=True)
+class StepMotion:
+    previous_head: Point
+    previous_tail: Point
+    alpha: float
+
 
 class RenderLayer(Enum):
     BACKGROUND = 0
@@ -21,16 +33,8 @@ class RenderLayer(Enum):
     OVERLAY = 5
 
 
-def _draw_centered_text(
-    screen: pygame.Surface,
-    text: str,
-    font: pygame.font.Font,
-    color: Color,
-    center: tuple[int, int],
-) -> None:
-    surface = font.render(text, True, color)
-    rect = surface.get_rect(center=center)
-    screen.blit(surface, rect)
+def _adjacent(first: Point, second: Point) -> bool:
+    return abs(first[0] - second[0]) + abs(first[1] - second[1]) == 1
 
 
 class PlayfieldRenderer:
@@ -38,11 +42,70 @@ class PlayfieldRenderer:
         self.config = config
         self.theme = theme
         self.assets = assets
+        self._world_buffer: pygame.Surface | None = None
+        self._flash_buffer: pygame.Surface | None = None
+        self._banner_buffer: pygame.Surface | None = None
+        self._hud_panel: pygame.Surface | None = None
+        self._text_cache: dict[tuple[pygame.font.Font, str, Color], pygame.Surface] = {}
+
+    def _window_size(self) -> tuple[int, int]:
+        return (self.config.window_width, self.config.window_height)
+
+    def _world_surface(self, screen: pygame.Surface) -> pygame.Surface:
+        buffer = self._world_buffer
+        if buffer is None or buffer.get_size() != self._window_size():
+            buffer = self._world_buffer = pygame.Surface(self._window_size(), 0, screen)
+        return buffer
+
+    def _flash_surface(self) -> pygame.Surface:
+        buffer = self._flash_buffer
+        if buffer is None or buffer.get_size() != self._window_size():
+            buffer = self._flash_buffer = pygame.Surface(self._window_size())
+            buffer.fill((255, 255, 255))
+        return buffer
+
+    def _banner_surface(self) -> pygame.Surface:
+        buffer = self._banner_buffer
+        if buffer is None or buffer.get_width() != self.config.window_width:
+            buffer = self._banner_buffer = pygame.Surface((self.config.window_width, BANNER_HEIGHT))
+        return buffer
+
+    def _hud_panel_surface(self) -> pygame.Surface:
+        panel = self._hud_panel
+        if panel is None or panel.get_width() != self.config.window_width - 16:
+            panel = self._hud_panel = build_panel_surface(
+                (self.config.window_width - 16, 54),
+                fill=(20, 20, 20),
+                border=self.theme.palette.grid,
+                alpha=150,
+                radius=12,
+            )
+        return panel
+
+    def _text(self, font: pygame.font.Font, text: str, color: Color) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
+
+    def _draw_centered_text(
+        self,
+        target: pygame.Surface,
+        text: str,
+        font: pygame.font.Font,
+        color: Color,
+        center: tuple[int, int],
+    ) -> None:
+        surface = self._text(font, text, color)
+        target.blit(surface, surface.get_rect(center=center))
 
-    def _cell_rect(self, cell_x: int, cell_y: int) -> pygame.Rect:
+    def _cell_rect(self, cell_x: float, cell_y: float, origin: tuple[float, float] = (0.0, 0.0)) -> pygame.Rect:
         return pygame.Rect(
-            cell_x * self.config.cell_size,
-            cell_y * self.config.cell_size,
+            round(cell_x * self.config.cell_size + origin[0]),
+            round(cell_y * self.config.cell_size + origin[1]),
             self.config.cell_size,
             self.config.cell_size,
         )
@@ -56,37 +119,109 @@ class PlayfieldRenderer:
         )
         target.blit(gradient, (0, 0))
 
-    def _draw_grid(self, target: pygame.Surface) -> None:
+    def _draw_grid(self, target: pygame.Surface, origin: tuple[float, float]) -> None:
         if not self.config.graphics.show_grid:
             return
         grid = self.assets.grid_surface(self.config, self.theme.palette.grid)
-        target.blit(grid, (0, 0))
+        cell_size = self.config.cell_size
+        scroll = pygame.Rect(
+            round(-origin[0]) % cell_size,
+            round(-origin[1]) % cell_size,
+            self.config.window_width,
+            self.config.window_height,
+        )
+        target.blit(grid, (0, 0), scroll)
 
-    def _draw_entities(self, target: pygame.Surface, state: GameState, powerup_position: Point | None) -> None:
-        for obstacle_x, obstacle_y in state.obstacles:
-            obstacle_rect = self._cell_rect(obstacle_x, obstacle_y)
-            pygame.draw.rect(target, self.theme.palette.obstacle, obstacle_rect, border_radius=6)
+    def viewport(self, state: GameState, focus: Point | None = None) -> Viewport:
+        focus_x, focus_y = focus = focus if focus is not None else state.body.head
+        if state.world is not None:
+            view_width = self.config.view_width
+            view_height = self.config.view_height
+            return Viewport(focus_x - view_width // 2, focus_y - view_height // 2, view_width, view_height)
+        return follow_viewport(
+            focus,
+            self.config.grid_width,
+            self.config.grid_height,
+            self.config.view_width,
+            self.config.view_height,
+        )
 
-        food_rect = self._cell_rect(state.food[0], state.food[1])
-        pygame.draw.circle(target, self.theme.palette.food, food_rect.center, self.config.cell_size // 2 - 2)
+    def _origin(self, viewport: Viewport, state: GameState, motion: StepMotion | None) -> tuple[float, float]:
+        cell_size = self.config.cell_size
+        origin_x = -viewport.left * cell_size
+        origin_y = -viewport.top * cell_size
+        if motion is not None and motion.alpha < 1.0 and _adjacent(motion.previous_head, state.body.head):
+            previous = self.viewport(state, motion.previous_head)
+            shift_x = previous.left - viewport.left
+            shift_y = previous.top - viewport.top
+            if abs(shift_x) + abs(shift_y) == 1:
+                origin_x -= shift_x * (1.0 - motion.alpha) * cell_size
+                origin_y -= shift_y * (1.0 - motion.alpha) * cell_size
+        return (origin_x, origin_y)
 
-        if powerup_position is not None:
-            power_rect = self._cell_rect(powerup_position[0], powerup_position[1])
-            pygame.draw.circle(target, self.theme.palette.powerup, power_rect.center, self.config.cell_size // 2 - 2)
+    def _draw_entities(
+        self,
+        target: pygame.Surface,
+        state: GameState,
+        powerup_position: Point | None,
+        viewport: Viewport,
+        origin: tuple[float, float],
+        motion: StepMotion | None,
+    ) -> None:
+        palette = self.theme.palette
+        culled = Viewport(viewport.left - 1, viewport.top - 1, viewport.width + 2, viewport.height + 2)
+        if state.world is not None:
+            obstacles = state.world.obstacles_in(culled.left, culled.top, culled.width, culled.height)
+        else:
+            obstacles = visible_cells(state.obstacle_cells, culled)
+        for obstacle_x, obstacle_y in obstacles:
+            obstacle_rect = self._cell_rect(obstacle_x, obstacle_y, origin)
+            pygame.draw.rect(target, palette.obstacle, obstacle_rect, border_radius=6)
+
+        if culled.contains(state.food):
+            food_rect = self._cell_rect(state.food[0], state.food[1], origin)
+            pygame.draw.circle(target, palette.food, food_rect.center, self.config.cell_size // 2 - 2)
 
-        for index, (cell_x, cell_y) in enumerate(state.snake):
-            cell_rect = self._cell_rect(cell_x, cell_y)
-            color = self.theme.palette.snake_head if index == 0 else self.theme.palette.snake_body
-            radius = 8 if index == 0 else 5
-            pygame.draw.rect(target, color, cell_rect.inflate(-2, -2), border_radius=radius)
+        if powerup_position is not None and culled.contains(powerup_position):
+            power_rect = self._cell_rect(powerup_position[0], powerup_position[1], origin)
+            pygame.draw.circle(target, palette.powerup, power_rect.center, self.config.cell_size // 2 - 2)
+
+        body = state.body
+        head = body.head
+        head_x, head_y = head
+        if motion is not None and motion.alpha < 1.0:
+            tail_x, tail_y = body.tail
+            previous_x, previous_y = motion.previous_tail
+            if motion.previous_tail != body.tail and _adjacent(motion.previous_tail, body.tail):
+                tail_rect = self._cell_rect(
+                    previous_x + (tail_x - previous_x) * motion.alpha,
+                    previous_y + (tail_y - previous_y) * motion.alpha,
+                    origin,
+                )
+                pygame.draw.rect(target, palette.snake_body, tail_rect.inflate(-2, -2), border_radius=5)
+            previous_x, previous_y = motion.previous_head
+            if _adjacent(motion.previous_head, head):
+                head_x = previous_x + (head_x - previous_x) * motion.alpha
+                head_y = previous_y + (head_y - previous_y) * motion.alpha
+
+        for cell_x, cell_y in visible_cells(body, culled):
+            if (cell_x, cell_y) == head:
+                continue
+            cell_rect = self._cell_rect(cell_x, cell_y, origin)
+            pygame.draw.rect(target, palette.snake_body, cell_rect.inflate(-2, -2), border_radius=5)
+        if culled.contains(head):
+            head_rect = self._cell_rect(head_x, head_y, origin)
+            pygame.draw.rect(target, palette.snake_head, head_rect.inflate(-2, -2), border_radius=8)
 
     def _draw_particles(
         self,
         target: pygame.Surface,
         particles: list[tuple[float, float, int, Color]],
+        origin: tuple[float, float],
     ) -> None:
+        origin_x, origin_y = origin
         for x, y, radius, color in particles:
-            pygame.draw.circle(target, color, (int(x), int(y)), max(1, int(radius)))
+            pygame.draw.circle(target, color, (round(x + origin_x), round(y + origin_y)), max(1, int(radius)))
 
     def _draw_hud(
         self,
@@ -97,15 +232,7 @@ class PlayfieldRenderer:
         stage: int,
         active_effect_labels: list[str],
     ) -> None:
-        top_panel = pygame.Rect(8, 6, self.config.window_width - 16, 54)
-        draw_panel(
-            screen=target,
-            rect=top_panel,
-            fill=(20, 20, 20),
-            border=self.theme.palette.grid,
-            alpha=150,
-            radius=12,
-        )
+        target.blit(self._hud_panel_surface(), (8, 6))
 
         hud_parts = [
             f"Score {state.score}",
@@ -113,15 +240,15 @@ class PlayfieldRenderer:
             f"Stage {stage}",
             state.difficulty.label,
             state.map_mode.label,
-            "Obs On" if state.obstacles else "Obs Off",
+            "Obs On" if state.obstacles or (state.world is not None and state.world.obstacles_per_chunk) else "Obs Off",
         ]
         hud_text = "  |  ".join(hud_parts)
-        score_surface = small_font.render(hud_text, True, self.theme.palette.text)
+        score_surface = self._text(small_font, hud_text, self.theme.palette.text)
         target.blit(score_surface, (18, 14))
 
         if active_effect_labels:
             effects_text = "Effects: " + "   ".join(active_effect_labels)
-            effects_surface = small_font.render(effects_text, True, self.theme.palette.accent)
+            effects_surface = self._text(small_font, effects_text, self.theme.palette.accent)
             target.blit(effects_surface, (18, 36))
 
     def _draw_overlays(
@@ -137,7 +264,7 @@ class PlayfieldRenderer:
     ) -> None:
         if countdown_remaining > 0 and state.status == GameStatus.RUNNING:
             count_value = max(1, int(countdown_remaining) + 1)
-            _draw_centered_text(
+            self._draw_centered_text(
                 target,
                 str(count_value),
                 hud_font,
@@ -146,7 +273,7 @@ class PlayfieldRenderer:
             )
 
         if state.status == GameStatus.PAUSED:
-            _draw_centered_text(
+            self._draw_centered_text(
                 target,
                 "Paused - Press P/Space to resume",
                 small_font,
@@ -155,10 +282,11 @@ class PlayfieldRenderer:
             )
 
         if stage_banner_text and stage_banner_alpha > 0:
-            banner = pygame.Surface((self.config.window_width, 56), pygame.SRCALPHA)
-            banner.fill((*self.theme.palette.accent, max(0, min(stage_banner_alpha, 255))))
-            target.blit(banner, (0, self.config.window_height // 2 - 28))
-            _draw_centered_text(
+            banner = self._banner_surface()
+            banner.fill(self.theme.palette.accent)
+            banner.set_alpha(max(0, min(stage_banner_alpha, 255)))
+            target.blit(banner, (0, self.config.window_height // 2 - BANNER_HEIGHT // 2))
+            self._draw_centered_text(
                 target,
                 stage_banner_text,
                 small_font,
@@ -167,8 +295,8 @@ class PlayfieldRenderer:
             )
 
         if flash_alpha > 0:
-            flash = pygame.Surface((self.config.window_width, self.config.window_height), pygame.SRCALPHA)
-            flash.fill((255, 255, 255, max(0, min(flash_alpha, 180))))
+            flash = self._flash_surface()
+            flash.set_alpha(max(0, min(flash_alpha, 180)))
             target.blit(flash, (0, 0))
 
     def render(
@@ -187,13 +315,17 @@ class PlayfieldRenderer:
         flash_alpha: int = 0,
         camera_offset: tuple[int, int] = (0, 0),
         particles: list[tuple[float, float, int, Color]] | None = None,
+        motion: StepMotion | None = None,
     ) -> None:
-        world = pygame.Surface((self.config.window_width, self.config.window_height), pygame.SRCALPHA)
+        direct = camera_offset == (0, 0)
+        world = screen if direct else self._world_surface(screen)
         self._draw_background(world)
-        self._draw_grid(world)
-        self._draw_entities(world, state, powerup_position)
+        viewport = self.viewport(state)
+        origin = self._origin(viewport, state, motion)
+        self._draw_grid(world, origin)
+        self._draw_entities(world, state, powerup_position, viewport, origin, motion)
         if particles:
-            self._draw_particles(world, particles)
+            self._draw_particles(world, particles, origin)
         self._draw_hud(world, state, small_font, best_score, stage, active_effect_labels)
         self._draw_overlays(
             world,
@@ -205,5 +337,6 @@ class PlayfieldRenderer:
             stage_banner_alpha,
             flash_alpha,
         )
-        screen.blit(world, camera_offset)
+        if not direct:
+            screen.blit(world, camera_offset)
 
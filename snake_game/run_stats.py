@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, replace
+
+DEFAULT_RELATIVE_ACCURACY = 0.02
+DEFAULT_MAX_BUCKETS = 256
+
+
+@dataclass(slots=True)
+class QuantileSketch:
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+    max_buckets: int = DEFAULT_MAX_BUCKETS
+    count: int = 0
+    zero_count: int = 0
+    buckets: dict[int, int] = field(default_factory=dict)
+    _gamma: float = field(init=False, repr=False, compare=False)
+    _log_gamma: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._gamma = (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = self._index(value)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            lowest = min(buckets)
+            merged = buckets.pop(lowest)
+            buckets[min(buckets)] += merged
+
+    def copy(self) -> QuantileSketch:
+        return replace(self, buckets=self.buckets.copy())
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank = min(max(q, 0.0), 1.0) * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        index = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                break
+        return self._value(index)
+
+    def percent_below(self, value: float) -> float:
+        if self.count == 0 or value <= 0:
+            return 0.0
+        target = self._index(value)
+        below = float(self.zero_count)
+        for index, bucket_count in self.buckets.items():
+            if index < target:
+                below += bucket_count
+            elif index == target:
+                below += bucket_count / 2
+        return 100.0 * below / self.count
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+
+@dataclass(slots=True)
+class MetricStats:
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.sketch.add(value)
+
+    def copy(self) -> MetricStats:
+        return replace(self, sketch=self.sketch.copy())
+
+    def quantile(self, q: float) -> float:
+        return self.sketch.quantile(q)
+
+    def percent_below(self, value: float) -> float:
+        return self.sketch.percent_below(value)
+
+    def to_payload(self) -> list[object]:
+        pairs = [item for index in sorted(self.sketch.buckets) for item in (index, self.sketch.buckets[index])]
+        return [self.count, self.mean, self.m2, self.sketch.zero_count, pairs]
+
+    @classmethod
+    def from_payload(cls, payload: object) -> MetricStats:
+        try:
+            count, mean, m2, zero_count, pairs = payload  # type: ignore[misc]
+            buckets = {int(index): int(bucket_count) for index, bucket_count in zip(pairs[::2], pairs[1::2])}
+            zero_count = int(zero_count)
+            sketch = QuantileSketch(count=zero_count + sum(buckets.values()), zero_count=zero_count, buckets=buckets)
+            return cls(count=int(count), mean=float(mean), m2=float(m2), sketch=sketch)
+        except (TypeError, ValueError):
+            return cls()
+
+
+@dataclass(slots=True)
+class RunStats:
+    score: MetricStats = field(default_factory=MetricStats)
+    run_seconds: MetricStats = field(default_factory=MetricStats)
+    food_eaten: MetricStats = field(default_factory=MetricStats)
+    stage: MetricStats = field(default_factory=MetricStats)
+
+    def add(self, score: int, stage: int, food_eaten: int, run_seconds: float) -> None:
+        self.score.add(score)
+        self.run_seconds.add(run_seconds)
+        self.food_eaten.add(food_eaten)
+        self.stage.add(stage)
+
+    def copy(self) -> RunStats:
+        return RunStats(self.score.copy(), self.run_seconds.copy(), self.food_eaten.copy(), self.stage.copy())
+
+    def to_payload(self) -> dict[str, list[object]]:
+        return {
+            "score": self.score.to_payload(),
+            "run_seconds": self.run_seconds.to_payload(),
+            "food_eaten": self.food_eaten.to_payload(),
+            "stage": self.stage.to_payload(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload: object) -> RunStats:
+        if not isinstance(payload, dict):
+            return cls()
+        return cls(
+            score=MetricStats.from_payload(payload.get("score")),
+            run_seconds=MetricStats.from_payload(payload.get("run_seconds")),
+            food_eaten=MetricStats.from_payload(payload.get("food_eaten")),
+            stage=MetricStats.from_payload(payload.get("stage")),
+        )
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from snake_game.config import GraphicsSettings, UserSettings
+from snake_game.leaderboard import Leaderboard
+from snake_game.run_stats import MetricStats, QuantileSketch, RunStats
+from snake_game.types import Difficulty, MapMode, ThemeId
+
+BINARY_SAVE_SUFFIX = ".snks"
+SAVE_MAGIC = b"SNKS"
+
+SECTION_SETTINGS = 1
+SECTION_GRAPHICS = 2
+SECTION_STATS = 3
+SECTION_ACHIEVEMENTS = 4
+SECTION_LEADERBOARDS = 5
+SECTION_RUN_STATS = 6
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<BII")
+_SETTINGS = struct.Struct("<BBBB")
+_GRAPHICS = struct.Struct("<BdBBBBB")
+_STATS = struct.Struct("<QQQQB")
+_COUNT = struct.Struct("<I")
+_NAME = struct.Struct("<H")
+_METRIC = struct.Struct("<QddQI")
+_RUN_STATS_METRICS = ("score", "run_seconds", "food_eaten", "stage")
+
+_DIFFICULTIES: tuple[Difficulty, ...] = tuple(Difficulty)
+_MAP_MODES: tuple[MapMode, ...] = tuple(MapMode)
+_THEMES: tuple[ThemeId, ...] = tuple(ThemeId)
+
+
+class LazyMap[V](MutableMapping[str, V]):
+    __slots__ = ("_encoded", "_decoded", "_decode")
+
+    def __init__(self, encoded: dict[str, memoryview], decode: Callable[[memoryview], V]) -> None:
+        self._encoded = encoded
+        self._decoded: dict[str, V] = {}
+        self._decode = decode
+
+    def __getitem__(self, key: str) -> V:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        value = self._decode(self._encoded[key])
+        del self._encoded[key]
+        self._decoded[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self._encoded.pop(key, None)
+        self._decoded[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._decoded:
+            del self._decoded[key]
+        else:
+            del self._encoded[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._decoded or key in self._encoded
+
+    def __len__(self) -> int:
+        return len(self._decoded) + len(self._encoded)
+
+    def __iter__(self) -> Iterator[str]:
+        self.decode_all()
+        return iter(self._decoded)
+
+    def __repr__(self) -> str:
+        return f"LazyMap({len(self._decoded)} decoded, {len(self._encoded)} pending)"
+
+    @property
+    def pending(self) -> int:
+        return len(self._encoded)
+
+    def copy(self) -> LazyMap[V]:
+        duplicate = LazyMap(dict(self._encoded), self._decode)
+        duplicate._decoded = dict(self._decoded)
+        return duplicate
+
+    def decode_all(self) -> None:
+        for key in list(self._encoded):
+            self[key]
+
+
+@dataclass(slots=True)
+class SaveImage:
+    schema_version: int
+    settings: UserSettings
+    graphics: GraphicsSettings
+    total_runs: int
+    total_score: int
+    best_score_global: int
+    journal_seq: int
+    onboarding_seen: bool
+    achievements: list[str]
+    leaderboard: LazyMap[Leaderboard]
+    run_stats: LazyMap[RunStats]
+
+
+def is_binary_save_path(path: Path) -> bool:
+    return path.suffix.lower() == BINARY_SAVE_SUFFIX
+
+
+def _pack_name(name: str) -> bytes:
+    encoded = name.encode("utf-8")
+    return _NAME.pack(len(encoded)) + encoded
+
+
+def _unpack_name(view: memoryview, offset: int) -> tuple[str, int]:
+    (length,) = _NAME.unpack_from(view, offset)
+    offset += _NAME.size
+    return bytes(view[offset : offset + length]).decode("utf-8"), offset + length
+
+
+def _encode_settings(settings: dict[str, object]) -> bytes:
+    return _SETTINGS.pack(
+        _DIFFICULTIES.index(Difficulty(settings["difficulty"])),
+        _MAP_MODES.index(MapMode(settings["map_mode"])),
+        bool(settings["obstacles_enabled"]),
+        bool(settings["muted"]),
+    )
+
+
+def _encode_graphics(graphics: dict[str, object]) -> bytes:
+    colorblind_mode = str(graphics["colorblind_mode"]).encode("utf-8")[:255]
+    return (
+        _GRAPHICS.pack(
+            _THEMES.index(ThemeId(graphics["theme_id"])),
+            float(graphics["ui_scale"]),  # type: ignore[arg-type]
+            bool(graphics["show_grid"]),
+            bool(graphics["particles_enabled"]),
+            bool(graphics["screen_shake_enabled"]),
+            bool(graphics["reduced_motion"]),
+            len(colorblind_mode),
+        )
+        + colorblind_mode
+    )
+
+
+def _encode_metric(metric: list[object]) -> bytes:
+    count, mean, m2, zero_count, pairs = metric
+    header = _METRIC.pack(count, mean, m2, zero_count, len(pairs) // 2)  # type: ignore[arg-type]
+    return header + array("i", pairs).tobytes()  # type: ignore[arg-type]
+
+
+def _encode_entries(entries: list[tuple[str, bytes]]) -> bytes:
+    parts = [_COUNT.pack(len(entries))]
+    for name, body in entries:
+        parts.append(_pack_name(name))
+        parts.append(_COUNT.pack(len(body)))
+        parts.append(body)
+    return b"".join(parts)
+
+
+def encode_save(payload: dict[str, object]) -> bytes:
+    stats: dict[str, int] = payload["stats"]  # type: ignore[assignment]
+    leaderboard: dict[str, list[int]] = payload["leaderboard"]  # type: ignore[assignment]
+    run_stats: dict[str, dict[str, list[object]]] = payload["run_stats"]  # type: ignore[assignment]
+    achievements: list[str] = payload["achievements"]  # type: ignore[assignment]
+    sections = {
+        SECTION_SETTINGS: _encode_settings(payload["settings"]),  # type: ignore[arg-type]
+        SECTION_GRAPHICS: _encode_graphics(payload["graphics"]),  # type: ignore[arg-type]
+        SECTION_STATS: _STATS.pack(
+            stats["total_runs"],
+            stats["total_score"],
+            stats["best_score_global"],
+            payload["journal_seq"],
+            bool(payload["onboarding_seen"]),
+        ),
+        SECTION_ACHIEVEMENTS: _COUNT.pack(len(achievements)) + b"".join(_pack_name(name) for name in achievements),
+        SECTION_LEADERBOARDS: _encode_entries(
+            [(key, array("i", scores).tobytes()) for key, scores in leaderboard.items()]
+        ),
+        SECTION_RUN_STATS: _encode_entries(
+            [
+                (key, b"".join(_encode_metric(metrics[name]) for name in _RUN_STATS_METRICS))
+                for key, metrics in run_stats.items()
+            ]
+        ),
+    }
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for section_id, body in sections.items():
+        table.append(_SECTION.pack(section_id, offset, len(body)))
+        offset += len(body)
+    header = _HEADER.pack(SAVE_MAGIC, int(payload["schema_version"]), len(sections))  # type: ignore[arg-type]
+    return header + b"".join(table) + b"".join(sections.values())
+
+
+def _index_entries(view: memoryview, entry_size: Callable[[memoryview], int]) -> dict[str, memoryview]:
+    if not view:
+        return {}
+    (count,) = _COUNT.unpack_from(view)
+    offset = _COUNT.size
+    entries: dict[str, memoryview] = {}
+    for _ in range(count):
+        name, offset = _unpack_name(view, offset)
+        (length,) = _COUNT.unpack_from(view, offset)
+        offset += _COUNT.size
+        if offset + length > len(view):
+            raise ValueError("save section is truncated")
+        entry = view[offset : offset + length]
+        if entry_size(entry) != length:
+            raise ValueError(f"save entry {name!r} is corrupt")
+        entries[name] = entry
+        offset += length
+    return entries
+
+
+def _scores_size(view: memoryview) -> int:
+    return len(view) - len(view) % 4
+
+
+def _run_stats_size(view: memoryview) -> int:
+    offset = 0
+    for _ in _RUN_STATS_METRICS:
+        if offset + _METRIC.size > len(view):
+            return -1
+        bucket_count = _METRIC.unpack_from(view, offset)[-1]
+        offset += _METRIC.size + 8 * bucket_count
+    return offset
+
+
+def _decode_settings(view: memoryview) -> UserSettings:
+    if not view:
+        return UserSettings()
+    difficulty, map_mode, obstacles, muted = _SETTINGS.unpack_from(view)
+    return UserSettings(
+        difficulty=_DIFFICULTIES[difficulty],
+        map_mode=_MAP_MODES[map_mode],
+        obstacles_enabled=bool(obstacles),
+        muted=bool(muted),
+    )
+
+
+def _decode_graphics(view: memoryview) -> GraphicsSettings:
+    if not view:
+        return GraphicsSettings()
+    theme, ui_scale, show_grid, particles, shake, reduced_motion, mode_length = _GRAPHICS.unpack_from(view)
+    colorblind_mode = bytes(view[_GRAPHICS.size : _GRAPHICS.size + mode_length]).decode("utf-8")
+    return GraphicsSettings(
+        theme_id=_THEMES[theme],
+        ui_scale=ui_scale if ui_scale > 0 else 1.0,
+        show_grid=bool(show_grid),
+        particles_enabled=bool(particles),
+        screen_shake_enabled=bool(shake),
+        reduced_motion=bool(reduced_motion),
+        colorblind_mode=colorblind_mode,
+    )
+
+
+def _decode_achievements(view: memoryview) -> list[str]:
+    if not view:
+        return []
+    (count,) = _COUNT.unpack_from(view)
+    offset = _COUNT.size
+    names: list[str] = []
+    for _ in range(count):
+        name, offset = _unpack_name(view, offset)
+        names.append(name)
+    return names
+
+
+def _decode_metric(view: memoryview, offset: int) -> tuple[MetricStats, int]:
+    count, mean, m2, zero_count, bucket_count = _METRIC.unpack_from(view, offset)
+    offset += _METRIC.size
+    pairs = array("i")
+    pairs.frombytes(view[offset : offset + 8 * bucket_count])
+    buckets = dict(zip(pairs[::2], pairs[1::2]))
+    sketch = QuantileSketch(count=zero_count + sum(buckets.values()), zero_count=zero_count, buckets=buckets)
+    return MetricStats(count=count, mean=mean, m2=m2, sketch=sketch), offset + 8 * bucket_count
+
+
+def _decode_run_stats(view: memoryview) -> RunStats:
+    metrics: list[MetricStats] = []
+    offset = 0
+    for _ in _RUN_STATS_METRICS:
+        metric, offset = _decode_metric(view, offset)
+        metrics.append(metric)
+    return RunStats(*metrics)
+
+
+def decode_save(data: bytes, leaderboard_limit: int | None = None) -> SaveImage:
+    view = memoryview(data)
+    magic, schema_version, section_count = _HEADER.unpack_from(view)
+    if magic != SAVE_MAGIC:
+        raise ValueError("not a binary save file")
+    sections: dict[int, memoryview] = {}
+    for index in range(section_count):
+        section_id, offset, length = _SECTION.unpack_from(view, _HEADER.size + index * _SECTION.size)
+        if offset + length > len(view):
+            raise ValueError("save section is truncated")
+        sections[section_id] = view[offset : offset + length]
+    empty = memoryview(b"")
+
+    def decode_scores(scores: memoryview) -> Leaderboard:
+        return Leaderboard(array("i", scores.tobytes()), leaderboard_limit)
+
+    stats = sections.get(SECTION_STATS)
+    total_runs, total_score, best_score_global, journal_seq, onboarding_seen = (
+        _STATS.unpack_from(stats) if stats else (0, 0, 0, 0, 0)
+    )
+    return SaveImage(
+        schema_version=schema_version,
+        settings=_decode_settings(sections.get(SECTION_SETTINGS, empty)),
+        graphics=_decode_graphics(sections.get(SECTION_GRAPHICS, empty)),
+        total_runs=total_runs,
+        total_score=total_score,
+        best_score_global=best_score_global,
+        journal_seq=journal_seq,
+        onboarding_seen=bool(onboarding_seen),
+        achievements=_decode_achievements(sections.get(SECTION_ACHIEVEMENTS, empty)),
+        leaderboard=LazyMap(_index_entries(sections.get(SECTION_LEADERBOARDS, empty), _scores_size), decode_scores),
+        run_stats=LazyMap(_index_entries(sections.get(SECTION_RUN_STATS, empty), _run_stats_size), _decode_run_stats),
+    )
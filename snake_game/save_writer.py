@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from snake_game.journal import RunRecord
+from snake_game.persistence import (
+    PersistentData,
+    append_run_records,
+    compact_run_records,
+    persistent_payload,
+    snapshot_persistent_data,
+    write_file_atomic,
+    write_save_payload,
+)
+
+DEFAULT_COALESCE_SECONDS = 0.25
+DEFAULT_RETRY_SECONDS = 1.0
+DEFAULT_FLUSH_TIMEOUT_SECONDS = 10.0
+
+_log = logging.getLogger(__name__)
+
+type PayloadWriter = Callable[[dict[str, object], Path], None]
+
+
+class SaveWriter:
+    def __init__(
+        self,
+        path: Path,
+        coalesce_seconds: float = DEFAULT_COALESCE_SECONDS,
+        write: PayloadWriter = write_save_payload,
+        retry_seconds: float = DEFAULT_RETRY_SECONDS,
+    ) -> None:
+        self.path = path
+        self.coalesce_seconds = coalesce_seconds
+        self.write = write
+        self.retry_seconds = retry_seconds
+        self.requests = 0
+        self.writes = 0
+        self.appended = 0
+        self.failures = 0
+        self.last_error: Exception | None = None
+        self._retry_at = 0.0
+        self._condition = threading.Condition()
+        self._pending: PersistentData | None = None
+        self._records: list[RunRecord] = []
+        self._files: dict[Path, bytes] = {}
+        self._writing = False
+        self._flushing = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    def request(self, data: PersistentData) -> None:
+        snapshot = snapshot_persistent_data(data)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("save writer is closed")
+            self._pending = snapshot
+            self.requests += 1
+            self._condition.notify_all()
+
+    def append(self, record: RunRecord) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("save writer is closed")
+            self._records.append(record)
+            self._condition.notify_all()
+
+    def write_file(self, path: Path, content: bytes) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("save writer is closed")
+            self._files[path] = content
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = DEFAULT_FLUSH_TIMEOUT_SECONDS) -> bool:
+        with self._condition:
+            failures = self.failures
+            self._flushing = True
+            self._condition.notify_all()
+            self._condition.wait_for(
+                lambda: self._idle() or self.failures > failures or not self._thread.is_alive(),
+                timeout=timeout,
+            )
+            self._flushing = False
+            return self._idle()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _idle(self) -> bool:
+        return not self._has_work() and not self._writing
+
+    def _has_work(self) -> bool:
+        return self._pending is not None or bool(self._records) or bool(self._files)
+
+    def _run(self) -> None:
+        condition = self._condition
+        while True:
+            with condition:
+                condition.wait_for(lambda: self._has_work() or self._closed)
+                if not self._has_work():
+                    return
+                retry_delay = self._retry_at - time.monotonic()
+                if retry_delay > 0:
+                    condition.wait_for(lambda: self._closed or self._flushing, timeout=retry_delay)
+                elif not self._records:
+                    condition.wait_for(
+                        lambda: self._closed or self._flushing or bool(self._records),
+                        timeout=self.coalesce_seconds,
+                    )
+                pending = self._pending
+                records = self._records
+                files = self._files
+                self._pending = None
+                self._records = []
+                self._files = {}
+                self._writing = True
+                closed = self._closed
+            failed = False
+            try:
+                if records:
+                    append_run_records(self.path, records)
+                    self.appended += len(records)
+                    records = []
+                if pending is not None:
+                    self.write(persistent_payload(pending), self.path)
+                    self.writes += 1
+                    snapshot_seq = pending.journal_seq
+                    pending = None
+                    compact_run_records(self.path, snapshot_seq)
+                for file_path in list(files):
+                    write_file_atomic(file_path, files[file_path])
+                    del files[file_path]
+            except Exception as error:
+                failed = True
+                self.last_error = error
+                _log.warning("saving to %s failed: %r", self.path, error)
+            with condition:
+                if failed:
+                    self._records[:0] = records
+                    if self._pending is None:
+                        self._pending = pending
+                    self._files = files | self._files
+                    self._retry_at = time.monotonic() + self.retry_seconds
+                    self.failures += 1
+                else:
+                    self._retry_at = 0.0
+                self._writing = False
+                condition.notify_all()
+            if failed and closed:
+                _log.error("save writer closed with unsaved data for %s", self.path)
+                return
@@ -8,8 +8,12 @@ import pygame
 
 from snake_game.audio import AudioManager
 from snake_game.config import GameConfig
-from snake_game.events import EventBus
-from snake_game.persistence import PersistentData
+from snake_game.journal import JOURNAL_COMPACT_RECORDS, RunRecord
+from snake_game.leaderboard import Leaderboard
+from snake_game.net.outbox import ScoreOutbox
+from snake_game.persistence import PersistentData, append_run_records, save_persistent_data, write_file_atomic
+from snake_game.save_writer import SaveWriter
+from snake_game.sqlite_store import RunStanding
 from snake_game.types import SceneId
 
 
@@ -17,11 +21,15 @@ from snake_game.types import SceneId
 class SessionResult:
     score: int
     leaderboard_key: str
-    leaderboard: list[int]
+    leaderboard: Leaderboard
     is_new_high_score: bool
     stage_reached: int = 1
     food_eaten: int = 0
     run_seconds: float = 0.0
+    better_than_percent: float | None = None
+    submission_id: int | None = None
+    history: RunStanding | None = None
+    replay: bytes = b""
 
 
 @dataclass(slots=True)
@@ -30,12 +38,34 @@ class AppContext:
     data_path: Path
     persistent_data: PersistentData
     audio: AudioManager
-    event_bus: EventBus
     rng: random.Random
     title_font: pygame.font.Font
     body_font: pygame.font.Font
     small_font: pygame.font.Font
     last_result: SessionResult | None = None
+    demo_turbo: bool = False
+    save_writer: SaveWriter | None = None
+    score_outbox: ScoreOutbox | None = None
+
+    def save(self) -> None:
+        if self.save_writer is not None:
+            self.save_writer.request(self.persistent_data)
+        else:
+            save_persistent_data(self.persistent_data, self.data_path)
+
+    def save_file(self, path: Path, content: bytes) -> None:
+        if self.save_writer is not None:
+            self.save_writer.write_file(path, content)
+        else:
+            write_file_atomic(path, content)
+
+    def save_run(self, record: RunRecord) -> None:
+        if self.save_writer is not None:
+            self.save_writer.append(record)
+        else:
+            append_run_records(self.data_path, [record])
+        if record.seq % JOURNAL_COMPACT_RECORDS == 0:
+            self.save()
 
 
 class Scene:
@@ -1,5 +1,6 @@
 import pygame
 
+from snake_game.net.outbox import RemoteRank
 from snake_game.scenes.base import AppContext, Scene
 from snake_game.types import SceneId
 from snake_game.ui.components import draw_hint_footer, draw_option_rows, draw_scene_header
@@ -13,6 +14,7 @@ class GameOverScene(Scene):
         super().__init__(ctx)
         self.selected_index = 0
         self.options = ["Play Again", "Main Menu", "Quit"]
+        self.remote_rank: RemoteRank | None = None
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
@@ -44,6 +46,10 @@ class GameOverScene(Scene):
 
     def update(self, delta_seconds: float) -> None:
         _ = delta_seconds
+        result = self.ctx.last_result
+        outbox = self.ctx.score_outbox
+        if self.remote_rank is None and outbox is not None and result is not None and result.submission_id is not None:
+            self.remote_rank = outbox.result(result.submission_id)
 
     def render(self, screen: pygame.Surface) -> None:
         theme = resolve_theme(
@@ -66,11 +72,26 @@ class GameOverScene(Scene):
 
         result = self.ctx.last_result
         score_value = result.score if result else 0
-        leaderboard = result.leaderboard if result else []
+        history = result.history if result else None
+        leaderboard = result.leaderboard.top(5) if result else []
+        if history is not None:
+            leaderboard = list(history.top)
         new_best = result.is_new_high_score if result else False
         stage_reached = result.stage_reached if result else 1
         food_eaten = result.food_eaten if result else 0
         run_seconds = result.run_seconds if result else 0.0
+        standing_parts: list[str] = []
+        if history is not None:
+            standing_parts.append(f"All-time rank #{history.rank} of {history.runs}")
+        if result is not None and result.better_than_percent is not None:
+            standing_parts.append(f"Better than {result.better_than_percent:0.0f}% of your runs")
+        if result is not None and result.submission_id is not None:
+            if self.remote_rank is None:
+                standing_parts.append("Cabinet rank: sending...")
+            elif self.remote_rank.error is not None:
+                standing_parts.append("Cabinet rank: rejected")
+            elif self.remote_rank.rank is not None:
+                standing_parts.append(f"Cabinet rank #{self.remote_rank.rank} of {self.remote_rank.size}")
 
         summary_text = (
             f"Score {score_value}  |  Stage {stage_reached}  |  "
@@ -93,6 +114,15 @@ class GameOverScene(Scene):
                 font=self.ctx.small_font,
                 color=palette.selected_text,
             )
+        if standing_parts:
+            draw_hint_footer(
+                screen=screen,
+                text="  |  ".join(standing_parts),
+                width=self.ctx.config.window_width,
+                y=236,
+                font=self.ctx.small_font,
+                color=palette.text,
+            )
 
         draw_option_rows(
             screen=screen,
@@ -110,7 +140,7 @@ class GameOverScene(Scene):
 
         draw_hint_footer(
             screen=screen,
-            text="Top Scores (Current Setup): " + ", ".join(str(value) for value in leaderboard[:5]),
+            text="Top Scores (Current Setup): " + ", ".join(str(value) for value in leaderboard),
             width=self.ctx.config.window_width,
             y=430,
             font=self.ctx.small_font,
@@ -1,22 +1,27 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 
 import pygame
 
-from snake_game.events import GameEvent, GameEventType
-from snake_game.logic import advance_simulation, create_initial_state, queue_direction_change
+from snake_game.bots.autopilot import AutopilotPolicy
+from snake_game.bots.base import Policy
+from snake_game.bots.hamiltonian import HamiltonianPolicy
+from snake_game.bots.mcts import MCTSPolicy
+from snake_game.events import Event, EventBus, FoodEaten, GameEventType, StepsBatched
 from snake_game.persistence import (
+    apply_run_record,
     best_score_for_settings,
+    history_standing,
     is_new_high_score,
     leaderboard_key,
-    record_score,
-    save_persistent_data,
-    update_run_stats,
+    next_run_record,
 )
 from snake_game.render import draw_centered_text, draw_playfield
+from snake_game.rendering.layers import StepMotion
 from snake_game.scenes.base import AppContext, Scene, SessionResult
+from snake_game.sim.replay import ReplayRecorder
+from snake_game.sim.session import GameSession
 from snake_game.systems.hazards import HazardSystem
-from snake_game.systems.powerups import PowerUpSystem
-from snake_game.systems.progression import StageProgression
 from snake_game.types import Direction, GameStatus, SceneId
 from snake_game.ui.components import draw_panel
 from snake_game.ui.theme import resolve_theme
@@ -32,6 +37,12 @@ KEY_TO_DIRECTION = {
     pygame.K_d: Direction.RIGHT,
 }
 
+DEMO_POLICIES: dict[str, Callable[[AppContext], Policy]] = {
+    "autopilot": lambda ctx: AutopilotPolicy(),
+    "hamiltonian": lambda ctx: HamiltonianPolicy(ctx.data_path.parent / "cycles"),
+    "mcts": lambda ctx: MCTSPolicy(),
+}
+
 
 @dataclass(slots=True)
 class FxParticle:
@@ -47,13 +58,30 @@ class FxParticle:
 class PlayScene(Scene):
     scene_id = SceneId.PLAY
 
-    def __init__(self, ctx: AppContext) -> None:
+    def __init__(self, ctx: AppContext, demo: bool = False) -> None:
         super().__init__(ctx)
-        self.state = create_initial_state(ctx.config, ctx.persistent_data.settings, ctx.rng)
+        self.events = EventBus(queue_unhandled=False)
+        self.events.subscribe(GameEventType.FOOD_EATEN, self._on_food_eaten)
+        self.events.subscribe(GameEventType.STAGE_ADVANCED, self._on_stage_advanced)
+        self.events.subscribe(GameEventType.POWERUP_COLLECTED, self._on_powerup_collected)
+        self.events.subscribe(GameEventType.STEPS_BATCHED, self._on_steps_batched)
+        self.session = GameSession(
+            ctx.config,
+            ctx.persistent_data.settings,
+            seed=ctx.rng.getrandbits(63),
+            emit=self.events.emit,
+        )
+        self.demo = demo
+        if demo:
+            self.scene_id = SceneId.DEMO
+            self.session.controller = DEMO_POLICIES.get(ctx.config.demo_policy, DEMO_POLICIES["autopilot"])(ctx)
+            self.session.turbo = ctx.demo_turbo
+        self.recorder = ReplayRecorder(self.session)
+        self.state = self.session.state
         self.best_score_at_start = best_score_for_settings(ctx.persistent_data, ctx.persistent_data.settings)
-        self.progression = StageProgression(points_per_stage=ctx.config.stage_points_interval)
+        self.progression = self.session.progression
         self.hazards = HazardSystem(enabled=False)
-        self.powerups = PowerUpSystem()
+        self.powerups = self.session.powerups
         self.countdown_remaining = ctx.config.countdown_seconds
         self.score_recorded = False
 
@@ -62,12 +90,35 @@ class PlayScene(Scene):
         self.flash_timer: float = 0.0
         self.shake_timer: float = 0.0
 
-        self.food_eaten_count = 0
-        self.run_seconds = 0.0
-
-        self.onboarding_visible = not ctx.persistent_data.onboarding_seen
+        self.onboarding_visible = not demo and not ctx.persistent_data.onboarding_seen
         self.particles: list[FxParticle] = []
 
+    def _on_food_eaten(self, event: Event) -> None:
+        assert isinstance(event, FoodEaten)
+        if self.session.turbo:
+            return
+        self.ctx.audio.play("eat")
+        self._spawn_burst(event.head_x, event.head_y, (245, 165, 95), count=10)
+
+    def _on_steps_batched(self, event: Event) -> None:
+        assert isinstance(event, StepsBatched)
+        if event.food_eaten:
+            self.ctx.audio.play("eat")
+            self._spawn_burst(event.head_x, event.head_y, (245, 165, 95), count=10)
+
+    def _on_stage_advanced(self, event: Event) -> None:
+        self.ctx.audio.play("confirm")
+        self.stage_banner_text = f"Stage {self.progression.current_stage}"
+        self.stage_banner_timer = 1.2
+        self.flash_timer = max(self.flash_timer, 0.12)
+
+    def _on_powerup_collected(self, event: Event) -> None:
+        self.ctx.audio.play("confirm")
+        self.flash_timer = max(self.flash_timer, 0.16)
+        self.shake_timer = max(self.shake_timer, 0.08)
+        head_x, head_y = self.state.body.head
+        self._spawn_burst(head_x, head_y, (120, 210, 255), count=14)
+
     def _spawn_burst(self, cell_x: int, cell_y: int, color: tuple[int, int, int], count: int = 8) -> None:
         if not self.ctx.config.graphics.particles_enabled:
             return
@@ -106,42 +157,75 @@ class PlayScene(Scene):
     def _record_and_transition(self) -> None:
         if self.score_recorded:
             return
+        if self.demo:
+            self.score_recorded = True
+            self.next_scene = SceneId.DEMO
+            return
 
         settings = self.ctx.persistent_data.settings
         score_key = leaderboard_key(settings)
-        existing_scores = list(self.ctx.persistent_data.leaderboard.get(score_key, []))
+        new_high_score = is_new_high_score(self.ctx.persistent_data.leaderboard.get(score_key, ()), self.state.score)
+        run_stats = self.ctx.persistent_data.run_stats.get(score_key)
+        better_than = run_stats.score.percent_below(self.state.score) if run_stats is not None else None
+        history = history_standing(self.ctx.data_path, score_key, self.state.score)
 
-        leaderboard = record_score(
+        record = next_run_record(
             self.ctx.persistent_data,
             settings,
             self.state.score,
             self.ctx.config.leaderboard_limit,
+            stage=self.progression.current_stage,
+            food_eaten=self.session.food_eaten,
+            run_seconds=self.session.run_seconds,
         )
-        update_run_stats(self.ctx.persistent_data, self.state.score)
-        save_persistent_data(self.ctx.persistent_data, self.ctx.data_path)
+        leaderboard = apply_run_record(self.ctx.persistent_data, record)
+        self.ctx.save_run(record)
+        outbox = self.ctx.score_outbox
+        submission_id = outbox.submit(score_key, self.state.score) if outbox is not None else None
+        replay = self.recorder.finish().to_bytes()
+        self._save_replay(replay)
         self.ctx.last_result = SessionResult(
             score=self.state.score,
             leaderboard_key=score_key,
             leaderboard=leaderboard,
-            is_new_high_score=is_new_high_score(existing_scores, self.state.score),
+            is_new_high_score=new_high_score,
             stage_reached=self.progression.current_stage,
-            food_eaten=self.food_eaten_count,
-            run_seconds=self.run_seconds,
+            food_eaten=self.session.food_eaten,
+            run_seconds=self.session.run_seconds,
+            better_than_percent=better_than,
+            submission_id=submission_id,
+            history=history,
+            replay=replay,
         )
         self.score_recorded = True
         self.ctx.audio.play("death")
         self.next_scene = SceneId.GAME_OVER
 
+    def _save_replay(self, replay: bytes) -> None:
+        path = self.ctx.data_path.parent / "replays" / "latest.snkr"
+        try:
+            self.ctx.save_file(path, replay)
+        except OSError:
+            pass
+
     def _dismiss_onboarding(self) -> None:
         self.onboarding_visible = False
         if not self.ctx.persistent_data.onboarding_seen:
             self.ctx.persistent_data.onboarding_seen = True
-            save_persistent_data(self.ctx.persistent_data, self.ctx.data_path)
+            self.ctx.save()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type != pygame.KEYDOWN:
             return
 
+        if self.demo:
+            if event.key == pygame.K_t:
+                self.ctx.demo_turbo = not self.ctx.demo_turbo
+                self.session.turbo = self.ctx.demo_turbo
+                return
+            self.next_scene = SceneId.MENU
+            return
+
         if self.onboarding_visible:
             if event.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_h):
                 self._dismiss_onboarding()
@@ -153,7 +237,7 @@ class PlayScene(Scene):
             return
 
         if event.key in KEY_TO_DIRECTION:
-            queue_direction_change(self.state, KEY_TO_DIRECTION[event.key])
+            self.recorder.queue_direction(KEY_TO_DIRECTION[event.key])
             return
 
         if event.key in (pygame.K_p, pygame.K_SPACE):
@@ -192,71 +276,14 @@ class PlayScene(Scene):
             self.countdown_remaining = max(0.0, self.countdown_remaining - delta_seconds)
             return
 
-        self.run_seconds += delta_seconds
-        self.powerups.update(delta_seconds)
-        advance_simulation(
-            self.state,
-            self.ctx.config,
-            delta_seconds,
-            self.ctx.rng,
-            score_multiplier=self.powerups.score_multiplier(),
-            speed_multiplier=self.powerups.speed_multiplier(),
-            phase_active=self.powerups.phase_active(),
-            emit=self.ctx.event_bus.emit,
-        )
+        shields_used = self.session.shields_used
+        self.session.advance(delta_seconds)
         self.hazards.update()
-        self.progression.update_from_score(self.state.score, emit=self.ctx.event_bus.emit)
-
-        events = self.ctx.event_bus.drain()
-        for event in events:
-            if event.type == GameEventType.FOOD_EATEN:
-                self.ctx.audio.play("eat")
-                self.food_eaten_count += 1
-                head_x = int(event.payload.get("head_x", self.state.snake[0][0]))
-                head_y = int(event.payload.get("head_y", self.state.snake[0][1]))
-                self._spawn_burst(head_x, head_y, (245, 165, 95), count=10)
-
-                occupied_cells = set(self.state.snake) | set(self.state.obstacles) | {self.state.food}
-                self.powerups.maybe_spawn(
-                    rng=self.ctx.rng,
-                    occupied_cells=occupied_cells,
-                    grid_width=self.ctx.config.grid_width,
-                    grid_height=self.ctx.config.grid_height,
-                )
-            elif event.type == GameEventType.STEP_ADVANCED:
-                head_x = int(event.payload.get("head_x", self.state.snake[0][0]))
-                head_y = int(event.payload.get("head_y", self.state.snake[0][1]))
-                collected = self.powerups.collect_at((head_x, head_y))
-                if collected is not None:
-                    self.ctx.event_bus.emit(
-                        GameEvent(
-                            type=GameEventType.POWERUP_COLLECTED,
-                            payload={
-                                "powerup": collected.type.value,
-                                "duration_seconds": round(collected.remaining_seconds, 1),
-                            },
-                        )
-                    )
-            elif event.type == GameEventType.STAGE_ADVANCED:
-                self.ctx.audio.play("confirm")
-                self.stage_banner_text = f"Stage {self.progression.current_stage}"
-                self.stage_banner_timer = 1.2
-                self.flash_timer = max(self.flash_timer, 0.12)
-            elif event.type == GameEventType.PLAYER_DIED:
-                reason = str(event.payload.get("reason", ""))
-                if self.powerups.absorb_fatal_collision(reason):
-                    self.state.status = GameStatus.RUNNING
-                    self.ctx.audio.play("confirm")
-                    self.flash_timer = max(self.flash_timer, 0.18)
-                    self.shake_timer = max(self.shake_timer, 0.12)
-
-        for event in self.ctx.event_bus.drain():
-            if event.type == GameEventType.POWERUP_COLLECTED:
-                self.ctx.audio.play("confirm")
-                self.flash_timer = max(self.flash_timer, 0.16)
-                self.shake_timer = max(self.shake_timer, 0.08)
-                head = self.state.snake[0]
-                self._spawn_burst(head[0], head[1], (120, 210, 255), count=14)
+
+        if self.session.shields_used > shields_used:
+            self.ctx.audio.play("confirm")
+            self.flash_timer = max(self.flash_timer, 0.18)
+            self.shake_timer = max(self.shake_timer, 0.12)
 
         if self.state.status == GameStatus.GAME_OVER:
             self._record_and_transition()
@@ -304,11 +331,16 @@ class PlayScene(Scene):
             flash_alpha=flash_alpha,
             camera_offset=self._camera_offset(),
             particles=particle_primitives,
+            motion=StepMotion(
+                previous_head=self.session.previous_head,
+                previous_tail=self.session.previous_tail,
+                alpha=self.session.interpolation_alpha(),
+            ),
         )
         if self.countdown_remaining <= 0 and not self.onboarding_visible:
             draw_centered_text(
                 screen,
-                "P/Space: Pause   Esc: Menu",
+                "Demo - T: Turbo   Other Keys: Menu" if self.demo else "P/Space: Pause   Esc: Menu",
                 self.ctx.small_font,
                 theme.palette.text,
                 (self.ctx.config.window_width // 2, self.ctx.config.window_height - 24),
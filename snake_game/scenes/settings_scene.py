@@ -1,6 +1,5 @@
 import pygame
 
-from snake_game.persistence import save_persistent_data
 from snake_game.scenes.base import AppContext, Scene
 from snake_game.types import Difficulty, MapMode, SceneId, ThemeId
 from snake_game.ui.components import draw_hint_footer, draw_option_rows, draw_scene_header
@@ -78,7 +77,7 @@ class SettingsScene(Scene):
         return ""
 
     def _persist(self) -> None:
-        save_persistent_data(self.ctx.persistent_data, self.ctx.data_path)
+        self.ctx.save()
 
     def _change_value(self, step: int) -> None:
         settings = self.ctx.persistent_data.settings
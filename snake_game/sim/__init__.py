@@ -0,0 +1,2 @@
+"""Headless simulation modules for batch runs and bots."""
+
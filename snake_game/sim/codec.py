@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import struct
+from array import array
+
+from snake_game.config import GameConfig
+from snake_game.state import GameState, SnakeBody
+from snake_game.systems.world import ChunkedWorld
+from snake_game.types import Difficulty, Direction, GameStatus, MapMode, Point
+
+STATE_CODEC_VERSION = 1
+
+_HEADER = struct.Struct("<BHHBBBBBiiIdddHII")
+_WORLD = struct.Struct("<QHHIiiH")
+_NO_DIRECTION = 0xFF
+
+_DIRECTIONS: tuple[Direction, ...] = tuple(Direction)
+_STATUSES: tuple[GameStatus, ...] = tuple(GameStatus)
+_DIFFICULTIES: tuple[Difficulty, ...] = tuple(Difficulty)
+_MAP_MODES: tuple[MapMode, ...] = tuple(MapMode)
+
+
+def _pack_cells(cells: list[Point]) -> bytes:
+    return array("i", [coordinate for cell in cells for coordinate in cell]).tobytes()
+
+
+def _unpack_cells(coordinates: array) -> list[Point]:
+    return list(zip(coordinates[::2], coordinates[1::2]))
+
+
+def pack_state(state: GameState, config: GameConfig) -> bytes:
+    body = list(state.body)
+    obstacles = sorted(state.obstacle_cells)
+    pending = state.pending_direction
+    header = _HEADER.pack(
+        STATE_CODEC_VERSION,
+        config.grid_width,
+        config.grid_height,
+        _DIRECTIONS.index(state.direction),
+        _DIRECTIONS.index(pending) if pending is not None else _NO_DIRECTION,
+        _STATUSES.index(state.status),
+        _DIFFICULTIES.index(state.difficulty),
+        _MAP_MODES.index(state.map_mode),
+        state.food[0],
+        state.food[1],
+        state.score,
+        state.steps_per_second,
+        state.speed_increment_per_food,
+        state.max_steps_per_second,
+        state.score_per_food,
+        len(body),
+        len(obstacles),
+    )
+    world = state.world
+    if world is not None:
+        header += _WORLD.pack(
+            world.seed,
+            world.chunk_size,
+            world.obstacles_per_chunk,
+            world.max_chunks,
+            world.safe_center[0],
+            world.safe_center[1],
+            world.spawn_radius,
+        )
+    return header + _pack_cells(body) + _pack_cells(obstacles)
+
+
+def unpack_state(data: bytes) -> tuple[GameState, int, int]:
+    (
+        version,
+        width,
+        height,
+        direction,
+        pending,
+        status,
+        difficulty,
+        map_mode,
+        food_x,
+        food_y,
+        score,
+        steps_per_second,
+        speed_increment_per_food,
+        max_steps_per_second,
+        score_per_food,
+        body_length,
+        obstacle_count,
+    ) = _HEADER.unpack_from(data)
+    if version != STATE_CODEC_VERSION:
+        raise ValueError(f"unsupported state codec version {version}")
+
+    offset = _HEADER.size
+    world: ChunkedWorld | None = None
+    if _MAP_MODES[map_mode] == MapMode.OPEN:
+        seed, chunk_size, obstacles_per_chunk, max_chunks, safe_x, safe_y, spawn_radius = _WORLD.unpack_from(
+            data, offset
+        )
+        offset += _WORLD.size
+        world = ChunkedWorld(
+            seed,
+            chunk_size=chunk_size,
+            obstacles_per_chunk=obstacles_per_chunk,
+            max_chunks=max_chunks,
+            safe_center=(safe_x, safe_y),
+            spawn_radius=spawn_radius,
+        )
+
+    coordinates = array("i")
+    coordinates.frombytes(data[offset : offset + 8 * (body_length + obstacle_count)])
+    if len(coordinates) != 2 * (body_length + obstacle_count):
+        raise ValueError("packed state is truncated")
+    cells = _unpack_cells(coordinates)
+
+    body = SnakeBody(cells[:body_length])
+    if world is not None:
+        world.focus = body.head
+    state = GameState(
+        body=body,
+        direction=_DIRECTIONS[direction],
+        pending_direction=_DIRECTIONS[pending] if pending != _NO_DIRECTION else None,
+        food=(food_x, food_y),
+        score=score,
+        status=_STATUSES[status],
+        steps_per_second=steps_per_second,
+        speed_increment_per_food=speed_increment_per_food,
+        max_steps_per_second=max_steps_per_second,
+        score_per_food=score_per_food,
+        difficulty=_DIFFICULTIES[difficulty],
+        map_mode=_MAP_MODES[map_mode],
+        obstacle_cells=set(cells[body_length:]),
+        accumulator_seconds=0.0,
+        world=world,
+    )
+    return state, width, height
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.session import GameSession
+from snake_game.sim.vec import ACTIONS, NO_ACTION
+from snake_game.state import GameState
+from snake_game.systems.powerups import PowerUpSystem
+from snake_game.types import GameStatus, MapMode, Point
+
+PLANE_BODY = 0
+PLANE_HEAD = 1
+PLANE_FOOD = 2
+PLANE_OBSTACLES = 3
+PLANE_POWERUPS = 4
+PLANE_COUNT = 5
+
+
+class SnakeEnv:
+    def __init__(
+        self,
+        config: GameConfig,
+        settings: UserSettings,
+        seed: int | None = None,
+        powerups_enabled: bool = True,
+        food_reward: float = 1.0,
+        death_reward: float = -1.0,
+        step_reward: float = 0.0,
+        max_steps: int | None = None,
+        observation: np.ndarray | None = None,
+    ) -> None:
+        if settings.map_mode == MapMode.OPEN:
+            raise ValueError(f"Unsupported map mode for observations: {settings.map_mode}")
+        self.config = config
+        self.settings = settings
+        self.width = config.grid_width
+        self.height = config.grid_height
+        self.powerups_enabled = powerups_enabled
+        self.food_reward = food_reward
+        self.death_reward = death_reward
+        self.step_reward = step_reward
+        self.max_steps = max_steps
+
+        shape = (PLANE_COUNT, self.height, self.width)
+        if observation is None:
+            observation = np.zeros(shape, dtype=np.uint8)
+        elif observation.shape != shape or observation.dtype != np.uint8 or not observation.flags.c_contiguous:
+            raise ValueError(f"observation buffer must be a C-contiguous uint8 array of shape {shape}")
+        self.observation = observation
+        self._cells = memoryview(observation).cast("B")
+        self._plane_size = self.width * self.height
+
+        self._seed_source = random.Random(seed)
+        self.session: GameSession | None = None
+        self.steps = 0
+        self.done = True
+
+    @property
+    def state(self) -> GameState | None:
+        return self.session.state if self.session is not None else None
+
+    @property
+    def powerups(self) -> PowerUpSystem | None:
+        return self.session.powerups if self.session is not None else None
+
+    @property
+    def death_reason(self) -> str:
+        return self.session.death_reason if self.session is not None else ""
+
+    def _offset(self, plane: int, cell: Point) -> int:
+        return plane * self._plane_size + cell[1] * self.width + cell[0]
+
+    def reset(self, seed: int | None = None) -> np.ndarray:
+        self.session = GameSession(
+            self.config,
+            self.settings,
+            seed=seed if seed is not None else self._seed_source.getrandbits(63),
+            powerups_enabled=self.powerups_enabled,
+        )
+        self.steps = 0
+        self.done = False
+
+        state = self.session.state
+        self.observation.fill(0)
+        cells = self._cells
+        for cell in state.snake:
+            cells[self._offset(PLANE_BODY, cell)] = 1
+        cells[self._offset(PLANE_HEAD, state.snake.head)] = 1
+        cells[self._offset(PLANE_FOOD, state.food)] = 1
+        for cell in state.obstacles:
+            cells[self._offset(PLANE_OBSTACLES, cell)] = 1
+        return self.observation
+
+    def step(self, action: int = NO_ACTION) -> tuple[np.ndarray, float, bool]:
+        session = self.session
+        if session is None or self.done:
+            raise RuntimeError("reset() must be called before step() once an episode is done")
+
+        state = session.state
+        body = state.body
+        old_head = body.head
+        old_tail = body.tail
+        old_food = state.food
+        powerups = session.powerups if self.powerups_enabled else None
+        old_powerup = powerups.spawned.position if powerups is not None and powerups.spawned is not None else None
+
+        session.step(ACTIONS[action] if action != NO_ACTION else None)
+        ate = session.ate_this_tick
+
+        cells = self._cells
+        width = self.width
+        plane = self._plane_size
+        new_head = body.head
+        if new_head != old_head:
+            cells[plane * PLANE_HEAD + old_head[1] * width + old_head[0]] = 0
+            cells[plane * PLANE_HEAD + new_head[1] * width + new_head[0]] = 1
+            if not ate and old_tail != new_head:
+                cells[plane * PLANE_BODY + old_tail[1] * width + old_tail[0]] = 0
+            cells[plane * PLANE_BODY + new_head[1] * width + new_head[0]] = 1
+        if state.food != old_food:
+            cells[self._offset(PLANE_FOOD, old_food)] = 0
+            cells[self._offset(PLANE_FOOD, state.food)] = 1
+        new_powerup = powerups.spawned.position if powerups is not None and powerups.spawned is not None else None
+        if new_powerup != old_powerup:
+            if old_powerup is not None:
+                cells[self._offset(PLANE_POWERUPS, old_powerup)] = 0
+            if new_powerup is not None:
+                cells[self._offset(PLANE_POWERUPS, new_powerup)] = 1
+
+        self.steps += 1
+        reward = self.step_reward
+        if ate:
+            reward += self.food_reward
+        if state.status == GameStatus.GAME_OVER:
+            reward += self.death_reward
+            self.done = True
+        elif self.max_steps is not None and self.steps >= self.max_steps:
+            self.done = True
+        return self.observation, reward, self.done
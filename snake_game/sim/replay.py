@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import argparse
+import struct
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.session import GameSession
+from snake_game.systems.powerups import PowerUpType, SpawnedPowerUp
+from snake_game.types import Difficulty, Direction, MapMode, Point
+
+REPLAY_MAGIC = b"SNKR"
+REPLAY_VERSION = 1
+
+_HEADER = struct.Struct("<4sBQBHHH")
+
+KIND_UP = 0
+KIND_DOWN = 1
+KIND_LEFT = 2
+KIND_RIGHT = 3
+KIND_POWERUP_SPAWN = 4
+KIND_POWERUP_EXPIRE = 5
+KIND_END = 7
+
+_DIRECTIONS: tuple[Direction, ...] = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+_DIRECTION_KINDS: dict[Direction, int] = {direction: kind for kind, direction in enumerate(_DIRECTIONS)}
+_POWERUP_TYPES: tuple[PowerUpType, ...] = tuple(PowerUpType)
+
+
+class ReplayFormatError(ValueError):
+    pass
+
+
+class ReplayDesyncError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayEvent:
+    tick: int
+    kind: int
+    powerup: PowerUpType | None = None
+    position: Point | None = None
+
+    @property
+    def direction(self) -> Direction | None:
+        if self.kind <= KIND_RIGHT:
+            return _DIRECTIONS[self.kind]
+        return None
+
+
+@dataclass(slots=True)
+class Replay:
+    seed: int
+    settings: UserSettings
+    grid_width: int
+    grid_height: int
+    obstacle_count: int
+    events: list[ReplayEvent] = field(default_factory=list)
+    final_tick: int = 0
+    final_score: int = 0
+
+    @property
+    def input_count(self) -> int:
+        return sum(1 for event in self.events if event.kind <= KIND_RIGHT)
+
+    def config(self, base: GameConfig | None = None) -> GameConfig:
+        template = base or GameConfig()
+        return GameConfig(
+            window_width=template.window_width,
+            window_height=template.window_height,
+            cell_size=template.cell_size,
+            max_steps_per_frame=template.max_steps_per_frame,
+            obstacle_count=self.obstacle_count,
+            stage_points_interval=template.stage_points_interval,
+            board_width=self.grid_width,
+            board_height=self.grid_height,
+        )
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(
+            _HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.seed,
+                _encode_settings(self.settings),
+                self.grid_width,
+                self.grid_height,
+                self.obstacle_count,
+            )
+        )
+        last_tick = 0
+        for event in self.events:
+            _write_varint(out, ((event.tick - last_tick) << 3) | event.kind)
+            last_tick = event.tick
+            if event.kind == KIND_POWERUP_SPAWN and event.powerup is not None and event.position is not None:
+                out.append(_POWERUP_TYPES.index(event.powerup))
+                if self.settings.map_mode == MapMode.OPEN:
+                    _write_varint(out, _zigzag(event.position[0]))
+                    _write_varint(out, _zigzag(event.position[1]))
+                else:
+                    _write_varint(out, event.position[1] * self.grid_width + event.position[0])
+        _write_varint(out, ((self.final_tick - last_tick) << 3) | KIND_END)
+        _write_varint(out, self.final_score)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Replay:
+        if len(data) < _HEADER.size:
+            raise ReplayFormatError("replay is truncated")
+        magic, version, seed, settings_bits, grid_width, grid_height, obstacle_count = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayFormatError("not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayFormatError(f"unsupported replay version {version}")
+
+        replay = cls(
+            seed=seed,
+            settings=_decode_settings(settings_bits),
+            grid_width=grid_width,
+            grid_height=grid_height,
+            obstacle_count=obstacle_count,
+        )
+        offset = _HEADER.size
+        tick = 0
+        while True:
+            value, offset = _read_varint(data, offset)
+            tick += value >> 3
+            kind = value & 0b111
+            if kind == KIND_END:
+                replay.final_tick = tick
+                replay.final_score, offset = _read_varint(data, offset)
+                return replay
+            if kind == KIND_POWERUP_SPAWN:
+                if offset >= len(data):
+                    raise ReplayFormatError("replay is truncated")
+                type_index = data[offset]
+                if type_index >= len(_POWERUP_TYPES):
+                    raise ReplayFormatError("unknown power-up type")
+                if replay.settings.map_mode == MapMode.OPEN:
+                    encoded_x, offset = _read_varint(data, offset + 1)
+                    encoded_y, offset = _read_varint(data, offset)
+                    position_x, position_y = _unzigzag(encoded_x), _unzigzag(encoded_y)
+                else:
+                    flat, offset = _read_varint(data, offset + 1)
+                    position_y, position_x = divmod(flat, grid_width)
+                replay.events.append(
+                    ReplayEvent(tick, kind, powerup=_POWERUP_TYPES[type_index], position=(position_x, position_y))
+                )
+            elif kind <= KIND_POWERUP_EXPIRE:
+                replay.events.append(ReplayEvent(tick, kind))
+            else:
+                raise ReplayFormatError(f"unknown replay record kind {kind}")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayFormatError("replay is truncated")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _encode_settings(settings: UserSettings) -> int:
+    difficulty_index = list(Difficulty).index(settings.difficulty)
+    map_mode_index = list(MapMode).index(settings.map_mode)
+    return difficulty_index | (map_mode_index << 2) | (int(settings.obstacles_enabled) << 4)
+
+
+def _decode_settings(bits: int) -> UserSettings:
+    difficulties = list(Difficulty)
+    map_modes = list(MapMode)
+    difficulty_index = bits & 0b11
+    map_mode_index = (bits >> 2) & 0b11
+    if difficulty_index >= len(difficulties) or map_mode_index >= len(map_modes):
+        raise ReplayFormatError("replay settings are invalid")
+    return UserSettings(
+        difficulty=difficulties[difficulty_index],
+        map_mode=map_modes[map_mode_index],
+        obstacles_enabled=bool(bits & 0b10000),
+    )
+
+
+class ReplayRecorder:
+    def __init__(self, session: GameSession) -> None:
+        self.session = session
+        self.replay = Replay(
+            seed=session.seed,
+            settings=replace(session.settings),
+            grid_width=session.config.grid_width,
+            grid_height=session.config.grid_height,
+            obstacle_count=session.config.obstacle_count,
+        )
+        self._spawned: SpawnedPowerUp | None = session.powerups.spawned
+        session.on_tick = self.observe_tick
+
+    def queue_direction(self, direction: Direction) -> bool:
+        accepted = self.session.queue_direction(direction)
+        if accepted:
+            self.replay.events.append(ReplayEvent(self.session.tick, _DIRECTION_KINDS[direction]))
+        return accepted
+
+    def observe_tick(self, session: GameSession) -> None:
+        spawned = session.powerups.spawned
+        if spawned is self._spawned:
+            return
+        if self._spawned is not None and session.collected_this_tick is None:
+            self.replay.events.append(ReplayEvent(session.tick, KIND_POWERUP_EXPIRE))
+        if spawned is not None:
+            self.replay.events.append(
+                ReplayEvent(session.tick, KIND_POWERUP_SPAWN, powerup=spawned.type, position=spawned.position)
+            )
+        self._spawned = spawned
+
+    def finish(self) -> Replay:
+        self.replay.final_tick = self.session.tick
+        self.replay.final_score = self.session.state.score
+        return self.replay
+
+
+def run_replay(replay: Replay, config: GameConfig | None = None, check_powerups: bool = True) -> GameSession:
+    session = GameSession(config or replay.config(), replay.settings, seed=replay.seed)
+    observer = ReplayRecorder(session) if check_powerups else None
+    inputs = [event for event in replay.events if event.kind <= KIND_RIGHT]
+    checkpoints = [event for event in replay.events if event.kind > KIND_RIGHT]
+
+    input_index = 0
+    while not session.finished and session.tick < replay.final_tick:
+        while input_index < len(inputs) and inputs[input_index].tick == session.tick:
+            direction = inputs[input_index].direction
+            if direction is not None:
+                session.queue_direction(direction)
+            input_index += 1
+        session.step()
+
+    if observer is not None and observer.replay.events != checkpoints:
+        raise ReplayDesyncError("power-up spawns diverged from the recording")
+    if session.tick != replay.final_tick or session.state.score != replay.final_score:
+        raise ReplayDesyncError(
+            f"replay ended at tick {session.tick} with score {session.state.score}, "
+            f"expected tick {replay.final_tick} with score {replay.final_score}"
+        )
+    return session
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-run a recorded replay headlessly.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--repeat", type=int, default=1, help="re-run the replay N times for benchmarking")
+    args = parser.parse_args(argv)
+
+    replay = Replay.from_bytes(args.path.read_bytes())
+    started = time.perf_counter()
+    for _ in range(max(1, args.repeat)):
+        session = run_replay(replay)
+    elapsed = time.perf_counter() - started
+    total_ticks = session.tick * max(1, args.repeat)
+    print(f"score {session.state.score}  ticks {session.tick}  inputs {replay.input_count}")
+    print(f"{total_ticks / elapsed:,.0f} steps/s over {max(1, args.repeat)} run(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from snake_game.bots.base import Policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.events import Event, EventEmitter, GameEventType, PlayerDied, PowerUpCollected, StepsBatched
+from snake_game.logic import (
+    StateSnapshot,
+    StepUndo,
+    advance_fixed_steps,
+    advance_one_step,
+    create_initial_state,
+    free_cell_index,
+    queue_direction_change,
+    restore_state,
+    snapshot_state,
+    undo_step,
+)
+from snake_game.systems.powerups import ActivePowerUp, PowerUpSnapshot, PowerUpSystem
+from snake_game.systems.progression import StageProgression
+from snake_game.types import Direction, GameStatus
+
+
+_POWERUP_COLLECTED = PowerUpCollected()
+_STEPS_BATCHED = StepsBatched()
+TURBO_FRAME_SHARE = 0.75
+
+
+@dataclass(slots=True)
+class SessionSnapshot:
+    state: StateSnapshot
+    powerups: PowerUpSnapshot
+    stage: int
+    rng_state: Any
+    tick: int
+    food_eaten: int
+    run_seconds: float
+    death_reason: str
+    shields_used: int
+
+
+@dataclass(slots=True)
+class SessionUndo:
+    step: StepUndo = field(default_factory=StepUndo)
+    powerups: PowerUpSnapshot = (None, ())
+    stage: int = 1
+    tick: int = 0
+    food_eaten: int = 0
+    run_seconds: float = 0.0
+    death_reason: str = ""
+    shields_used: int = 0
+    valid: bool = False
+
+
+class GameSession:
+    def __init__(
+        self,
+        config: GameConfig,
+        settings: UserSettings,
+        seed: int | None = None,
+        powerups_enabled: bool = True,
+        emit: EventEmitter | None = None,
+    ) -> None:
+        self.config = config
+        self.settings = settings
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = random.Random(self.seed)
+        self.state = create_initial_state(config, settings, self.rng)
+        self.powerups = PowerUpSystem()
+        self.progression = StageProgression(points_per_stage=config.stage_points_interval)
+        self.powerups_enabled = powerups_enabled
+        self.emit = emit
+        self.on_tick: Callable[[GameSession], None] | None = None
+        self.controller: Policy | None = None
+        self.turbo = False
+
+        self.tick = 0
+        self.food_eaten = 0
+        self.run_seconds = 0.0
+        self.death_reason = ""
+        self.shields_used = 0
+        self.ate_this_tick = False
+        self.collected_this_tick: ActivePowerUp | None = None
+        self.previous_head = self.state.body.head
+        self.previous_tail = self.state.body.tail
+
+    @property
+    def finished(self) -> bool:
+        return self.state.status == GameStatus.GAME_OVER
+
+    def tick_seconds(self) -> float:
+        return 1.0 / max(0.1, self.state.steps_per_second * max(0.1, self.powerups.speed_multiplier()))
+
+    def interpolation_alpha(self) -> float:
+        if self.turbo or self.state.status == GameStatus.GAME_OVER:
+            return 1.0
+        return min(1.0, self.state.accumulator_seconds / self.tick_seconds())
+
+    def _on_event(self, event: Event) -> None:
+        if event.type == GameEventType.FOOD_EATEN:
+            self.ate_this_tick = True
+        elif isinstance(event, PlayerDied):
+            self.death_reason = event.reason
+        if self.emit is not None:
+            self.emit(event)
+
+    def queue_direction(self, direction: Direction) -> bool:
+        queue_direction_change(self.state, direction)
+        return self.state.pending_direction == direction
+
+    def snapshot(self) -> SessionSnapshot:
+        return SessionSnapshot(
+            state=snapshot_state(self.state),
+            powerups=self.powerups.snapshot(),
+            stage=self.progression.snapshot(),
+            rng_state=self.rng.getstate(),
+            tick=self.tick,
+            food_eaten=self.food_eaten,
+            run_seconds=self.run_seconds,
+            death_reason=self.death_reason,
+            shields_used=self.shields_used,
+        )
+
+    def restore(self, snapshot: SessionSnapshot) -> None:
+        restore_state(self.state, snapshot.state)
+        self.powerups.restore(snapshot.powerups)
+        self.progression.restore(snapshot.stage)
+        self.rng.setstate(snapshot.rng_state)
+        self.tick = snapshot.tick
+        self.food_eaten = snapshot.food_eaten
+        self.run_seconds = snapshot.run_seconds
+        self.death_reason = snapshot.death_reason
+        self.shields_used = snapshot.shields_used
+        self.ate_this_tick = False
+        self.collected_this_tick = None
+        self.previous_head = self.state.body.head
+        self.previous_tail = self.state.body.tail
+
+    def undo(self, record: SessionUndo) -> None:
+        if not record.valid:
+            return
+        undo_step(self.state, record.step, self.rng)
+        self.powerups.restore(record.powerups)
+        self.progression.restore(record.stage)
+        self.tick = record.tick
+        self.food_eaten = record.food_eaten
+        self.run_seconds = record.run_seconds
+        self.death_reason = record.death_reason
+        self.shields_used = record.shields_used
+        self.ate_this_tick = False
+        self.collected_this_tick = None
+        self.previous_head = self.state.body.head
+        self.previous_tail = self.state.body.tail
+        record.valid = False
+
+    def step(self, direction: Direction | None = None, undo: SessionUndo | None = None) -> None:
+        state = self.state
+        if undo is not None:
+            undo.valid = False
+        if state.status != GameStatus.RUNNING:
+            return
+        pending_direction = state.pending_direction
+        if direction is not None:
+            queue_direction_change(state, direction)
+        if undo is not None:
+            undo.powerups = self.powerups.snapshot()
+            undo.stage = self.progression.current_stage
+            undo.tick = self.tick
+            undo.food_eaten = self.food_eaten
+            undo.run_seconds = self.run_seconds
+            undo.death_reason = self.death_reason
+            undo.shields_used = self.shields_used
+            undo.valid = True
+
+        powerups = self.powerups
+        elapsed = self.tick_seconds()
+        self.previous_head = state.body.head
+        self.previous_tail = state.body.tail
+        self.ate_this_tick = False
+        self.collected_this_tick = None
+        self.tick += 1
+        self.run_seconds += elapsed
+
+        step_undo = undo.step if undo is not None else None
+        if not self.powerups_enabled:
+            advance_one_step(state, self.config, self.rng, emit=self._on_event, undo=step_undo)
+        else:
+            powerups.update(elapsed)
+            advance_one_step(
+                state,
+                self.config,
+                self.rng,
+                score_multiplier=powerups.score_multiplier(),
+                phase_active=powerups.phase_active(),
+                emit=self._on_event,
+                undo=step_undo,
+            )
+            if state.status == GameStatus.GAME_OVER and powerups.absorb_fatal_collision(self.death_reason):
+                state.status = GameStatus.RUNNING
+                self.death_reason = ""
+                self.shields_used += 1
+            elif self.ate_this_tick:
+                if state.world is not None:
+                    state.world.focus = state.body.head
+                    powerups.maybe_spawn(
+                        rng=self.rng,
+                        occupied_cells={state.food, *state.body},
+                        grid_width=self.config.grid_width,
+                        grid_height=self.config.grid_height,
+                        free_cells=state.world,
+                    )
+                else:
+                    powerups.maybe_spawn(
+                        rng=self.rng,
+                        occupied_cells={state.food},
+                        grid_width=self.config.grid_width,
+                        grid_height=self.config.grid_height,
+                        free_cells=free_cell_index(state, self.config),
+                    )
+            self.collected_this_tick = powerups.collect_at(state.body.head)
+            if self.collected_this_tick is not None and self.emit is not None:
+                collected = _POWERUP_COLLECTED
+                collected.powerup = self.collected_this_tick.type.value
+                collected.duration_seconds = round(self.collected_this_tick.remaining_seconds, 1)
+                self.emit(collected)
+
+        if step_undo is not None:
+            step_undo.pending_direction = pending_direction
+        if self.ate_this_tick:
+            self.food_eaten += 1
+            self.progression.update_from_score(state.score, emit=self.emit)
+        if self.on_tick is not None:
+            self.on_tick(self)
+
+    def advance(self, delta_seconds: float) -> int:
+        state = self.state
+        if state.status != GameStatus.RUNNING:
+            return 0
+
+        if self.turbo:
+            return self._advance_turbo()
+
+        return advance_fixed_steps(
+            state,
+            self.config,
+            delta_seconds,
+            self.tick_seconds,
+            lambda: self.step(self.controller(state, self.config) if self.controller is not None else None),
+            self.emit,
+        )
+
+    def _advance_turbo(self) -> int:
+        state = self.state
+        config = self.config
+        controller = self.controller
+        state.accumulator_seconds = 0.0
+        deadline = time.perf_counter() + TURBO_FRAME_SHARE / config.render_fps
+        steps_taken = 0
+        food_eaten = 0
+        while steps_taken < config.turbo_steps_per_frame and state.status == GameStatus.RUNNING:
+            self.step(controller(state, config) if controller is not None else None)
+            steps_taken += 1
+            food_eaten += self.ate_this_tick
+            if time.perf_counter() > deadline:
+                break
+
+        if self.emit is not None and steps_taken:
+            batched = _STEPS_BATCHED
+            batched.steps = steps_taken
+            batched.food_eaten = food_eaten
+            batched.score = state.score
+            batched.head_x, batched.head_y = state.body.head
+            self.emit(batched)
+        return steps_taken
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import random
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from snake_game.bots.autopilot import autopilot_policy
+from snake_game.bots.base import Policy
+from snake_game.bots.greedy import greedy_policy
+from snake_game.bots.hamiltonian import hamiltonian_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.persistence import leaderboard_key
+from snake_game.sim.session import GameSession
+from snake_game.types import Difficulty, MapMode
+
+TIMEOUT_REASON = "max_steps"
+
+
+@dataclass(frozen=True, slots=True)
+class GameResult:
+    policy_name: str
+    settings_key: str
+    seed: int
+    score: int
+    steps: int
+    death_reason: str
+
+
+@dataclass(slots=True)
+class TournamentEntry:
+    policy_name: str
+    settings_key: str
+    games: int = 0
+    total_score: int = 0
+    best_score: int = 0
+    total_steps: int = 0
+    death_reasons: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def mean_score(self) -> float:
+        return self.total_score / self.games if self.games else 0.0
+
+    @property
+    def mean_steps(self) -> float:
+        return self.total_steps / self.games if self.games else 0.0
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.total_score += result.score
+        self.best_score = max(self.best_score, result.score)
+        self.total_steps += result.steps
+        self.death_reasons[result.death_reason] = self.death_reasons.get(result.death_reason, 0) + 1
+
+
+@dataclass(slots=True)
+class TournamentReport:
+    entries: dict[tuple[str, str], TournamentEntry] = field(default_factory=dict)
+
+    def add(self, result: GameResult) -> None:
+        key = (result.policy_name, result.settings_key)
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = TournamentEntry(policy_name=result.policy_name, settings_key=result.settings_key)
+            self.entries[key] = entry
+        entry.add(result)
+
+    @property
+    def games(self) -> int:
+        return sum(entry.games for entry in self.entries.values())
+
+    def rows(self) -> list[TournamentEntry]:
+        return sorted(self.entries.values(), key=lambda entry: (entry.settings_key, -entry.mean_score))
+
+    def format_table(self) -> str:
+        lines = [f"{'policy':<16} {'settings':<22} {'games':>6} {'mean':>8} {'best':>6} {'steps':>8}  deaths"]
+        for entry in self.rows():
+            deaths = ", ".join(f"{reason}={count}" for reason, count in sorted(entry.death_reasons.items()))
+            lines.append(
+                f"{entry.policy_name:<16} {entry.settings_key:<22} {entry.games:>6} "
+                f"{entry.mean_score:>8.2f} {entry.best_score:>6} {entry.mean_steps:>8.1f}  {deaths}"
+            )
+        return "\n".join(lines)
+
+
+def settings_grid(
+    difficulties: Iterable[Difficulty] = tuple(Difficulty),
+    map_modes: Iterable[MapMode] = (MapMode.BOUNDED, MapMode.WRAP),
+    obstacles: Iterable[bool] = (False, True),
+) -> list[UserSettings]:
+    return [
+        UserSettings(difficulty=difficulty, map_mode=map_mode, obstacles_enabled=obstacles_enabled, muted=True)
+        for difficulty, map_mode, obstacles_enabled in itertools.product(difficulties, map_modes, obstacles)
+    ]
+
+
+def play_game(
+    policy_name: str,
+    policy: Policy,
+    config: GameConfig,
+    settings: UserSettings,
+    seed: int,
+    max_steps: int,
+) -> GameResult:
+    session = GameSession(config, settings, seed=seed)
+    while not session.finished and session.tick < max_steps:
+        session.step(policy(session.state, config))
+    return GameResult(
+        policy_name=policy_name,
+        settings_key=leaderboard_key(settings),
+        seed=seed,
+        score=session.state.score,
+        steps=session.tick,
+        death_reason=session.death_reason if session.finished else TIMEOUT_REASON,
+    )
+
+
+def _play_batch(
+    policy_name: str,
+    policy: Policy,
+    config: GameConfig,
+    settings: UserSettings,
+    seeds: Sequence[int],
+    max_steps: int,
+) -> list[GameResult]:
+    return [play_game(policy_name, policy, config, settings, seed, max_steps) for seed in seeds]
+
+
+def run_tournament(
+    policies: Mapping[str, Policy],
+    settings: Sequence[UserSettings],
+    games_per_setting: int,
+    config: GameConfig | None = None,
+    base_seed: int = 0,
+    max_steps: int = 20_000,
+    max_workers: int | None = None,
+    batch_size: int = 16,
+    on_result: Callable[[GameResult], None] | None = None,
+) -> TournamentReport:
+    game_config = config or GameConfig()
+    game_config.validate()
+    seed_source = random.Random(base_seed)
+    seeds = [seed_source.getrandbits(63) for _ in range(games_per_setting)]
+    batches = [
+        (name, policy, game_config, combo, seeds[start : start + batch_size], max_steps)
+        for name, policy in policies.items()
+        for combo in settings
+        for start in range(0, len(seeds), batch_size)
+    ]
+
+    report = TournamentReport()
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_play_batch, *batch) for batch in batches]
+        for future in as_completed(futures):
+            for result in future.result():
+                report.add(result)
+                if on_result is not None:
+                    on_result(result)
+    return report
+
+
+BUILTIN_POLICIES: dict[str, Policy] = {
+    "greedy": greedy_policy,
+    "autopilot": autopilot_policy,
+    "hamiltonian": hamiltonian_policy,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Play seeded bot games across a settings grid.")
+    parser.add_argument("--policies", nargs="+", default=list(BUILTIN_POLICIES), choices=sorted(BUILTIN_POLICIES))
+    parser.add_argument("--games", type=int, default=100, help="games per policy and settings combination")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-steps", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    report = run_tournament(
+        {name: BUILTIN_POLICIES[name] for name in args.policies},
+        settings_grid(),
+        games_per_setting=args.games,
+        base_seed=args.seed,
+        max_steps=args.max_steps,
+        max_workers=args.workers,
+    )
+    print(report.format_table())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+
+import numpy as np
+
+from snake_game.config import GameConfig, UserSettings, rules_for_difficulty
+from snake_game.logic import create_initial_state
+from snake_game.state import GameState
+from snake_game.types import Direction, MapMode, Point
+
+ACTIONS: tuple[Direction, ...] = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+ACTION_BY_DIRECTION: dict[Direction, int] = {direction: index for index, direction in enumerate(ACTIONS)}
+NO_ACTION = -1
+
+STATUS_RUNNING = 0
+STATUS_GAME_OVER = 1
+
+DEATH_REASONS: tuple[str, ...] = ("", "wall", "obstacle", "self_collision", "board_full")
+REASON_WALL = 1
+REASON_OBSTACLE = 2
+REASON_SELF_COLLISION = 3
+REASON_BOARD_FULL = 4
+
+_DELTA_X = np.array([0, 0, -1, 1], dtype=np.int64)
+_DELTA_Y = np.array([-1, 1, 0, 0], dtype=np.int64)
+_OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int8)
+
+
+class VecSnake:
+    def __init__(
+        self,
+        num_games: int,
+        config: GameConfig,
+        settings: UserSettings,
+        seed: int | None = None,
+    ) -> None:
+        if num_games < 1:
+            raise ValueError("num_games must be >= 1")
+        if settings.map_mode not in (MapMode.BOUNDED, MapMode.WRAP):
+            raise ValueError(f"Unsupported map mode for batch simulation: {settings.map_mode}")
+
+        self.num_games = num_games
+        self.config = config
+        self.settings = settings
+        self.width = config.grid_width
+        self.height = config.grid_height
+        self.capacity = self.width * self.height
+        self.wrap = settings.map_mode == MapMode.WRAP
+
+        rules = rules_for_difficulty(settings.difficulty)
+        self.base_steps_per_second = rules.base_steps_per_second
+        self.speed_increment_per_food = rules.speed_increment_per_food
+        self.max_steps_per_second = rules.max_steps_per_second
+        self.score_per_food = rules.score_per_food
+
+        self.occupancy = np.zeros((num_games, self.capacity), dtype=bool)
+        self.obstacles = np.zeros((num_games, self.capacity), dtype=bool)
+        self.body = np.zeros((num_games, self.capacity), dtype=np.int64)
+        self.head_index = np.zeros(num_games, dtype=np.int64)
+        self.tail_index = np.zeros(num_games, dtype=np.int64)
+        self.length = np.zeros(num_games, dtype=np.int64)
+        self.food = np.zeros(num_games, dtype=np.int64)
+        self.direction = np.zeros(num_games, dtype=np.int8)
+        self.scores = np.zeros(num_games, dtype=np.int64)
+        self.steps = np.zeros(num_games, dtype=np.int64)
+        self.steps_per_second = np.zeros(num_games, dtype=np.float64)
+        self.status = np.zeros(num_games, dtype=np.int8)
+        self.death_reason = np.zeros(num_games, dtype=np.int8)
+
+        self._rng = np.random.default_rng(seed)
+        self._seed_source = random.Random(seed)
+
+    @property
+    def occupancy_grid(self) -> np.ndarray:
+        return self.occupancy.reshape(self.num_games, self.height, self.width)
+
+    @property
+    def obstacle_grid(self) -> np.ndarray:
+        return self.obstacles.reshape(self.num_games, self.height, self.width)
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.status != STATUS_RUNNING
+
+    def reset(self, seeds: Sequence[int] | None = None) -> None:
+        if seeds is not None and len(seeds) != self.num_games:
+            raise ValueError("seeds must provide one entry per game")
+        for game in range(self.num_games):
+            seed = seeds[game] if seeds is not None else self._seed_source.getrandbits(63)
+            state = create_initial_state(self.config, self.settings, random.Random(seed))
+            self.load_state(game, state)
+
+    def load_state(self, game: int, state: GameState) -> None:
+        cells = [self._flat(cell) for cell in state.snake]
+        length = len(cells)
+        self.occupancy[game].fill(False)
+        self.obstacles[game].fill(False)
+        for cell in cells:
+            self.occupancy[game, cell] = True
+        for cell in state.obstacles:
+            self.obstacles[game, self._flat(cell)] = True
+        self.body[game, :length] = cells[::-1]
+        self.tail_index[game] = 0
+        self.head_index[game] = length - 1
+        self.length[game] = length
+        self.food[game] = self._flat(state.food)
+        self.direction[game] = ACTION_BY_DIRECTION[state.direction]
+        self.scores[game] = state.score
+        self.steps[game] = 0
+        self.steps_per_second[game] = state.steps_per_second
+        self.status[game] = STATUS_RUNNING
+        self.death_reason[game] = 0
+
+    def _flat(self, cell: Point) -> int:
+        return cell[1] * self.width + cell[0]
+
+    def _point(self, flat: int) -> Point:
+        y, x = divmod(int(flat), self.width)
+        return (x, y)
+
+    def snake(self, game: int) -> list[Point]:
+        length = int(self.length[game])
+        head = int(self.head_index[game])
+        slots = (head - np.arange(length)) % self.capacity
+        return [self._point(flat) for flat in self.body[game, slots]]
+
+    def food_position(self, game: int) -> Point:
+        return self._point(self.food[game])
+
+    def death_reason_label(self, game: int) -> str:
+        return DEATH_REASONS[int(self.death_reason[game])]
+
+    def step(self, actions: np.ndarray | Sequence[int]) -> None:
+        requested = np.asarray(actions, dtype=np.int8)
+        running = self.status == STATUS_RUNNING
+
+        turning = running & (requested >= 0)
+        turning &= requested != _OPPOSITE[self.direction]
+        self.direction[turning] = requested[turning]
+
+        games = np.flatnonzero(running)
+        if games.size == 0:
+            return
+
+        heads = self.body[games, self.head_index[games]]
+        tails = self.body[games, self.tail_index[games]]
+        moves = self.direction[games]
+        new_x = heads % self.width + _DELTA_X[moves]
+        new_y = heads // self.width + _DELTA_Y[moves]
+
+        if self.wrap:
+            new_x %= self.width
+            new_y %= self.height
+            hit_wall = np.zeros(games.size, dtype=bool)
+        else:
+            hit_wall = (new_x < 0) | (new_x >= self.width) | (new_y < 0) | (new_y >= self.height)
+        new_heads = np.where(hit_wall, 0, new_y * self.width + new_x)
+
+        hit_obstacle = ~hit_wall & self.obstacles[games, new_heads]
+        grows = ~hit_wall & (new_heads == self.food[games])
+        hit_self = ~hit_wall & ~hit_obstacle & self.occupancy[games, new_heads] & (grows | (new_heads != tails))
+
+        dead = hit_wall | hit_obstacle | hit_self
+        if dead.any():
+            reasons = np.where(hit_wall, REASON_WALL, np.where(hit_obstacle, REASON_OBSTACLE, REASON_SELF_COLLISION))
+            self.status[games[dead]] = STATUS_GAME_OVER
+            self.death_reason[games[dead]] = reasons[dead]
+
+        alive = ~dead
+        movers = games[alive]
+        new_heads = new_heads[alive]
+        grows = grows[alive]
+
+        shrinkers = movers[~grows]
+        self.occupancy[shrinkers, tails[alive][~grows]] = False
+        self.tail_index[shrinkers] = (self.tail_index[shrinkers] + 1) % self.capacity
+
+        self.head_index[movers] = (self.head_index[movers] + 1) % self.capacity
+        self.body[movers, self.head_index[movers]] = new_heads
+        self.occupancy[movers, new_heads] = True
+        self.steps[movers] += 1
+
+        eaters = movers[grows]
+        if eaters.size:
+            self.length[eaters] += 1
+            self.scores[eaters] += self.score_per_food
+            self.steps_per_second[eaters] = np.minimum(
+                self.max_steps_per_second,
+                self.steps_per_second[eaters] + self.speed_increment_per_food,
+            )
+            self._spawn_food(eaters)
+
+    def _spawn_food(self, games: np.ndarray) -> None:
+        free = ~(self.occupancy[games] | self.obstacles[games])
+        counts = free.sum(axis=1)
+        full = counts == 0
+        if full.any():
+            self.status[games[full]] = STATUS_GAME_OVER
+            self.death_reason[games[full]] = REASON_BOARD_FULL
+
+        picks = (self._rng.random(games.size) * counts).astype(np.int64)
+        chosen = np.argmax(np.cumsum(free, axis=1) > picks[:, None], axis=1)
+        open_games = ~full
+        self.food[games[open_games]] = chosen[open_games]
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from snake_game.config import GameConfig
+from snake_game.persistence import leaderboard_key
+from snake_game.sim.replay import Replay, ReplayDesyncError, ReplayFormatError, run_replay
+
+DEFAULT_MAX_TICKS = 1_000_000
+DEFAULT_BATCH_SIZE = 16
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationRequest:
+    id: int
+    replay: bytes
+    claimed_score: int
+    leaderboard_key: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class VerificationResult:
+    id: int
+    accepted: bool
+    claimed_score: int
+    simulated_score: int | None
+    steps: int
+    reason: str = ""
+
+
+@dataclass(slots=True)
+class VerificationReport:
+    accepted: int = 0
+    rejected: int = 0
+    steps: int = 0
+    elapsed_seconds: float = 0.0
+    reasons: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def runs(self) -> int:
+        return self.accepted + self.rejected
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def runs_per_minute(self) -> float:
+        return 60.0 * self.runs / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def add(self, result: VerificationResult) -> None:
+        self.steps += result.steps
+        if result.accepted:
+            self.accepted += 1
+            return
+        self.rejected += 1
+        self.reasons[result.reason] = self.reasons.get(result.reason, 0) + 1
+
+    def format_summary(self) -> str:
+        lines = [
+            f"{self.runs} runs: {self.accepted} accepted, {self.rejected} rejected",
+            f"{self.steps_per_second:,.0f} steps/s, {self.runs_per_minute:,.0f} runs/min",
+        ]
+        lines.extend(f"  {reason}: {count}" for reason, count in sorted(self.reasons.items()))
+        return "\n".join(lines)
+
+
+def _reject(request: VerificationRequest, reason: str) -> VerificationResult:
+    return VerificationResult(request.id, False, request.claimed_score, None, 0, reason)
+
+
+def verify_run(
+    request: VerificationRequest,
+    config: GameConfig | None = None,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+) -> VerificationResult:
+    config = config or GameConfig()
+    try:
+        replay = Replay.from_bytes(request.replay)
+    except ReplayFormatError as error:
+        return _reject(request, f"malformed replay: {error}")
+    if request.leaderboard_key is not None and leaderboard_key(replay.settings) != request.leaderboard_key:
+        return _reject(request, "settings do not match the leaderboard")
+    if (replay.grid_width, replay.grid_height, replay.obstacle_count) != (
+        config.grid_width,
+        config.grid_height,
+        config.obstacle_count,
+    ):
+        return _reject(request, "board does not match the server configuration")
+    if replay.final_score != request.claimed_score:
+        return _reject(request, "claimed score does not match the replay")
+    if replay.final_tick > max_ticks:
+        return _reject(request, "replay is too long")
+
+    try:
+        session = run_replay(replay, config)
+    except ReplayDesyncError as error:
+        return _reject(request, f"desync: {error}")
+    except Exception as error:
+        return _reject(request, f"invalid replay: {error!r}")
+    return VerificationResult(request.id, True, request.claimed_score, session.state.score, session.tick)
+
+
+def verify_batch(
+    requests: Sequence[VerificationRequest],
+    config: GameConfig | None = None,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+) -> list[VerificationResult]:
+    return [verify_run(request, config, max_ticks) for request in requests]
+
+
+def verify_stream(
+    requests: Iterable[VerificationRequest],
+    max_workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    config: GameConfig | None = None,
+    max_ticks: int = DEFAULT_MAX_TICKS,
+) -> Iterator[VerificationResult]:
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    max_in_flight = workers * 2
+    source = iter(requests)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: dict[Future[list[VerificationResult]], list[VerificationRequest]] = {}
+        while True:
+            while len(in_flight) < max_in_flight:
+                batch = list(itertools.islice(source, batch_size))
+                if not batch:
+                    break
+                in_flight[executor.submit(verify_batch, batch, config, max_ticks)] = batch
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = in_flight.pop(future)
+                try:
+                    results = future.result()
+                except Exception as error:
+                    results = [_reject(request, f"verifier failed: {error!r}") for request in batch]
+                yield from results
+
+
+def verify_all(
+    requests: Iterable[VerificationRequest],
+    max_workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    config: GameConfig | None = None,
+) -> tuple[list[VerificationResult], VerificationReport]:
+    report = VerificationReport()
+    results: list[VerificationResult] = []
+    started = time.perf_counter()
+    for result in verify_stream(requests, max_workers=max_workers, batch_size=batch_size, config=config):
+        report.add(result)
+        results.append(result)
+    report.elapsed_seconds = time.perf_counter() - started
+    return results, report
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Re-simulate recorded replays and check their claimed scores.")
+    parser.add_argument("paths", nargs="+", type=Path, help="replay files or directories of .snkr files")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    files = [
+        replay_path
+        for path in args.paths
+        for replay_path in (sorted(path.glob("*.snkr")) if path.is_dir() else [path])
+    ]
+    requests = []
+    for index, replay_path in enumerate(files):
+        data = replay_path.read_bytes()
+        try:
+            claimed_score = Replay.from_bytes(data).final_score
+        except ReplayFormatError:
+            claimed_score = -1
+        requests.append(VerificationRequest(index, data, claimed_score))
+
+    results, report = verify_all(requests, max_workers=args.workers, batch_size=args.batch_size)
+    for result in sorted(results, key=lambda item: item.id):
+        if not result.accepted:
+            print(f"rejected {files[result.id]}: {result.reason}")
+    print(report.format_summary())
+
+
+if __name__ == "__main__":
+    main()
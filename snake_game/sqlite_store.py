@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    seq INTEGER PRIMARY KEY,
+    leaderboard_key TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    stage INTEGER NOT NULL,
+    food_eaten INTEGER NOT NULL,
+    run_seconds REAL NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leaderboards (
+    leaderboard_key TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    run_seq INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_key_score ON runs (leaderboard_key, score);
+CREATE INDEX IF NOT EXISTS leaderboards_by_key_score ON leaderboards (leaderboard_key, score);
+"""
+
+_TOP_SCORES_BY_KEY = """
+SELECT leaderboard_key, score FROM (
+    SELECT
+        leaderboard_key,
+        score,
+        ROW_NUMBER() OVER (PARTITION BY leaderboard_key ORDER BY score DESC) AS position
+    FROM leaderboards
+)
+WHERE ? IS NULL OR position <= ?
+ORDER BY leaderboard_key, score DESC
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class RunRow:
+    seq: int
+    leaderboard_key: str
+    score: int
+    stage: int
+    food_eaten: int
+    run_seconds: float
+    played_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class RunStanding:
+    rank: int
+    runs: int
+    top: tuple[int, ...]
+
+
+@dataclass(slots=True)
+class StoreContents:
+    payload: dict[str, object] | None
+    leaderboard: dict[str, list[int]] = field(default_factory=dict)
+    unsnapshotted: list[RunRow] = field(default_factory=list)
+
+
+def is_sqlite_path(path: Path) -> bool:
+    return path.suffix.lower() in SQLITE_SUFFIXES
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=5.0)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+@contextmanager
+def _transaction(path: Path) -> Iterator[sqlite3.Connection]:
+    with closing(connect(path)) as connection, connection:
+        yield connection
+
+
+def _write_meta(connection: sqlite3.Connection, payload: dict[str, object]) -> None:
+    snapshot = {key: value for key, value in payload.items() if key != "leaderboard"}
+    connection.execute(
+        "INSERT INTO meta (key, value) VALUES ('payload', ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+        (json.dumps(snapshot),),
+    )
+
+
+def read_contents(path: Path, limit: int | None) -> StoreContents:
+    with _transaction(path) as connection:
+        row = connection.execute("SELECT value FROM meta WHERE key = 'payload'").fetchone()
+        if row is None:
+            return StoreContents(payload=None)
+        payload = json.loads(row[0])
+        contents = StoreContents(payload=payload if isinstance(payload, dict) else {})
+        for key, score in connection.execute(_TOP_SCORES_BY_KEY, (limit, limit)):
+            contents.leaderboard.setdefault(key, []).append(score)
+        snapshot_seq = contents.payload.get("journal_seq", 0)
+        if not isinstance(snapshot_seq, int):
+            snapshot_seq = 0
+        rows = connection.execute("SELECT * FROM runs WHERE seq > ? ORDER BY seq", (snapshot_seq,))
+        contents.unsnapshotted = [RunRow(*row) for row in rows]
+    return contents
+
+
+def write_payload(payload: dict[str, object], path: Path) -> None:
+    with _transaction(path) as connection:
+        _write_meta(connection, payload)
+
+
+def import_payload(payload: dict[str, object], path: Path) -> None:
+    leaderboard = payload.get("leaderboard")
+    rows = []
+    if isinstance(leaderboard, dict):
+        rows = [(key, score) for key, scores in leaderboard.items() for score in scores]
+    with _transaction(path) as connection:
+        connection.execute("DELETE FROM leaderboards WHERE run_seq IS NULL")
+        connection.executemany("INSERT INTO leaderboards (leaderboard_key, score) VALUES (?, ?)", rows)
+        _write_meta(connection, payload)
+
+
+def append_runs(path: Path, runs: Iterable[RunRow]) -> None:
+    with _transaction(path) as connection:
+        for run in runs:
+            inserted = connection.execute(
+                "INSERT OR IGNORE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    run.seq,
+                    run.leaderboard_key,
+                    run.score,
+                    run.stage,
+                    run.food_eaten,
+                    run.run_seconds,
+                    run.played_at,
+                ),
+            )
+            if inserted.rowcount:
+                connection.execute(
+                    "INSERT INTO leaderboards (leaderboard_key, score, run_seq) VALUES (?, ?, ?)",
+                    (run.leaderboard_key, run.score, run.seq),
+                )
+
+
+def run_standing(path: Path, key: str, score: int, top: int) -> RunStanding:
+    with closing(connect(path)) as connection:
+        (better,) = connection.execute(
+            "SELECT COUNT(*) FROM leaderboards WHERE leaderboard_key = ? AND score > ?",
+            (key, score),
+        ).fetchone()
+        (runs,) = connection.execute("SELECT COUNT(*) FROM leaderboards WHERE leaderboard_key = ?", (key,)).fetchone()
+        rows = connection.execute(
+            "SELECT score FROM leaderboards WHERE leaderboard_key = ? ORDER BY score DESC LIMIT ?",
+            (key, top),
+        )
+        scores = sorted([score, *(value for (value,) in rows)], reverse=True)
+    return RunStanding(rank=better + 1, runs=runs + 1, top=tuple(scores[:top]))
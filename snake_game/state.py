@@ -1,11 +1,175 @@
+import random
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
+from snake_game.systems.world import ChunkedWorld
 from snake_game.types import Difficulty, Direction, GameStatus, MapMode, Point
 
 
+class SnakeBody:
+    __slots__ = ("_segments", "_cells")
+
+    def __init__(self, cells: Iterable[Point] = ()) -> None:
+        self._segments: deque[Point] = deque(cells)
+        self._cells: set[Point] = set(self._segments)
+
+    @property
+    def head(self) -> Point:
+        return self._segments[0]
+
+    @property
+    def tail(self) -> Point:
+        return self._segments[-1]
+
+    def push_head(self, cell: Point) -> None:
+        self._segments.appendleft(cell)
+        self._cells.add(cell)
+
+    def pop_tail(self) -> Point:
+        cell = self._segments.pop()
+        self._cells.discard(cell)
+        return cell
+
+    def pop_head(self) -> Point:
+        cell = self._segments.popleft()
+        self._cells.discard(cell)
+        return cell
+
+    def push_tail(self, cell: Point) -> None:
+        self._segments.append(cell)
+        self._cells.add(cell)
+
+    def copy(self) -> "SnakeBody":
+        return SnakeBody(self._segments)
+
+    def __contains__(self, cell: object) -> bool:
+        return cell in self._cells
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self._segments)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __getitem__(self, index: int) -> Point:
+        return self._segments[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SnakeBody):
+            return self._segments == other._segments
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SnakeBody({list(self._segments)!r})"
+
+
+class FreeCellIndex:
+    __slots__ = ("width", "height", "_cells", "_positions")
+
+    def __init__(self, width: int, height: int, occupied: Iterable[Point] = ()) -> None:
+        self.width = width
+        self.height = height
+        self._cells = array("i", range(width * height))
+        self._positions = array("i", range(width * height))
+        for cell in occupied:
+            self.take(cell)
+
+    def _flat(self, cell: Point) -> int:
+        x, y = cell
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return -1
+
+    def take(self, cell: Point) -> int:
+        flat = self._flat(cell)
+        if flat < 0:
+            return -1
+        slot = self._positions[flat]
+        if slot < 0:
+            return -1
+        last = self._cells.pop()
+        if last != flat:
+            self._cells[slot] = last
+            self._positions[last] = slot
+        self._positions[flat] = -1
+        return slot
+
+    def release(self, cell: Point) -> bool:
+        flat = self._flat(cell)
+        if flat < 0 or self._positions[flat] >= 0:
+            return False
+        self._positions[flat] = len(self._cells)
+        self._cells.append(flat)
+        return True
+
+    def reinsert(self, cell: Point, slot: int) -> None:
+        flat = self._flat(cell)
+        if flat < 0 or self._positions[flat] >= 0:
+            return
+        if slot >= len(self._cells):
+            self._positions[flat] = len(self._cells)
+            self._cells.append(flat)
+            return
+        moved = self._cells[slot]
+        self._positions[moved] = len(self._cells)
+        self._cells.append(moved)
+        self._cells[slot] = flat
+        self._positions[flat] = slot
+
+    def copy(self) -> "FreeCellIndex":
+        clone = FreeCellIndex.__new__(FreeCellIndex)
+        clone.width = self.width
+        clone.height = self.height
+        clone._cells = array("i", self._cells)
+        clone._positions = array("i", self._positions)
+        return clone
+
+    def copy_from(self, other: "FreeCellIndex") -> None:
+        self.width = other.width
+        self.height = other.height
+        self._cells[:] = other._cells
+        self._positions[:] = other._positions
+
+    def sample(self, rng: random.Random) -> Point:
+        y, x = divmod(rng.choice(self._cells), self.width)
+        return (x, y)
+
+    def pop_random(self, rng: random.Random) -> Point:
+        cell = self.sample(rng)
+        self.take(cell)
+        return cell
+
+    def sample_excluding(self, rng: random.Random, excluded: Iterable[Point]) -> Point | None:
+        reserved: list[tuple[Point, int]] = []
+        for cell in sorted(excluded):
+            slot = self.take(cell)
+            if slot >= 0:
+                reserved.append((cell, slot))
+        chosen = self.sample(rng) if self._cells else None
+        for cell, slot in reversed(reserved):
+            self.reinsert(cell, slot)
+        return chosen
+
+    def __contains__(self, cell: object) -> bool:
+        if not isinstance(cell, tuple):
+            return False
+        flat = self._flat(cell)
+        return flat >= 0 and self._positions[flat] >= 0
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FreeCellIndex):
+            return self.width == other.width and self.height == other.height and self._cells == other._cells
+        return NotImplemented
+
+
 @dataclass(slots=True)
 class GameState:
-    snake: list[Point]
+    body: SnakeBody
     direction: Direction
     pending_direction: Direction | None
     food: Point
@@ -17,5 +181,25 @@ class GameState:
     score_per_food: int
     difficulty: Difficulty
     map_mode: MapMode
-    obstacles: set[Point]
+    obstacle_cells: set[Point]
     accumulator_seconds: float
+    free_cells: FreeCellIndex | None = None
+    world: ChunkedWorld | None = None
+
+    @property
+    def snake(self) -> SnakeBody:
+        return self.body
+
+    @snake.setter
+    def snake(self, cells: Iterable[Point]) -> None:
+        self.body = cells if isinstance(cells, SnakeBody) else SnakeBody(cells)
+        self.free_cells = None
+
+    @property
+    def obstacles(self) -> set[Point]:
+        return self.obstacle_cells
+
+    @obstacles.setter
+    def obstacles(self, cells: Iterable[Point]) -> None:
+        self.obstacle_cells = set(cells)
+        self.free_cells = None
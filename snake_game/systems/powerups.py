@@ -4,6 +4,8 @@ import random
 from dataclasses import dataclass, field
 from enum import Enum
 
+from snake_game.state import FreeCellIndex
+from snake_game.systems.world import ChunkedWorld
 from snake_game.types import Point
 
 
@@ -37,6 +39,12 @@ class ActivePowerUp:
     remaining_seconds: float
 
 
+type PowerUpSnapshot = tuple[
+    tuple[PowerUpType, Point, float] | None,
+    tuple[tuple[PowerUpType, float], ...],
+]
+
+
 @dataclass(slots=True)
 class PowerUpSystem:
     spawn_chance_per_food: float = 0.30
@@ -66,6 +74,7 @@ class PowerUpSystem:
         occupied_cells: set[Point],
         grid_width: int,
         grid_height: int,
+        free_cells: FreeCellIndex | ChunkedWorld | None = None,
     ) -> SpawnedPowerUp | None:
         if self.spawned is not None:
             return None
@@ -74,17 +83,13 @@ class PowerUpSystem:
         if rng.random() > self.spawn_chance_per_food:
             return None
 
-        candidates = [
-            (x, y)
-            for y in range(grid_height)
-            for x in range(grid_width)
-            if (x, y) not in occupied_cells
-        ]
-        if not candidates:
+        if free_cells is None:
+            free_cells = FreeCellIndex(grid_width, grid_height, occupied=occupied_cells)
+        chosen_position = free_cells.sample_excluding(rng, occupied_cells)
+        if chosen_position is None:
             return None
 
         chosen_type = rng.choice(list(self.available_spawn_types))
-        chosen_position = rng.choice(candidates)
         self.spawned = SpawnedPowerUp(
             type=chosen_type,
             position=chosen_position,
@@ -92,6 +97,18 @@ class PowerUpSystem:
         )
         return self.spawned
 
+    def snapshot(self) -> PowerUpSnapshot:
+        spawned = self.spawned
+        return (
+            (spawned.type, spawned.position, spawned.remaining_seconds) if spawned is not None else None,
+            tuple((effect.type, effect.remaining_seconds) for effect in self.active_effects),
+        )
+
+    def restore(self, snapshot: PowerUpSnapshot) -> None:
+        spawned, effects = snapshot
+        self.spawned = SpawnedPowerUp(*spawned) if spawned is not None else None
+        self.active_effects = [ActivePowerUp(power_type, remaining) for power_type, remaining in effects]
+
     def collect_at(self, cell: Point) -> ActivePowerUp | None:
         if self.spawned is None or self.spawned.position != cell:
             return None
@@ -117,7 +134,10 @@ class PowerUpSystem:
         return False
 
     def is_active(self, power_type: PowerUpType) -> bool:
-        return any(effect.type == power_type for effect in self.active_effects)
+        for effect in self.active_effects:
+            if effect.type == power_type:
+                return True
+        return False
 
     def absorb_fatal_collision(self, reason: str) -> bool:
         if reason not in {"wall", "obstacle", "self_collision"}:
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from snake_game.events import EventEmitter, GameEvent, GameEventType
+from snake_game.events import EventEmitter, StageAdvanced
+
+_STAGE_ADVANCED = StageAdvanced()
 
 
 @dataclass(slots=True)
@@ -10,6 +12,12 @@ class StageProgression:
     points_per_stage: int
     current_stage: int = 1
 
+    def snapshot(self) -> int:
+        return self.current_stage
+
+    def restore(self, snapshot: int) -> None:
+        self.current_stage = snapshot
+
     def stage_for_score(self, score: int) -> int:
         return max(1, (score // self.points_per_stage) + 1)
 
@@ -21,11 +29,9 @@ class StageProgression:
         for stage in range(self.current_stage + 1, target_stage + 1):
             self.current_stage = stage
             if emit is not None:
-                emit(
-                    GameEvent(
-                        type=GameEventType.STAGE_ADVANCED,
-                        payload={"stage": stage, "score": score},
-                    )
-                )
+                event = _STAGE_ADVANCED
+                event.stage = stage
+                event.score = score
+                emit(event)
         return True
 
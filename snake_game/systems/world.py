@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import random
+from collections import OrderedDict
+from collections.abc import Container, Iterator
+
+from snake_game.types import Point
+
+DEFAULT_CHUNK_SIZE = 16
+DEFAULT_MAX_CHUNKS = 256
+DEFAULT_SPAWN_RADIUS = 12
+
+
+class ChunkedWorld:
+    __slots__ = (
+        "seed",
+        "chunk_size",
+        "obstacles_per_chunk",
+        "max_chunks",
+        "safe_center",
+        "safe_radius",
+        "spawn_radius",
+        "focus",
+        "generated_chunks",
+        "_chunks",
+        "_last_key",
+        "_last_chunk",
+    )
+
+    def __init__(
+        self,
+        seed: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        obstacles_per_chunk: int = 3,
+        max_chunks: int = DEFAULT_MAX_CHUNKS,
+        safe_center: Point = (0, 0),
+        safe_radius: int = 2,
+        spawn_radius: int = DEFAULT_SPAWN_RADIUS,
+    ) -> None:
+        if chunk_size < 1 or max_chunks < 1:
+            raise ValueError("chunk_size and max_chunks must be >= 1")
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.obstacles_per_chunk = obstacles_per_chunk
+        self.max_chunks = max_chunks
+        self.safe_center = safe_center
+        self.safe_radius = safe_radius
+        self.spawn_radius = spawn_radius
+        self.focus = safe_center
+        self.generated_chunks = 0
+        self._chunks: OrderedDict[tuple[int, int], frozenset[Point]] = OrderedDict()
+        self._last_key: tuple[int, int] | None = None
+        self._last_chunk: frozenset[Point] = frozenset()
+
+    @property
+    def cached_chunks(self) -> int:
+        return len(self._chunks)
+
+    def chunk_key(self, cell: Point) -> tuple[int, int]:
+        return (cell[0] // self.chunk_size, cell[1] // self.chunk_size)
+
+    def chunk(self, key: tuple[int, int]) -> frozenset[Point]:
+        if key == self._last_key:
+            return self._last_chunk
+        chunks = self._chunks
+        cells = chunks.get(key)
+        if cells is None:
+            cells = self._generate(key)
+            chunks[key] = cells
+            if len(chunks) > self.max_chunks:
+                chunks.popitem(last=False)
+        else:
+            chunks.move_to_end(key)
+        self._last_key = key
+        self._last_chunk = cells
+        return cells
+
+    def _generate(self, key: tuple[int, int]) -> frozenset[Point]:
+        self.generated_chunks += 1
+        chunk_x, chunk_y = key
+        size = self.chunk_size
+        rng = random.Random(f"{self.seed}:{chunk_x}:{chunk_y}")
+        safe_x, safe_y = self.safe_center
+        cells: set[Point] = set()
+        for _ in range(self.obstacles_per_chunk):
+            x = chunk_x * size + rng.randrange(size)
+            y = chunk_y * size + rng.randrange(size)
+            if abs(x - safe_x) <= self.safe_radius and abs(y - safe_y) <= self.safe_radius:
+                continue
+            cells.add((x, y))
+        return frozenset(cells)
+
+    def __contains__(self, cell: object) -> bool:
+        if not isinstance(cell, tuple):
+            return False
+        return cell in self.chunk(self.chunk_key(cell))
+
+    def obstacles_in(self, left: int, top: int, width: int, height: int) -> Iterator[Point]:
+        right = left + width
+        bottom = top + height
+        first_x, first_y = self.chunk_key((left, top))
+        last_x, last_y = self.chunk_key((right - 1, bottom - 1))
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                for cell in self.chunk((chunk_x, chunk_y)):
+                    if left <= cell[0] < right and top <= cell[1] < bottom:
+                        yield cell
+
+    def sample_excluding(self, rng: random.Random, excluded: Container[Point], attempts: int = 64) -> Point | None:
+        focus_x, focus_y = self.focus
+        radius = self.spawn_radius
+        for _ in range(attempts):
+            cell = (focus_x + rng.randint(-radius, radius), focus_y + rng.randint(-radius, radius))
+            if cell != self.focus and cell not in excluded and cell not in self:
+                return cell
+        return None
@@ -33,6 +33,7 @@ class Difficulty(Enum):
 class MapMode(Enum):
     BOUNDED = "bounded"
     WRAP = "wrap"
+    OPEN = "open"
 
     @property
     def label(self) -> str:
@@ -43,6 +44,7 @@ class SceneId(Enum):
     MENU = "menu"
     SETTINGS = "settings"
     PLAY = "play"
+    DEMO = "demo"
     GAME_OVER = "game_over"
 
 
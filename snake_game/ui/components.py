@@ -17,6 +17,20 @@ def draw_text_center(
     screen.blit(surface, rect)
 
 
+def build_panel_surface(
+    size: tuple[int, int],
+    fill: Color,
+    border: Color,
+    alpha: int = 170,
+    radius: int = 14,
+) -> pygame.Surface:
+    overlay = pygame.Surface(size, pygame.SRCALPHA)
+    bounds = overlay.get_rect()
+    pygame.draw.rect(overlay, (*fill, alpha), bounds, border_radius=radius)
+    pygame.draw.rect(overlay, border, bounds, width=2, border_radius=radius)
+    return overlay
+
+
 def draw_panel(
     screen: pygame.Surface,
     rect: pygame.Rect,
@@ -25,10 +39,7 @@ def draw_panel(
     alpha: int = 170,
     radius: int = 14,
 ) -> None:
-    overlay = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(overlay, (*fill, alpha), pygame.Rect(0, 0, rect.width, rect.height), border_radius=radius)
-    pygame.draw.rect(overlay, border, pygame.Rect(0, 0, rect.width, rect.height), width=2, border_radius=radius)
-    screen.blit(overlay, rect.topleft)
+    screen.blit(build_panel_surface(rect.size, fill, border, alpha, radius), rect.topleft)
 
 
 def draw_scene_header(
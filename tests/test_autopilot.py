@@ -0,0 +1,106 @@
+from collections import deque
+
+from snake_game.bots.autopilot import UNREACHABLE, AutopilotPolicy, DistanceField
+from snake_game.bots.base import is_safe_move
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.session import GameSession
+from snake_game.sim.tournament import play_game
+from snake_game.state import SnakeBody
+from snake_game.types import Direction, MapMode, Point
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=300, window_height=240, cell_size=20, obstacle_count=10)
+    config.validate()
+    return config
+
+
+def reference_distances(width: int, height: int, wrap: bool, target: Point, obstacles: set[Point]) -> list[int]:
+    distances = [UNREACHABLE] * (width * height)
+    distances[target[1] * width + target[0]] = 0
+    queue = deque([target])
+    while queue:
+        x, y = queue.popleft()
+        for move_x, move_y in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            next_x, next_y = x + move_x, y + move_y
+            if wrap:
+                next_x %= width
+                next_y %= height
+            elif not (0 <= next_x < width and 0 <= next_y < height):
+                continue
+            flat = next_y * width + next_x
+            if (next_x, next_y) in obstacles or distances[flat] != UNREACHABLE:
+                continue
+            distances[flat] = distances[y * width + x] + 1
+            queue.append((next_x, next_y))
+    return distances
+
+
+def test_budgeted_search_matches_full_bfs() -> None:
+    obstacles = {(3, 0), (3, 1), (3, 2), (3, 3), (7, 5), (8, 5)}
+    for wrap in (False, True):
+        field = DistanceField(12, 9, wrap)
+        field.update((1, 1), obstacles)
+        head = 8 * 12 + 11
+        steps = 0
+        while not field.settle(head, 5):
+            steps += 1
+        assert steps > 1
+        assert field.settle(3, 10_000)
+        assert not field.queue
+        assert field.distances == reference_distances(12, 9, wrap, (1, 1), obstacles)
+
+
+def test_autopilot_only_makes_safe_moves_and_searches_once_per_food() -> None:
+    config = make_config()
+    policy = AutopilotPolicy()
+    session = GameSession(config, UserSettings(obstacles_enabled=True), seed=5, powerups_enabled=False)
+    foods = 1
+    while not session.finished and session.tick < 3000:
+        direction = policy(session.state, config)
+        safe = [candidate for candidate in Direction if is_safe_move(session.state, config, candidate)]
+        assert direction in safe if safe else direction is None
+        session.step(direction)
+        foods += session.ate_this_tick
+    assert policy.searches <= foods
+
+
+def test_autopilot_outscores_greedy() -> None:
+    config = make_config()
+    for map_mode in (MapMode.BOUNDED, MapMode.WRAP):
+        settings = UserSettings(map_mode=map_mode, obstacles_enabled=True)
+        autopilot_total = sum(
+            play_game("autopilot", AutopilotPolicy(), config, settings, seed, 5000).score for seed in range(4)
+        )
+        greedy_total = sum(play_game("greedy", greedy_policy, config, settings, seed, 5000).score for seed in range(4))
+        assert autopilot_total > greedy_total
+
+
+def test_session_controller_drives_realtime_advance() -> None:
+    config = make_config()
+    session = GameSession(config, UserSettings(map_mode=MapMode.WRAP), seed=2)
+    session.controller = AutopilotPolicy()
+    for _ in range(600):
+        session.advance(1 / 60)
+    assert session.tick > 0
+    assert session.food_eaten > 0
+
+
+def test_body_tracking_rebuilds_for_a_new_snake() -> None:
+    field = DistanceField(12, 9, False)
+    field.track_body(SnakeBody([(5, 5), (4, 5), (3, 5)]))
+    field.track_body(SnakeBody([(6, 5), (5, 5), (5, 6)]))
+
+    assert field.body_bits == sum(1 << (y * 12 + x) for x, y in ((6, 5), (5, 5), (5, 6)))
+
+    config = make_config()
+    width = config.grid_width
+    policy = AutopilotPolicy()
+    for seed in range(3):
+        session = GameSession(config, UserSettings(), seed=seed, powerups_enabled=False)
+        while not session.finished and session.tick < 200:
+            direction = policy(session.state, config)
+            assert policy.field is not None
+            assert policy.field.body_bits == sum(1 << (y * width + x) for x, y in session.state.body)
+            session.step(direction)
@@ -0,0 +1,48 @@
+import random
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.logic import create_initial_state
+from snake_game.rendering.camera import Viewport, follow_viewport, visible_cells
+from snake_game.sim.session import GameSession
+
+
+def test_board_size_overrides_window_grid() -> None:
+    config = GameConfig(board_width=1000, board_height=600)
+    config.validate()
+    assert (config.grid_width, config.grid_height) == (1000, 600)
+    assert (config.view_width, config.view_height) == (40, 30)
+
+    state = create_initial_state(config, UserSettings(obstacles_enabled=True), random.Random(1))
+    assert state.snake.head == (500, 300)
+    assert all(0 <= x < 1000 and 0 <= y < 600 for x, y in state.obstacles)
+
+
+def test_viewport_follows_focus_and_clamps_to_board() -> None:
+    assert follow_viewport((500, 300), 1000, 600, 40, 30) == Viewport(480, 285, 40, 30)
+    assert follow_viewport((3, 2), 1000, 600, 40, 30) == Viewport(0, 0, 40, 30)
+    assert follow_viewport((999, 599), 1000, 600, 40, 30) == Viewport(960, 570, 40, 30)
+    assert follow_viewport((10, 10), 20, 15, 40, 30) == Viewport(0, 0, 20, 15)
+
+
+def test_visible_cells_matches_a_full_filter_either_way() -> None:
+    rng = random.Random(4)
+    viewport = Viewport(10, 5, 6, 4)
+    for count in (8, 5000):
+        cells = {(rng.randrange(40), rng.randrange(30)) for _ in range(count)}
+        expected = {cell for cell in cells if viewport.contains(cell)}
+        assert set(visible_cells(cells, viewport)) == expected
+
+
+def test_session_exposes_the_previous_step_for_interpolation() -> None:
+    config = GameConfig(window_width=200, window_height=160, cell_size=20)
+    config.validate()
+    session = GameSession(config, UserSettings(), seed=1, powerups_enabled=False)
+    head = session.state.body.head
+    tail = session.state.body.tail
+    assert session.interpolation_alpha() == 0.0
+
+    session.advance(session.tick_seconds() * 1.5)
+    assert session.previous_head == head
+    assert session.previous_tail == tail
+    assert session.state.body[1] == head
+    assert 0.49 < session.interpolation_alpha() < 0.51
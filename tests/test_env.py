@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from snake_game.config import GameConfig, UserSettings  # noqa: E402
+from snake_game.sim.env import (  # noqa: E402
+    PLANE_BODY,
+    PLANE_FOOD,
+    PLANE_HEAD,
+    PLANE_OBSTACLES,
+    PLANE_POWERUPS,
+    SnakeEnv,
+)
+from snake_game.sim.vec import NO_ACTION  # noqa: E402
+from snake_game.types import MapMode  # noqa: E402
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=200, window_height=160, cell_size=20, obstacle_count=6)
+    config.validate()
+    return config
+
+
+def expected_observation(env: SnakeEnv) -> np.ndarray:
+    expected = np.zeros_like(env.observation)
+    state = env.state
+    assert state is not None
+    for x, y in state.snake:
+        expected[PLANE_BODY, y, x] = 1
+    expected[PLANE_HEAD, state.snake.head[1], state.snake.head[0]] = 1
+    expected[PLANE_FOOD, state.food[1], state.food[0]] = 1
+    for x, y in state.obstacles:
+        expected[PLANE_OBSTACLES, y, x] = 1
+    if env.powerups.spawned is not None:
+        x, y = env.powerups.spawned.position
+        expected[PLANE_POWERUPS, y, x] = 1
+    return expected
+
+
+def test_observation_planes_track_state_incrementally() -> None:
+    config = make_config()
+    env = SnakeEnv(config, UserSettings(map_mode=MapMode.WRAP, obstacles_enabled=True), seed=4)
+    buffer = env.reset()
+    action_rng = random.Random(5)
+
+    for _ in range(400):
+        observation, _, done = env.step(action_rng.choice([NO_ACTION, NO_ACTION, 0, 1, 2, 3]))
+        assert observation is buffer
+        np.testing.assert_array_equal(observation, expected_observation(env))
+        if done:
+            env.reset()
+
+
+def test_food_reward_and_death_flag() -> None:
+    config = make_config()
+    env = SnakeEnv(config, UserSettings(map_mode=MapMode.BOUNDED), seed=1, powerups_enabled=False)
+    env.reset()
+    assert env.state is not None
+    head_x, head_y = env.state.snake.head
+    env.state.food = (head_x + 1, head_y)
+
+    _, reward, done = env.step(NO_ACTION)
+    assert reward == pytest.approx(1.0)
+    assert done is False
+
+    total = 0.0
+    while not done:
+        _, reward, done = env.step(NO_ACTION)
+        total += reward
+    assert total == pytest.approx(-1.0)
+    assert env.death_reason == "wall"
+
+
+def test_max_steps_truncates_episode() -> None:
+    env = SnakeEnv(make_config(), UserSettings(map_mode=MapMode.WRAP), seed=2, max_steps=3)
+    env.reset()
+    dones = [env.step(NO_ACTION)[2] for _ in range(3)]
+    assert dones == [False, False, True]
+    with pytest.raises(RuntimeError):
+        env.step(NO_ACTION)
+
+
+def test_external_observation_buffer_is_validated() -> None:
+    config = make_config()
+    with pytest.raises(ValueError):
+        SnakeEnv(config, UserSettings(), observation=np.zeros((5, 2, 2), dtype=np.uint8))
@@ -1,8 +1,10 @@
 import random
 
+from snake_game.bots.greedy import greedy_policy
 from snake_game.config import GameConfig, UserSettings
 from snake_game.events import EventBus, GameEvent, GameEventType
 from snake_game.logic import advance_one_step, advance_simulation, create_initial_state
+from snake_game.sim.session import GameSession
 from snake_game.systems.progression import StageProgression
 from snake_game.types import Direction
 
@@ -83,3 +85,89 @@ def test_advance_simulation_emits_step_head_position() -> None:
     assert step_events
     assert "head_x" in step_events[0].payload
     assert "head_y" in step_events[0].payload
+
+
+def test_event_bus_dispatches_by_type_to_subscribers() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(3))
+    state.food = (0, 0)
+    bus = EventBus()
+    steps: list[tuple[int, int]] = []
+    bus.subscribe(GameEventType.STEP_ADVANCED, lambda event: steps.append((event.head_x, event.head_y)))
+
+    rng = random.Random(3)
+    for _ in range(3):
+        advance_simulation(state, config, delta_seconds=0.2, rng=rng, emit=bus.emit)
+
+    assert len(steps) > 1
+    assert steps[-1] == state.snake.head
+    assert len(set(steps)) == len(steps)
+    assert bus.drain() == []
+
+
+def test_drained_events_are_copies_of_the_pooled_instances() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(3))
+    state.food = (0, 0)
+    bus = EventBus()
+    seen: list[object] = []
+    rng = random.Random(3)
+    for _ in range(2):
+        advance_simulation(state, config, delta_seconds=0.2, rng=rng, emit=seen.append)
+    for _ in range(3):
+        advance_simulation(state, config, delta_seconds=0.2, rng=rng, emit=bus.emit)
+
+    assert seen[0] is seen[1]
+    events = [event for event in bus.drain() if event.type == GameEventType.STEP_ADVANCED]
+    assert len(events) > 1
+    assert len({tuple(event.payload.items()) for event in events}) == len(events)
+
+
+def test_turbo_session_coalesces_steps_into_one_summary() -> None:
+    config = GameConfig(window_width=400, window_height=400, cell_size=20, turbo_steps_per_frame=200)
+    config.validate()
+    bus = EventBus()
+    session = GameSession(config, UserSettings(), seed=4, powerups_enabled=False, emit=bus.emit)
+    session.controller = greedy_policy
+    session.turbo = True
+
+    steps = session.advance(0.0)
+    events = bus.drain()
+
+    assert 1 < steps <= 200
+    assert GameEventType.STEP_ADVANCED not in {event.type for event in events}
+    batches = [event for event in events if event.type == GameEventType.STEPS_BATCHED]
+    eaten = [event for event in events if event.type == GameEventType.FOOD_EATEN]
+    assert len(batches) == 1
+    assert batches[0].payload["steps"] == steps == session.tick
+    assert batches[0].payload["food_eaten"] == len(eaten) == session.food_eaten > 0
+    assert (batches[0].payload["head_x"], batches[0].payload["head_y"]) == session.state.body.head
+
+
+def test_event_bus_queues_unhandled_types_alongside_subscribers() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(3))
+    state.food = (0, 0)
+    bus = EventBus()
+    steps: list[int] = []
+    bus.subscribe(GameEventType.STEP_ADVANCED, lambda event: steps.append(event.score))
+
+    advance_simulation(state, config, delta_seconds=0.2, rng=random.Random(3), emit=bus.emit)
+    bus.emit(GameEvent(type=GameEventType.PLAYER_DIED, payload={"reason": "wall"}))
+
+    assert steps
+    assert [(event.type, event.payload) for event in bus.drain()] == [
+        (GameEventType.PLAYER_DIED, {"reason": "wall"})
+    ]
+
+
+def test_event_bus_without_queueing_drops_unhandled_types() -> None:
+    bus = EventBus(queue_unhandled=False)
+    handled: list[GameEventType] = []
+    bus.subscribe(GameEventType.FOOD_EATEN, lambda event: handled.append(event.type))
+
+    bus.emit(GameEvent(type=GameEventType.FOOD_EATEN))
+    bus.emit(GameEvent(type=GameEventType.PLAYER_DIED))
+
+    assert handled == [GameEventType.FOOD_EATEN]
+    assert bus.drain() == []
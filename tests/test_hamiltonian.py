@@ -0,0 +1,113 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from snake_game.bots import hamiltonian
+from snake_game.bots.hamiltonian import HamiltonianPolicy, build_cycle, load_cycle
+from snake_game.config import GameConfig, UserSettings
+from snake_game.logic import restore_state, snapshot_state
+from snake_game.sim.session import GameSession
+from snake_game.types import Direction, MapMode
+
+
+@pytest.mark.parametrize(("width", "height"), [(8, 8), (9, 8), (8, 9), (40, 30)])
+def test_build_cycle_visits_every_cell_through_adjacent_steps(width: int, height: int) -> None:
+    order = list(build_cycle(width, height))
+    assert sorted(order) == list(range(width * height))
+    for current, following in zip(order, order[1:] + order[:1]):
+        delta_x = abs(current % width - following % width)
+        delta_y = abs(current // width - following // width)
+        assert delta_x + delta_y == 1
+
+
+def test_build_cycle_rejects_odd_by_odd_grids() -> None:
+    with pytest.raises(ValueError):
+        build_cycle(9, 9)
+
+
+def test_cycles_are_cached_on_disk(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hamiltonian, "_CYCLES", {})
+    first = load_cycle(10, 8, tmp_path)
+    assert (tmp_path / "10x8.cycle").exists()
+
+    monkeypatch.setattr(hamiltonian, "_CYCLES", {})
+    monkeypatch.setattr(hamiltonian, "build_cycle", lambda width, height: pytest.fail("cycle was recomputed"))
+    assert load_cycle(10, 8, tmp_path).order == first.order
+
+
+def test_corrupt_cycle_file_is_rebuilt(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hamiltonian, "_CYCLES", {})
+    (tmp_path / "10x8.cycle").write_bytes(b"\x01\x02\x03")
+    assert list(load_cycle(10, 8, tmp_path).order) == list(build_cycle(10, 8))
+
+
+@pytest.mark.parametrize("mutate", ["duplicate", "out_of_range", "swapped"])
+def test_same_length_cycle_file_that_is_not_hamiltonian_is_rebuilt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mutate: str
+) -> None:
+    monkeypatch.setattr(hamiltonian, "_CYCLES", {})
+    order = build_cycle(10, 8)
+    if mutate == "duplicate":
+        order[5] = order[6]
+    elif mutate == "out_of_range":
+        order[5] = 10_000
+    else:
+        order[5], order[40] = order[40], order[5]
+    (tmp_path / "10x8.cycle").write_bytes(order.tobytes())
+
+    assert list(load_cycle(10, 8, tmp_path).order) == list(build_cycle(10, 8))
+
+
+@pytest.mark.parametrize(("width", "height", "map_mode"), [(8, 8, MapMode.BOUNDED), (9, 8, MapMode.WRAP)])
+def test_solver_fills_the_board(tmp_path: Path, width: int, height: int, map_mode: MapMode) -> None:
+    config = GameConfig(window_width=width * 20, window_height=height * 20, cell_size=20)
+    session = GameSession(config, UserSettings(map_mode=map_mode), seed=3, powerups_enabled=False)
+    policy = HamiltonianPolicy(tmp_path)
+    while not session.finished and session.tick < 10_000:
+        session.step(policy(session.state, config))
+    assert session.death_reason == "board_full"
+    assert len(session.state.body) == width * height
+
+
+def test_solver_falls_back_to_autopilot_with_obstacles(tmp_path: Path) -> None:
+    config = GameConfig(window_width=200, window_height=160, cell_size=20, obstacle_count=4)
+    session = GameSession(config, UserSettings(obstacles_enabled=True), seed=1)
+    assert HamiltonianPolicy(tmp_path)(session.state, config) is not None
+
+
+def test_one_policy_instance_fills_the_board_in_consecutive_games(tmp_path: Path) -> None:
+    config = GameConfig(window_width=160, window_height=160, cell_size=20)
+    policy = HamiltonianPolicy(tmp_path)
+    for seed in range(6):
+        session = GameSession(config, UserSettings(), seed=seed, powerups_enabled=False)
+        while not session.finished and session.tick < 10_000:
+            session.step(policy(session.state, config))
+        assert session.death_reason == "board_full"
+
+
+def test_cycle_direction_is_not_carried_over_to_the_next_game(tmp_path: Path) -> None:
+    config = GameConfig(window_width=160, window_height=160, cell_size=20)
+    policy = HamiltonianPolicy(tmp_path)
+    first = GameSession(config, UserSettings(), seed=0, powerups_enabled=False)
+    policy(first.state, config)
+
+    cycle = load_cycle(8, 8, tmp_path)
+    size = len(cycle.order)
+    last_head = cycle.position(first.state.body.head)
+    body = tuple(divmod(cycle.order[(last_head + offset) % size], 8)[::-1] for offset in range(-1, 32))
+    vector = (body[0][0] - body[1][0], body[0][1] - body[1][1])
+    second = GameSession(config, UserSettings(), seed=1, powerups_enabled=False)
+    restore_state(
+        second.state,
+        replace(
+            snapshot_state(second.state),
+            body=body,
+            direction=next(direction for direction in Direction if direction.vector == vector),
+            food=divmod(cycle.order[(last_head + 40) % size], 8)[::-1],
+            free_cells=None,
+        ),
+    )
+    while not second.finished and second.tick < 10_000:
+        second.step(policy(second.state, config))
+    assert second.death_reason == "board_full"
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from snake_game.config import UserSettings
+from snake_game.journal import RECORD_SIZE, RunRecord, append_records, journal_path, read_records
+from snake_game.persistence import (
+    PersistentData,
+    apply_run_record,
+    leaderboard_key,
+    load_persistent_data,
+    next_run_record,
+    save_persistent_data,
+)
+from snake_game.save_writer import SaveWriter
+from snake_game.types import Difficulty, MapMode
+
+HARD_WRAP = UserSettings(difficulty=Difficulty.HARD, map_mode=MapMode.WRAP, obstacles_enabled=True)
+
+
+def play_runs(data: PersistentData, path: Path, scores: list[int]) -> None:
+    for score in scores:
+        record = next_run_record(data, HARD_WRAP, score, limit=10)
+        apply_run_record(data, record)
+        append_records(journal_path(path), [record])
+
+
+def test_run_record_round_trips_and_rejects_corruption() -> None:
+    record = RunRecord(seq=41, settings=HARD_WRAP, score=123, limit=10)
+    data = record.to_bytes()
+    assert len(data) == RECORD_SIZE
+    assert RunRecord.from_bytes(data) == record
+    assert RunRecord.from_bytes(data[:-1] + bytes([data[-1] ^ 1])) is None
+
+
+def test_load_replays_the_journal_tail_after_the_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    data = PersistentData()
+    play_runs(data, path, [5, 9])
+    save_persistent_data(data, path)
+    assert journal_path(path).read_bytes() == b""
+
+    play_runs(data, path, [30, 2])
+    loaded = load_persistent_data(path)
+
+    assert loaded.journal_seq == 4
+    assert loaded.leaderboard[leaderboard_key(HARD_WRAP)] == [30, 9, 5, 2]
+    assert loaded.stats.total_runs == 4
+    assert loaded.stats.best_score_global == 30
+
+
+def test_torn_journal_tail_is_dropped_and_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    play_runs(PersistentData(), path, [7, 8])
+    journal = journal_path(path)
+    with journal.open("ab") as handle:
+        handle.write(RunRecord(seq=3, settings=HARD_WRAP, score=99, limit=10).to_bytes()[:-5])
+
+    loaded = load_persistent_data(path)
+
+    assert loaded.leaderboard[leaderboard_key(HARD_WRAP)] == [8, 7]
+    records, clean = read_records(journal)
+    assert clean
+    assert [record.seq for record in records] == [1, 2]
+
+
+def test_append_cost_does_not_grow_with_history(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    data = PersistentData(leaderboard={f"key{index}": list(range(10, 0, -1)) for index in range(500)})
+    save_persistent_data(data, path)
+    snapshot_size = path.stat().st_size
+
+    play_runs(data, path, [1, 2, 3])
+
+    assert path.stat().st_size == snapshot_size
+    assert journal_path(path).stat().st_size == 3 * RECORD_SIZE
+
+
+def test_save_writer_orders_snapshots_and_journal_appends(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    writer = SaveWriter(path, coalesce_seconds=0.0)
+    data = PersistentData()
+    for score in (4, 6):
+        record = next_run_record(data, HARD_WRAP, score, limit=10)
+        apply_run_record(data, record)
+        writer.append(record)
+    writer.request(data)
+    record = next_run_record(data, HARD_WRAP, 11, limit=10)
+    apply_run_record(data, record)
+    writer.append(record)
+    writer.close()
+
+    records, clean = read_records(journal_path(path))
+    assert clean
+    assert [record.seq for record in records] == [3]
+    loaded = load_persistent_data(path)
+    assert loaded.leaderboard[leaderboard_key(HARD_WRAP)] == [11, 6, 4]
+    assert loaded.journal_seq == 3
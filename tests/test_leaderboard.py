@@ -0,0 +1,61 @@
+import random
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.leaderboard import Leaderboard
+from snake_game.persistence import PersistentData, best_score_for_settings, leaderboard_key, record_score
+
+
+def test_inserts_keep_descending_order_and_report_rank() -> None:
+    board = Leaderboard([5, 20])
+    assert board.insert(10) == 2
+    assert board.insert(10) == 3
+    assert board.insert(25) == 1
+    assert list(board) == [25, 20, 10, 10, 5]
+    assert board[1:3] == [20, 10]
+    assert board.best == 25
+
+
+def test_rank_percentile_and_top_queries() -> None:
+    board = Leaderboard([40, 30, 30, 20, 10])
+    assert board.rank_of(30) == 2
+    assert board.rank_of(35) == 2
+    assert board.rank_of(0) == 6
+    assert board.count_below(30) == 2
+    assert board.percentile(30) == 40.0
+    assert board.percentile(50) == 100.0
+    assert Leaderboard().percentile(10) == 0.0
+    assert board.top(2) == [40, 30]
+
+
+def test_retention_limit_trims_lowest_scores() -> None:
+    board = Leaderboard([1, 2, 3], limit=3)
+    assert board.insert(0) is None
+    assert board.insert(4) == 1
+    assert board == [4, 3, 2]
+    board.set_limit(2)
+    assert board == [4, 3]
+    board.set_limit(None)
+    board.insert(0)
+    assert len(board) == 3
+
+
+def test_large_tables_match_a_sorted_list() -> None:
+    rng = random.Random(4)
+    scores = [rng.randrange(10_000) for _ in range(100_000)]
+    board = Leaderboard(scores[:50_000])
+    for score in scores[50_000:]:
+        board.insert(score)
+    expected = sorted(scores, reverse=True)
+    assert board.top(100) == expected[:100]
+    assert board.rank_of(expected[5_000]) == expected.index(expected[5_000]) + 1
+    assert len(board) == 100_000
+
+
+def test_unlimited_retention_from_config() -> None:
+    config = GameConfig(leaderboard_limit=None)
+    config.validate()
+    data = PersistentData()
+    for score in range(50):
+        record_score(data, UserSettings(), score, config.leaderboard_limit)
+    assert len(data.leaderboard[leaderboard_key(UserSettings())]) == 50
+    assert best_score_for_settings(data, UserSettings()) == 49
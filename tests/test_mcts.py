@@ -0,0 +1,75 @@
+import random
+
+from snake_game.bots.mcts import MCTSPolicy, merge_stats, search_packed, shutdown_executors
+from snake_game.config import GameConfig, UserSettings
+from snake_game.logic import create_initial_state
+from snake_game.sim.codec import pack_state, unpack_state
+from snake_game.sim.session import GameSession
+from snake_game.types import Direction, MapMode
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=240, window_height=200, cell_size=20, obstacle_count=8)
+    config.validate()
+    return config
+
+
+def test_packed_state_round_trips() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(map_mode=MapMode.WRAP, obstacles_enabled=True), random.Random(3))
+    state.pending_direction = Direction.UP
+    state.score = 17
+    state.steps_per_second = 9.35
+
+    restored, width, height = unpack_state(pack_state(state, config))
+    assert (width, height) == (config.grid_width, config.grid_height)
+    assert list(restored.body) == list(state.body)
+    assert restored.obstacle_cells == state.obstacle_cells
+    for name in ("direction", "pending_direction", "food", "score", "status", "steps_per_second", "map_mode"):
+        assert getattr(restored, name) == getattr(state, name)
+
+
+def test_search_leaves_the_state_untouched_and_reports_visits() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(obstacles_enabled=True), random.Random(1))
+    packed = pack_state(state, config)
+    stats = search_packed(packed, time_budget=0.02, seed=4)
+    assert sum(visits for visits, _ in stats) > 0
+    assert stats[list(Direction).index(Direction.LEFT)] == (0, 0.0)
+
+
+def test_policy_turns_away_from_a_wall() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(2))
+    head_y = state.snake.head[1]
+    state.snake = [(config.grid_width - 1, head_y), (config.grid_width - 2, head_y), (config.grid_width - 3, head_y)]
+    state.food = (0, 0)
+    policy = MCTSPolicy(time_budget=0.02, workers=1)
+    assert policy(state, config) in (Direction.UP, Direction.DOWN)
+
+
+def test_root_parallel_workers_merge_statistics() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(5))
+    policy = MCTSPolicy(time_budget=0.01, workers=2)
+    try:
+        assert policy(state, config) is not None
+    finally:
+        shutdown_executors()
+    assert sum(visits for visits, _ in policy.last_stats) > 0
+    assert merge_stats([[(1, 0.5)] * 4, [(2, 1.0)] * 4]) == [(3, 1.5)] * 4
+
+
+def test_next_tick_search_is_submitted_ahead_and_reused() -> None:
+    config = make_config()
+    session = GameSession(config, UserSettings(), seed=4)
+    policy = MCTSPolicy(time_budget=0.005, workers=2)
+    try:
+        for _ in range(20):
+            direction = policy(session.state, config)
+            if direction is not None:
+                session.queue_direction(direction)
+            session.step()
+    finally:
+        shutdown_executors()
+    assert policy.pipelined >= 15
@@ -0,0 +1,110 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from snake_game.net.client import LeaderboardClient
+from snake_game.net.protocol import ProtocolError
+from snake_game.net.server import LeaderboardServer, append_scores, read_scores
+
+
+def test_handle_message_answers_from_in_memory_indexes(tmp_path: Path) -> None:
+    server = LeaderboardServer(tmp_path, flush_batch=3)
+    for score in (10, 30, 20):
+        server.handle_message({"op": "submit", "key": "easy|wrap|obs", "score": score})
+
+    assert server.handle_message({"op": "top", "key": "easy|wrap|obs", "count": 2}) == {"ok": True, "scores": [30, 20]}
+    rank = server.handle_message({"op": "rank", "key": "easy|wrap|obs", "score": 25})
+    assert (rank["rank"], rank["size"]) == (2, 3)
+    assert server.handle_message({"op": "top", "key": "hard|wrap|obs", "count": 5})["scores"] == []
+    assert len(server.pending) == 3
+    with pytest.raises(ProtocolError):
+        server.handle_message({"op": "submit", "key": "easy|wrap|obs", "score": -1})
+    with pytest.raises(ProtocolError):
+        server.handle_message({"op": "drop", "key": "easy|wrap|obs"})
+
+
+def test_clients_share_one_leaderboard_and_writes_are_batched(tmp_path: Path) -> None:
+    async def scenario() -> tuple[list[int], int]:
+        server = LeaderboardServer(tmp_path, flush_seconds=60.0)
+        port = await server.start(port=0)
+        clients = [await LeaderboardClient.connect(port=port) for _ in range(20)]
+        await asyncio.gather(*(client.submit("normal|bounded|clear", index) for index, client in enumerate(clients)))
+        with pytest.raises(ProtocolError):
+            await clients[0].submit("", 5)
+        top = await clients[1].top("normal|bounded|clear", 3)
+        assert (await clients[2].rank("normal|bounded|clear", 18)).rank == 2
+        for client in clients:
+            await client.close()
+        await server.close()
+        return top, server.flushes
+
+    top, flushes = asyncio.run(scenario())
+
+    assert top == [19, 18, 17]
+    assert flushes == 1
+    assert len(read_scores(tmp_path / "scores.log")) == 20
+    restarted = LeaderboardServer(tmp_path)
+    restarted.load()
+    assert restarted.boards["normal|bounded|clear"].top(1) == [19]
+
+
+def test_torn_score_log_tail_is_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "scores.log"
+    append_scores(path, [("easy|wrap|obs", 1, ""), ("hard|open|clear", 2, "a1")])
+    with path.open("ab") as handle:
+        handle.write(b"easy|wrap|obs\t9")
+
+    assert read_scores(path) == [("easy|wrap|obs", 1, ""), ("hard|open|clear", 2, "a1")]
+    append_scores(path, [("easy|wrap|obs", 3, "")])
+    assert read_scores(path) == [("easy|wrap|obs", 1, ""), ("hard|open|clear", 2, "a1"), ("easy|wrap|obs", 3, "")]
+
+
+def test_unknown_keys_are_refused_and_never_reach_the_log(tmp_path: Path) -> None:
+    server = LeaderboardServer(tmp_path)
+    for key in ("a\tb", "x\nnormal|bounded|clear\t999999\ny", "normal|bounded", "", ["easy|wrap|obs"]):
+        with pytest.raises(ProtocolError):
+            server.handle_message({"op": "submit", "key": key, "score": 5})
+
+    assert server.pending == []
+    assert server.boards == {}
+    with (tmp_path / "scores.log").open("ab") as handle:
+        handle.write(b"bogus\t999999\nnormal|bounded|clear\t7\n")
+    assert read_scores(tmp_path / "scores.log") == [("normal|bounded|clear", 7, "")]
+
+
+def test_failed_flush_keeps_acknowledged_scores(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    server = LeaderboardServer(tmp_path)
+    server.handle_message({"op": "submit", "key": "easy|wrap|obs", "score": 4})
+
+    def disk_full(path: Path, entries: list[tuple[str, int, str]]) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("snake_game.net.server.append_scores", disk_full)
+    with pytest.raises(OSError):
+        asyncio.run(server.flush())
+    server.handle_message({"op": "submit", "key": "easy|wrap|obs", "score": 6})
+    assert server.pending == [("easy|wrap|obs", 4, ""), ("easy|wrap|obs", 6, "")]
+
+    monkeypatch.undo()
+    asyncio.run(server.flush())
+    assert server.pending == []
+    assert read_scores(tmp_path / "scores.log") == [("easy|wrap|obs", 4, ""), ("easy|wrap|obs", 6, "")]
+
+
+def test_resubmitted_ids_are_counted_once_across_restarts(tmp_path: Path) -> None:
+    server = LeaderboardServer(tmp_path)
+    submit = {"op": "submit", "key": "hard|wrap|clear", "score": 40, "id": "0f3c"}
+    first = server.handle_message(submit)
+    again = server.handle_message(submit)
+    asyncio.run(server.flush())
+
+    restarted = LeaderboardServer(tmp_path)
+    restarted.load()
+    after_restart = restarted.handle_message(submit)
+
+    assert first == {"ok": True, "rank": 1, "size": 1}
+    assert again == after_restart == {"ok": True, "rank": 1, "size": 1, "duplicate": True}
+    assert len(restarted.boards["hard|wrap|clear"]) == 1
+    with pytest.raises(ProtocolError):
+        server.handle_message({**submit, "id": "x\ty"})
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from snake_game.net.client import submit_batch
+from snake_game.net.outbox import RemoteRank, ScoreOutbox, read_outbox
+from snake_game.net.protocol import ProtocolError
+from snake_game.net.server import LeaderboardServer
+
+
+@pytest.fixture
+def server_port(tmp_path: Path) -> Iterator[int]:
+    loop = asyncio.new_event_loop()
+    server = LeaderboardServer(tmp_path / "server")
+    port = loop.run_until_complete(server.start(port=0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield port
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def offline_send(entries: object) -> list:
+    raise ConnectionRefusedError("leaderboard server is down")
+
+
+def wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_submissions_are_sent_in_the_background_and_ranks_arrive(tmp_path: Path, server_port: int) -> None:
+    outbox = ScoreOutbox.for_server(tmp_path, "127.0.0.1", server_port)
+    first = outbox.submit("easy|wrap|obs", 40)
+    second = outbox.submit("easy|wrap|obs", 90)
+
+    wait_for(lambda: outbox.result(second) is not None)
+    outbox.close()
+
+    assert outbox.result(first) == RemoteRank(rank=1, size=1)
+    assert outbox.result(second) == RemoteRank(rank=1, size=2)
+    assert outbox.sent == 2
+    assert read_outbox(tmp_path / "outbox.jsonl") == []
+
+
+def test_unreachable_server_keeps_submissions_on_disk_with_backoff(tmp_path: Path) -> None:
+    calls: list[float] = []
+
+    def failing_send(entries: object) -> list:
+        calls.append(time.monotonic())
+        return offline_send(entries)
+
+    outbox = ScoreOutbox(tmp_path / "outbox.jsonl", failing_send, backoff_seconds=0.05)
+    started = time.monotonic()
+    submission_id = outbox.submit("hard|bounded|clear", 12)
+    assert time.monotonic() - started < 0.05
+    wait_for(lambda: len(calls) >= 3)
+    outbox.close()
+
+    assert outbox.result(submission_id) is None
+    assert outbox.pending == 1
+    assert calls[1] - calls[0] >= 0.025
+    assert calls[2] - calls[1] >= 0.05
+    assert [(item.key, item.score) for item in read_outbox(tmp_path / "outbox.jsonl")] == [("hard|bounded|clear", 12)]
+
+
+def test_queued_submissions_are_resent_after_restart(tmp_path: Path, server_port: int) -> None:
+    offline = ScoreOutbox(tmp_path / "outbox.jsonl", offline_send)
+    offline.submit("normal|wrap|clear", 5)
+    offline.submit("normal|wrap|clear", 7)
+    wait_for(lambda: offline.failures > 0)
+    offline.close()
+
+    online = ScoreOutbox.for_server(tmp_path, "127.0.0.1", server_port)
+    wait_for(lambda: online.sent == 2)
+    latest = online.submit("normal|wrap|clear", 6)
+    wait_for(lambda: online.result(latest) is not None)
+    online.close()
+
+    assert online.result(latest) == RemoteRank(rank=2, size=3)
+
+
+def test_batch_resent_after_a_lost_ack_is_not_counted_twice(tmp_path: Path, server_port: int) -> None:
+    path = tmp_path / "outbox.jsonl"
+    acked: list[object] = []
+
+    def crash_after_ack(entries: object) -> list:
+        acked.extend(submit_batch("127.0.0.1", server_port, entries))  # type: ignore[arg-type]
+        raise ConnectionResetError("connection dropped before the outbox was rewritten")
+
+    lossy = ScoreOutbox(path, crash_after_ack)
+    lossy.submit("easy|open|obs", 70)
+    wait_for(lambda: lossy.failures > 0)
+    lossy.close()
+
+    resumed = ScoreOutbox.for_server(tmp_path, "127.0.0.1", server_port)
+    wait_for(lambda: resumed.sent == 1)
+    latest = resumed.submit("easy|open|obs", 10)
+    wait_for(lambda: resumed.result(latest) is not None)
+    resumed.close()
+
+    assert len(acked) == 1
+    assert resumed.result(latest) == RemoteRank(rank=2, size=2)
+
+
+def test_malformed_responses_do_not_stop_the_outbox(tmp_path: Path) -> None:
+    responses = [[{"ok": True, "rank": 1, "size": "lots"}], [{"ok": True, "rank": 3, "size": 9}]]
+    outbox = ScoreOutbox(tmp_path / "outbox.jsonl", lambda entries: responses.pop(0), backoff_seconds=0.01)
+    submission_id = outbox.submit("normal|open|clear", 8)
+    wait_for(lambda: outbox.result(submission_id) is not None)
+    outbox.close()
+
+    assert outbox.failures == 0
+    assert isinstance(outbox.last_error, ProtocolError)
+    assert outbox.result(submission_id) == RemoteRank(rank=3, size=9)
+
+
+def test_rejected_submissions_get_a_terminal_result(tmp_path: Path, server_port: int) -> None:
+    outbox = ScoreOutbox.for_server(tmp_path, "127.0.0.1", server_port)
+    bad = outbox.submit("nope|wrap|obs", 5)
+    good = outbox.submit("easy|wrap|obs", 5)
+    wait_for(lambda: outbox.result(good) is not None)
+    outbox.close()
+
+    rejected = outbox.result(bad)
+    assert rejected is not None and rejected.rank is None and rejected.error
+    assert (outbox.sent, outbox.rejected) == (1, 1)
+    assert read_outbox(tmp_path / "outbox.jsonl") == []
+
+
+def test_legacy_entries_keep_the_id_assigned_on_first_load(tmp_path: Path) -> None:
+    path = tmp_path / "outbox.jsonl"
+    path.write_text('{"id": 1, "key": "easy|wrap|obs", "score": 12}\n', encoding="utf-8")
+
+    first = ScoreOutbox(path, offline_send, backoff_seconds=60.0)
+    first.close()
+    assigned = read_outbox(path)
+    second = ScoreOutbox(path, offline_send, backoff_seconds=60.0)
+    second.close()
+
+    assert len(assigned) == 1 and assigned[0].uuid
+    assert read_outbox(path) == assigned
@@ -1,7 +1,13 @@
 import json
+import sqlite3
+import struct
+import threading
 from pathlib import Path
 
+import pytest
+
 from snake_game.config import GraphicsSettings, UserSettings
+from snake_game.leaderboard import Leaderboard
 from snake_game.persistence import (
     SAVE_SCHEMA_VERSION,
     best_score_for_settings,
@@ -9,10 +15,14 @@ from snake_game.persistence import (
     is_new_high_score,
     leaderboard_key,
     load_persistent_data,
+    persistent_payload,
     record_score,
     save_persistent_data,
+    snapshot_persistent_data,
     update_run_stats,
+    write_save_payload,
 )
+from snake_game.save_writer import SaveWriter
 from snake_game.types import Difficulty, MapMode, ThemeId
 
 
@@ -89,7 +99,7 @@ def test_best_score_for_settings_returns_zero_when_empty() -> None:
 def test_best_score_for_settings_returns_top_score() -> None:
     settings = UserSettings(difficulty=Difficulty.HARD, map_mode=MapMode.WRAP, obstacles_enabled=True)
     key = leaderboard_key(settings)
-    data = PersistentData(settings=UserSettings(), leaderboard={key: [25, 19, 4]})
+    data = PersistentData(settings=UserSettings(), leaderboard={key: Leaderboard([25, 19, 4])})
     assert best_score_for_settings(data, settings) == 25
 
 
@@ -174,3 +184,155 @@ def test_onboarding_flag_round_trip(tmp_path: Path) -> None:
     save_persistent_data(data, path)
     loaded = load_persistent_data(path)
     assert loaded.onboarding_seen is True
+
+
+def test_save_writes_atomically_without_leaving_temp_files(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "save.json"
+    save_persistent_data(PersistentData(onboarding_seen=True), path)
+    save_persistent_data(PersistentData(onboarding_seen=False), path)
+
+    assert [entry.name for entry in path.parent.iterdir()] == ["save.json"]
+    assert load_persistent_data(path).onboarding_seen is False
+
+
+def test_save_writer_coalesces_bursts_into_one_write(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    writer = SaveWriter(path, coalesce_seconds=5.0)
+    data = PersistentData()
+    for score in range(1, 40):
+        record_score(data, UserSettings(), score, limit=10)
+        writer.request(data)
+    writer.flush()
+
+    assert writer.requests == 39
+    assert writer.writes == 1
+    assert load_persistent_data(path).leaderboard[leaderboard_key(UserSettings())][0] == 39
+
+    data.onboarding_seen = True
+    writer.request(data)
+    writer.close()
+    assert writer.writes == 2
+    assert load_persistent_data(path).onboarding_seen is True
+
+
+def test_save_writer_survives_failed_writes_and_retries(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    errors: list[Exception] = [sqlite3.OperationalError("database is locked"), struct.error("bad value")]
+
+    def flaky_write(payload: dict[str, object], target: Path) -> None:
+        if errors:
+            raise errors.pop(0)
+        write_save_payload(payload, target)
+
+    writer = SaveWriter(path, coalesce_seconds=0.0, write=flaky_write, retry_seconds=0.01)
+    data = PersistentData(onboarding_seen=True)
+    writer.request(data)
+
+    flushed = [writer.flush(timeout=5.0) for _ in range(3)]
+    writer.close()
+
+    assert flushed[0] is False
+    assert flushed[-1] is True
+    assert writer.failures == 2
+    assert isinstance(writer.last_error, struct.error)
+    assert load_persistent_data(path).onboarding_seen is True
+
+
+def test_save_writer_flush_times_out_while_writes_keep_failing(tmp_path: Path) -> None:
+    def broken_write(payload: dict[str, object], target: Path) -> None:
+        raise OverflowError("value too large")
+
+    writer = SaveWriter(tmp_path / "save.json", coalesce_seconds=0.0, write=broken_write, retry_seconds=60.0)
+    writer.request(PersistentData())
+
+    assert writer.flush(timeout=5.0) is False
+    assert writer.flush(timeout=0.05) is False
+    writer.close()
+    assert writer.failures >= 2
+
+
+def test_save_writer_snapshots_data_at_request_time(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    release = threading.Event()
+
+    def slow_write(payload: dict[str, object], target: Path) -> None:
+        release.wait(5.0)
+        write_save_payload(payload, target)
+
+    writer = SaveWriter(path, coalesce_seconds=0.0, write=slow_write)
+    data = PersistentData()
+    record_score(data, UserSettings(), 7, limit=10)
+    writer.request(data)
+    record_score(data, UserSettings(), 9, limit=10)
+    release.set()
+    writer.close()
+
+    assert load_persistent_data(path).leaderboard[leaderboard_key(UserSettings())] == [7]
+
+
+def test_save_writer_serialises_a_cheap_snapshot_on_its_own_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "save.json"
+    release = threading.Event()
+    threads: list[str] = []
+
+    def slow_payload(data: PersistentData) -> dict[str, object]:
+        threads.append(threading.current_thread().name)
+        release.wait(5.0)
+        return persistent_payload(data)
+
+    monkeypatch.setattr("snake_game.save_writer.persistent_payload", slow_payload)
+    writer = SaveWriter(path, coalesce_seconds=0.0)
+    data = PersistentData()
+    key = leaderboard_key(UserSettings())
+    record_score(data, UserSettings(), 7, limit=10)
+    update_run_stats(data, 7, key)
+    writer.request(data)
+    record_score(data, UserSettings(), 9, limit=10)
+    update_run_stats(data, 9, key)
+    data.settings.muted = True
+    release.set()
+    writer.close()
+
+    loaded = load_persistent_data(path)
+    assert threads == ["save-writer"]
+    assert loaded.leaderboard[key] == [7]
+    assert loaded.run_stats[key].score.count == 1
+    assert loaded.settings.muted is False
+    assert data.run_stats[key].score.count == 2
+
+
+def test_record_score_copies_a_board_only_once_per_snapshot() -> None:
+    data = PersistentData()
+    first = record_score(data, UserSettings(), 3, limit=None)
+    assert record_score(data, UserSettings(), 5, limit=None) is first
+
+    snapshot = snapshot_persistent_data(data)
+    second = record_score(data, UserSettings(), 8, limit=None)
+    assert second is not first
+    assert record_score(data, UserSettings(), 1, limit=None) is second
+    assert list(snapshot.leaderboard[leaderboard_key(UserSettings())]) == [5, 3]
+    assert list(second) == [8, 5, 3, 1]
+
+
+def test_save_writer_writes_files_atomically_off_the_caller_thread(tmp_path: Path) -> None:
+    release = threading.Event()
+
+    def slow_write(payload: dict[str, object], target: Path) -> None:
+        release.wait(5.0)
+        write_save_payload(payload, target)
+
+    writer = SaveWriter(tmp_path / "save.json", coalesce_seconds=0.0, write=slow_write)
+    writer.request(PersistentData())
+    replay_path = tmp_path / "replays" / "latest.snkr"
+    writer.write_file(replay_path, b"first")
+    writer.write_file(replay_path, b"second")
+    assert not replay_path.exists()
+
+    release.set()
+    assert writer.flush(timeout=5.0)
+    writer.close()
+
+    assert replay_path.read_bytes() == b"second"
+    assert [entry.name for entry in replay_path.parent.iterdir()] == ["latest.snkr"]
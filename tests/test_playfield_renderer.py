@@ -0,0 +1,71 @@
+import pygame
+import pytest
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.rendering.assets import RenderAssets
+from snake_game.rendering.layers import PlayfieldRenderer
+from snake_game.sim.session import GameSession
+from snake_game.ui.theme import resolve_theme
+
+
+@pytest.fixture
+def renderer() -> PlayfieldRenderer:
+    pygame.font.init()
+    config = GameConfig(window_width=240, window_height=200, cell_size=20, obstacle_count=5)
+    config.validate()
+    theme = resolve_theme(config.graphics.theme_id, config.graphics.colorblind_mode)
+    return PlayfieldRenderer(config=config, theme=theme, assets=RenderAssets())
+
+
+def render(renderer: PlayfieldRenderer, screen: pygame.Surface, offset: tuple[int, int], flash_alpha: int = 0) -> None:
+    session = GameSession(renderer.config, UserSettings(obstacles_enabled=True), seed=3)
+    font = pygame.font.Font(None, 20)
+    renderer.render(
+        screen=screen,
+        state=session.state,
+        hud_font=font,
+        small_font=font,
+        countdown_remaining=0.0,
+        best_score=10,
+        stage=1,
+        powerup_position=None,
+        active_effect_labels=["Slow"],
+        stage_banner_text="Stage 2",
+        stage_banner_alpha=120,
+        flash_alpha=flash_alpha,
+        camera_offset=offset,
+    )
+
+
+def test_shaken_frames_reuse_their_buffers(renderer: PlayfieldRenderer, monkeypatch: pytest.MonkeyPatch) -> None:
+    screen = pygame.Surface((240, 200))
+    render(renderer, screen, (3, -2), flash_alpha=90)
+    buffers = (renderer._world_buffer, renderer._flash_buffer, renderer._banner_buffer, renderer._hud_panel)
+
+    allocations = 0
+    surface_type = pygame.Surface
+
+    class CountingSurface(surface_type):  # type: ignore[misc, valid-type]
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            nonlocal allocations
+            allocations += 1
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(pygame, "Surface", CountingSurface)
+    for offset in ((3, -2), (-1, 4), (0, 0)):
+        render(renderer, screen, offset, flash_alpha=90)
+
+    assert allocations == 0
+    assert (renderer._world_buffer, renderer._flash_buffer, renderer._banner_buffer, renderer._hud_panel) == buffers
+
+
+def test_direct_path_matches_the_buffered_frame(renderer: PlayfieldRenderer) -> None:
+    direct = pygame.Surface((240, 200))
+    render(renderer, direct, (0, 0))
+    shaken = pygame.Surface((240, 200))
+    render(renderer, shaken, (5, 0))
+
+    assert renderer._world_buffer is not None
+    assert pygame.image.tobytes(direct.subsurface((0, 0, 235, 200)), "RGB") == pygame.image.tobytes(
+        shaken.subsurface((5, 0, 235, 200)), "RGB"
+    )
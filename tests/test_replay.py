@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.replay import (
+    KIND_POWERUP_SPAWN,
+    Replay,
+    ReplayDesyncError,
+    ReplayFormatError,
+    ReplayRecorder,
+    run_replay,
+)
+from snake_game.sim.session import GameSession
+from snake_game.types import Difficulty, MapMode
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=240, window_height=200, cell_size=20, obstacle_count=5)
+    config.validate()
+    return config
+
+
+def record_run(settings: UserSettings, seed: int) -> tuple[GameSession, Replay]:
+    config = make_config()
+    session = GameSession(config, settings, seed=seed)
+    recorder = ReplayRecorder(session)
+    noise = random.Random(seed)
+    while not session.finished and session.tick < 3000:
+        direction = greedy_policy(session.state, config)
+        if direction is not None and noise.random() < 0.9:
+            recorder.queue_direction(direction)
+        session.step()
+    return session, recorder.finish()
+
+
+def test_replay_round_trips_through_bytes() -> None:
+    _, replay = record_run(UserSettings(difficulty=Difficulty.HARD, map_mode=MapMode.WRAP, obstacles_enabled=True), 5)
+
+    decoded = Replay.from_bytes(replay.to_bytes())
+
+    assert decoded == replay
+
+
+def test_replay_reproduces_recorded_run() -> None:
+    session, replay = record_run(UserSettings(obstacles_enabled=True), 8)
+    replay = Replay.from_bytes(replay.to_bytes())
+
+    replayed = run_replay(replay, make_config())
+
+    assert replayed.state.score == session.state.score
+    assert replayed.tick == session.tick
+    assert list(replayed.state.snake) == list(session.state.snake)
+
+
+def test_replay_encodes_inputs_in_a_few_bytes() -> None:
+    _, replay = record_run(UserSettings(), 13)
+
+    payload = replay.to_bytes()
+
+    assert replay.input_count > 10
+    assert len(payload) < 32 + 3 * len(replay.events)
+
+
+def test_replay_detects_tampered_score() -> None:
+    _, replay = record_run(UserSettings(), 21)
+    replay.final_score += 10
+
+    with pytest.raises(ReplayDesyncError):
+        run_replay(replay, make_config())
+
+
+def test_replay_records_powerup_spawns() -> None:
+    session, replay = record_run(UserSettings(map_mode=MapMode.WRAP), 34)
+    assert any(event.kind == KIND_POWERUP_SPAWN for event in replay.events)
+
+
+def test_from_bytes_rejects_garbage() -> None:
+    with pytest.raises(ReplayFormatError):
+        Replay.from_bytes(b"nope")
@@ -0,0 +1,67 @@
+import random
+import statistics
+from pathlib import Path
+
+import pytest
+
+from snake_game.config import UserSettings
+from snake_game.persistence import (
+    PersistentData,
+    apply_run_record,
+    leaderboard_key,
+    load_persistent_data,
+    next_run_record,
+    save_persistent_data,
+)
+from snake_game.run_stats import MetricStats, QuantileSketch
+
+
+def test_moments_match_the_exact_mean_and_variance() -> None:
+    rng = random.Random(3)
+    values = [rng.uniform(0, 500) for _ in range(5_000)]
+    metric = MetricStats()
+    for value in values:
+        metric.add(value)
+    assert metric.mean == pytest.approx(statistics.fmean(values))
+    assert metric.variance == pytest.approx(statistics.pvariance(values))
+
+
+def test_sketch_quantiles_stay_within_relative_accuracy() -> None:
+    rng = random.Random(8)
+    values = sorted(rng.lognormvariate(4, 1) for _ in range(20_000))
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.05)
+    assert sketch.percent_below(values[len(values) // 4]) == pytest.approx(25, abs=1.5)
+    assert len(sketch.buckets) <= sketch.max_buckets
+
+
+def test_sketch_memory_is_bounded_by_max_buckets() -> None:
+    sketch = QuantileSketch(max_buckets=32)
+    for value in range(1, 200_000, 7):
+        sketch.add(value)
+    assert len(sketch.buckets) == 32
+    assert sketch.quantile(0.99) == pytest.approx(198_000, rel=0.05)
+
+
+def test_run_stats_update_per_key_and_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "save.json"
+    settings = UserSettings()
+    data = PersistentData()
+    for score in range(0, 200, 10):
+        stage = score // 50 + 1
+        record = next_run_record(data, settings, score, 10, stage=stage, food_eaten=score // 10, run_seconds=2.5)
+        apply_run_record(data, record)
+    save_persistent_data(data, path)
+
+    run_stats = load_persistent_data(path).run_stats[leaderboard_key(settings)]
+
+    assert run_stats == data.run_stats[leaderboard_key(settings)]
+    assert run_stats.score.count == 20
+    assert run_stats.score.mean == pytest.approx(95)
+    assert run_stats.stage.quantile(0.99) == pytest.approx(4, rel=0.03)
+    assert run_stats.run_seconds.stddev == pytest.approx(0)
+    assert run_stats.score.percent_below(150) == pytest.approx(75, abs=3)
@@ -0,0 +1,150 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from snake_game import persistence
+from snake_game.config import GraphicsSettings, UserSettings
+from snake_game.leaderboard import Leaderboard
+from snake_game.persistence import (
+    SAVE_SCHEMA_VERSION,
+    PersistentData,
+    PlayerStats,
+    apply_run_record,
+    best_score_for_settings,
+    leaderboard_key,
+    load_persistent_data,
+    migration,
+    next_run_record,
+    persistent_payload,
+    save_persistent_data,
+)
+from snake_game.save_codec import SAVE_MAGIC, LazyMap, encode_save
+from snake_game.types import Difficulty, MapMode, ThemeId
+
+
+def make_data() -> PersistentData:
+    data = PersistentData(
+        settings=UserSettings(difficulty=Difficulty.HARD, map_mode=MapMode.WRAP, muted=True),
+        graphics=GraphicsSettings(theme_id=ThemeId.OCEAN, ui_scale=1.25, colorblind_mode="deuteranopia"),
+        stats=PlayerStats(total_runs=3, total_score=40, best_score_global=21),
+        achievements=["first_food", "stage_3"],
+        onboarding_seen=True,
+        leaderboard={f"key{index}": Leaderboard(range(index * 10)) for index in range(20)},
+    )
+    for score in (12, 0, 44):
+        apply_run_record(data, next_run_record(data, data.settings, score, None, stage=2, run_seconds=9.5))
+    return data
+
+
+def test_binary_save_round_trips_every_section(tmp_path: Path) -> None:
+    path = tmp_path / "save.snks"
+    data = make_data()
+    save_persistent_data(data, path)
+
+    assert path.read_bytes().startswith(SAVE_MAGIC)
+    assert load_persistent_data(path) == data
+
+
+def test_leaderboards_and_run_stats_decode_on_first_access(tmp_path: Path) -> None:
+    path = tmp_path / "save.snks"
+    data = make_data()
+    save_persistent_data(data, path)
+
+    loaded = load_persistent_data(path)
+    leaderboard = loaded.leaderboard
+    assert isinstance(leaderboard, LazyMap) and isinstance(loaded.run_stats, LazyMap)
+    assert leaderboard.pending == len(leaderboard) == 21
+    assert best_score_for_settings(loaded, loaded.settings) == 44
+    assert leaderboard.pending == 20
+    assert "key7" in leaderboard and leaderboard.pending == 20
+    assert leaderboard["key7"] == list(range(69, -1, -1))
+    assert leaderboard.pending == 19
+    assert loaded.run_stats[leaderboard_key(loaded.settings)].stage.mean == pytest.approx(2)
+
+    assert sorted(leaderboard) == sorted(data.leaderboard)
+    assert leaderboard.pending == 0
+
+
+def test_lazy_map_mutations_see_undecoded_entries(tmp_path: Path) -> None:
+    path = tmp_path / "save.snks"
+    save_persistent_data(make_data(), path)
+    leaderboard = load_persistent_data(path).leaderboard
+    assert isinstance(leaderboard, LazyMap)
+
+    snapshot = leaderboard.copy()
+    assert leaderboard.pop("key3") == list(range(29, -1, -1))
+    del leaderboard["key4"]
+    assert leaderboard.setdefault("key5", Leaderboard()) == list(range(49, -1, -1))
+    leaderboard.update({"key6": Leaderboard([1])})
+
+    assert "key3" not in leaderboard and "key4" not in leaderboard
+    assert leaderboard["key6"] == [1]
+    assert len(leaderboard) == 19
+    assert len(dict(leaderboard)) == 19
+    assert snapshot.pending == 21
+    assert snapshot["key3"] == list(range(29, -1, -1))
+    assert snapshot["key6"] == list(range(59, -1, -1))
+
+
+def test_missing_binary_save_falls_back_to_the_json_save(tmp_path: Path) -> None:
+    (tmp_path / "save.json").write_text(json.dumps({"leaderboard": {"easy|wrap|obs": [3, 8]}}), encoding="utf-8")
+    path = tmp_path / "save.snks"
+
+    loaded = load_persistent_data(path)
+    save_persistent_data(loaded, path)
+
+    assert load_persistent_data(path).leaderboard["easy|wrap|obs"] == [8, 3]
+
+
+def test_corrupt_binary_save_is_backed_up(tmp_path: Path) -> None:
+    path = tmp_path / "save.snks"
+    save_persistent_data(make_data(), path)
+    path.write_bytes(path.read_bytes()[:30])
+
+    assert load_persistent_data(path) == PersistentData()
+    assert list(tmp_path.glob("save.snks.corrupt-*"))
+
+
+def test_corrupt_leaderboard_entry_is_rejected_at_load_time(tmp_path: Path) -> None:
+    path = tmp_path / "save.snks"
+    save_persistent_data(PersistentData(leaderboard={"k": Leaderboard([5])}), path)
+    path.write_bytes(path.read_bytes().replace(b"\x01\x00k\x04\x00\x00\x00", b"\x01\x00k\x03\x00\x00\x00"))
+
+    assert load_persistent_data(path) == PersistentData()
+    assert list(tmp_path.glob("save.snks.corrupt-*"))
+
+
+def test_older_binary_saves_run_the_migration_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "save.snks"
+    payload = persistent_payload(make_data())
+    payload["schema_version"] = SAVE_SCHEMA_VERSION - 1
+    path.write_bytes(encode_save(payload))
+
+    def rename_achievements(payload: dict[str, object]) -> None:
+        payload["achievements"] = ["migrated"]
+
+    monkeypatch.setitem(persistence._MIGRATIONS, SAVE_SCHEMA_VERSION - 1, rename_achievements)
+    loaded = load_persistent_data(path)
+
+    assert loaded.achievements == ["migrated"]
+    assert loaded.leaderboard["key7"] == list(range(69, -1, -1))
+
+
+def test_newer_binary_saves_are_set_aside_instead_of_read(tmp_path: Path) -> None:
+    path = tmp_path / "save.snks"
+    payload = persistent_payload(make_data())
+    payload["schema_version"] = SAVE_SCHEMA_VERSION + 1
+    path.write_bytes(encode_save(payload))
+    (tmp_path / "save.json").write_text(json.dumps({"onboarding_seen": True}), encoding="utf-8")
+
+    loaded = load_persistent_data(path)
+
+    assert loaded.onboarding_seen is True
+    assert loaded.leaderboard == {}
+    assert list(tmp_path.glob("save.snks.unsupported-*"))
+
+
+def test_migrations_are_registered_once_per_version() -> None:
+    with pytest.raises(ValueError):
+        migration(2)(lambda payload: None)
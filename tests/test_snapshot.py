@@ -0,0 +1,67 @@
+import random
+
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.session import GameSession, SessionUndo
+from snake_game.types import Direction, MapMode
+
+
+def make_session(seed: int, map_mode: MapMode = MapMode.WRAP) -> GameSession:
+    config = GameConfig(window_width=200, window_height=160, cell_size=20, obstacle_count=4)
+    config.validate()
+    session = GameSession(config, UserSettings(map_mode=map_mode, obstacles_enabled=True), seed=seed)
+    session.powerups.spawn_chance_per_food = 1.0
+    return session
+
+
+def pick_direction(session: GameSession, rng: random.Random) -> Direction | None:
+    if rng.random() < 0.7:
+        return greedy_policy(session.state, session.config)
+    return rng.choice([None, *Direction])
+
+
+def test_undo_restores_every_step_exactly() -> None:
+    ate = 0
+    collected = 0
+    for seed, map_mode in ((1, MapMode.WRAP), (2, MapMode.BOUNDED), (3, MapMode.WRAP)):
+        session = make_session(seed, map_mode)
+        rng = random.Random(seed)
+        probe_rng = random.Random(seed + 100)
+        record = SessionUndo()
+        while not session.finished and session.tick < 600:
+            before = session.snapshot()
+            for _ in range(2):
+                session.step(probe_rng.choice([None, *Direction]), undo=record)
+                session.undo(record)
+                assert session.snapshot() == before
+            session.step(pick_direction(session, rng))
+            ate += session.ate_this_tick
+            collected += session.collected_this_tick is not None
+    assert ate > 0
+    assert collected > 0
+
+
+def test_restore_rewinds_many_steps_and_replays_identically() -> None:
+    session = make_session(7)
+    rng = random.Random(7)
+    for _ in range(20):
+        session.step(pick_direction(session, rng))
+    checkpoint = session.snapshot()
+
+    directions = [pick_direction(session, rng) for _ in range(200)]
+    for direction in directions:
+        session.step(direction)
+    first_run = session.snapshot()
+
+    session.restore(checkpoint)
+    assert session.snapshot() == checkpoint
+    for direction in directions:
+        session.step(direction)
+    assert session.snapshot() == first_run
+
+
+def test_undo_without_a_recorded_step_is_a_no_op() -> None:
+    session = make_session(3)
+    before = session.snapshot()
+    session.undo(SessionUndo())
+    assert session.snapshot() == before
@@ -0,0 +1,102 @@
+import json
+from contextlib import closing
+from pathlib import Path
+
+from snake_game import sqlite_store
+from snake_game.config import UserSettings
+from snake_game.journal import append_records, journal_path
+from snake_game.persistence import (
+    PersistentData,
+    append_run_records,
+    apply_run_record,
+    history_standing,
+    leaderboard_key,
+    load_persistent_data,
+    next_run_record,
+    save_persistent_data,
+)
+from snake_game.save_writer import SaveWriter
+from snake_game.sqlite_store import RunStanding
+from snake_game.types import Difficulty, MapMode
+
+EASY_WRAP = UserSettings(difficulty=Difficulty.EASY, map_mode=MapMode.WRAP)
+KEY = leaderboard_key(EASY_WRAP)
+
+
+def play_runs(data: PersistentData, path: Path, scores: list[int]) -> None:
+    for score in scores:
+        record = next_run_record(data, EASY_WRAP, score, limit=10, stage=2, food_eaten=score // 10, run_seconds=4.5)
+        apply_run_record(data, record)
+        append_run_records(path, [record])
+
+
+def test_history_is_unbounded_with_indexed_top_and_rank(tmp_path: Path) -> None:
+    path = tmp_path / "save.db"
+    data = PersistentData()
+    play_runs(data, path, list(range(0, 300, 10)) * 2)
+    save_persistent_data(data, path)
+
+    assert history_standing(path, KEY, 285, top=3) == RunStanding(rank=3, runs=61, top=(290, 290, 285))
+    assert history_standing(path, KEY, 0) == RunStanding(rank=59, runs=61, top=(290, 290, 280, 280, 270))
+    assert history_standing(tmp_path / "save.json", KEY, 0) is None
+    with closing(sqlite_store.connect(path)) as connection:
+        latest = connection.execute("SELECT * FROM runs ORDER BY seq DESC LIMIT 1").fetchone()
+    assert latest[:6] == (60, KEY, 290, 2, 29, 4.5)
+
+    assert len(load_persistent_data(path).leaderboard[KEY]) == 60
+    loaded = load_persistent_data(path, leaderboard_limit=10)
+    assert loaded.leaderboard[KEY] == data.leaderboard[KEY]
+    assert loaded.stats == data.stats
+    assert loaded.journal_seq == 60
+
+
+def test_runs_after_the_snapshot_are_replayed_into_stats(tmp_path: Path) -> None:
+    path = tmp_path / "save.db"
+    data = PersistentData()
+    play_runs(data, path, [5])
+    save_persistent_data(data, path)
+    play_runs(data, path, [40, 15])
+
+    loaded = load_persistent_data(path)
+
+    assert loaded.journal_seq == 3
+    assert loaded.stats.total_runs == 3
+    assert loaded.stats.best_score_global == 40
+    assert loaded.leaderboard[KEY] == [40, 15, 5]
+
+
+def test_existing_json_save_is_migrated_once(tmp_path: Path) -> None:
+    legacy = tmp_path / "save.json"
+    legacy.write_text(
+        json.dumps({"schema_version": 2, "settings": {"difficulty": "hard"}, "leaderboard": {KEY: [12, 30, 7]}}),
+        encoding="utf-8",
+    )
+    json_data = load_persistent_data(legacy)
+    record = next_run_record(json_data, EASY_WRAP, 21, limit=10)
+    append_records(journal_path(legacy), [record])
+
+    path = tmp_path / "save.db"
+    migrated = load_persistent_data(path)
+
+    assert migrated.settings.difficulty == Difficulty.HARD
+    assert migrated.leaderboard[KEY] == [30, 21, 12, 7]
+    assert migrated.journal_seq == 1
+    assert history_standing(path, KEY, 0, top=10) == RunStanding(rank=5, runs=5, top=(30, 21, 12, 7, 0))
+
+    legacy.unlink()
+    assert load_persistent_data(path).leaderboard[KEY] == [30, 21, 12, 7]
+
+
+def test_save_writer_keeps_runs_when_a_snapshot_is_pending(tmp_path: Path) -> None:
+    path = tmp_path / "save.db"
+    writer = SaveWriter(path, coalesce_seconds=0.0)
+    data = PersistentData()
+    for score in (3, 9):
+        record = next_run_record(data, EASY_WRAP, score, limit=10)
+        apply_run_record(data, record)
+        writer.append(record)
+    writer.request(data)
+    writer.close()
+
+    assert history_standing(path, KEY, 0).top == (9, 3, 0)
+    assert load_persistent_data(path).stats.total_runs == 2
@@ -0,0 +1,138 @@
+import random
+
+from snake_game.config import GameConfig, UserSettings
+from snake_game.logic import advance_one_step, create_initial_state, free_cell_index, queue_direction_change
+from snake_game.state import FreeCellIndex, SnakeBody
+from snake_game.types import Direction, GameStatus
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=200, window_height=200, cell_size=20)
+    config.validate()
+    return config
+
+
+def test_snake_body_tracks_occupancy_on_push_and_pop() -> None:
+    body = SnakeBody([(3, 3), (2, 3), (1, 3)])
+
+    body.push_head((4, 3))
+    removed = body.pop_tail()
+
+    assert removed == (1, 3)
+    assert list(body) == [(4, 3), (3, 3), (2, 3)]
+    assert (4, 3) in body
+    assert (1, 3) not in body
+    assert body.head == (4, 3)
+    assert body.tail == (2, 3)
+    assert len(body) == 3
+
+
+def test_assigning_list_to_snake_wraps_it_in_body() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(1))
+
+    state.snake = [(5, 5), (4, 5), (3, 5)]
+
+    assert isinstance(state.snake, SnakeBody)
+    assert (4, 5) in state.snake
+    assert state.snake[0] == (5, 5)
+
+
+def test_head_may_enter_cell_vacated_by_tail() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(2))
+    state.snake = [(4, 4), (4, 5), (3, 5), (3, 4)]
+    state.direction = Direction.LEFT
+    state.food = (0, 0)
+
+    advance_one_step(state, config, random.Random(2))
+
+    assert state.status == GameStatus.RUNNING
+    assert list(state.snake) == [(3, 4), (4, 4), (4, 5), (3, 5)]
+    assert (3, 4) in state.snake
+
+
+def test_head_into_tail_is_fatal_when_growing() -> None:
+    config = make_config()
+    state = create_initial_state(config, UserSettings(), random.Random(3))
+    state.snake = [(4, 4), (4, 5), (3, 5), (3, 4)]
+    state.direction = Direction.LEFT
+    state.food = (3, 4)
+
+    advance_one_step(state, config, random.Random(3))
+
+    assert state.status == GameStatus.GAME_OVER
+
+
+def test_free_cell_index_take_release_and_sample() -> None:
+    index = FreeCellIndex(3, 2, occupied=[(0, 0), (2, 1)])
+
+    assert len(index) == 4
+    assert (0, 0) not in index
+    assert index.take((1, 0)) >= 0
+    assert index.take((1, 0)) == -1
+    assert index.release((0, 0)) is True
+    assert index.release((0, 0)) is False
+    assert {index.sample(random.Random(seed)) for seed in range(50)} <= {(0, 0), (2, 0), (0, 1), (1, 1)}
+
+
+def test_free_cell_index_reinsert_restores_exact_layout() -> None:
+    index = FreeCellIndex(4, 4)
+    before = [index.sample(random.Random(seed)) for seed in range(20)]
+
+    slot = index.take((1, 2))
+    index.reinsert((1, 2), slot)
+
+    assert [index.sample(random.Random(seed)) for seed in range(20)] == before
+
+
+def test_sample_excluding_leaves_index_unchanged() -> None:
+    index = FreeCellIndex(2, 2)
+
+    chosen = index.sample_excluding(random.Random(4), {(0, 0), (1, 0), (0, 1)})
+
+    assert chosen == (1, 1)
+    assert len(index) == 4
+    assert index.sample_excluding(random.Random(4), {(0, 0), (1, 0), (0, 1), (1, 1)}) is None
+
+
+def test_free_cells_stay_in_sync_with_steps() -> None:
+    config = make_config()
+    rng = random.Random(5)
+    state = create_initial_state(config, UserSettings(obstacles_enabled=True), rng)
+    turns = [Direction.UP, Direction.LEFT, Direction.DOWN, Direction.RIGHT]
+
+    for step in range(200):
+        if state.status != GameStatus.RUNNING:
+            break
+        if step % 3 == 0:
+            queue_direction_change(state, turns[(step // 3) % len(turns)])
+        advance_one_step(state, config, rng)
+
+    index = free_cell_index(state, config)
+    expected = {
+        (x, y)
+        for y in range(config.grid_height)
+        for x in range(config.grid_width)
+        if (x, y) not in state.snake and (x, y) not in state.obstacles
+    }
+    assert len(index) == len(expected)
+    assert all(cell in index for cell in expected)
+
+
+def test_same_seed_spawns_same_food_sequence() -> None:
+    config = make_config()
+
+    def food_sequence(seed: int) -> list[tuple[int, int]]:
+        rng = random.Random(seed)
+        state = create_initial_state(config, UserSettings(), rng)
+        foods = [state.food]
+        for _ in range(4):
+            head_x, head_y = state.snake[0]
+            state.food = (head_x + 1, head_y)
+            advance_one_step(state, config, rng)
+            foods.append(state.food)
+            state.snake = [state.snake[0]]
+        return foods
+
+    assert food_sequence(9) == food_sequence(9)
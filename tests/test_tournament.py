@@ -0,0 +1,60 @@
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.tournament import TIMEOUT_REASON, play_game, run_tournament, settings_grid
+from snake_game.state import GameState
+from snake_game.types import Difficulty, Direction, MapMode
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=200, window_height=200, cell_size=20, obstacle_count=4)
+    config.validate()
+    return config
+
+
+def straight_policy(state: GameState, config: GameConfig) -> Direction | None:
+    return None
+
+
+def test_settings_grid_covers_every_combination() -> None:
+    grid = settings_grid()
+    assert len(grid) == len(Difficulty) * 2 * 2
+    assert len({(s.difficulty, s.map_mode, s.obstacles_enabled) for s in grid}) == len(grid)
+
+
+def test_play_game_is_deterministic_per_seed() -> None:
+    config = make_config()
+    settings = UserSettings(obstacles_enabled=True)
+    first = play_game("greedy", greedy_policy, config, settings, seed=11, max_steps=500)
+    second = play_game("greedy", greedy_policy, config, settings, seed=11, max_steps=500)
+    assert first == second
+    assert first.steps > 0
+
+
+def test_play_game_reports_wall_death_and_timeout() -> None:
+    config = make_config()
+    bounded = play_game("straight", straight_policy, config, UserSettings(), seed=1, max_steps=100)
+    wrapped = play_game("straight", straight_policy, config, UserSettings(map_mode=MapMode.WRAP), seed=1, max_steps=30)
+    assert bounded.death_reason == "wall"
+    assert wrapped.death_reason == TIMEOUT_REASON
+    assert wrapped.steps == 30
+
+
+def test_run_tournament_aggregates_results_from_workers() -> None:
+    config = make_config()
+    streamed = []
+    report = run_tournament(
+        {"greedy": greedy_policy, "straight": straight_policy},
+        [UserSettings(), UserSettings(map_mode=MapMode.WRAP, obstacles_enabled=True)],
+        games_per_setting=5,
+        config=config,
+        max_steps=300,
+        max_workers=2,
+        batch_size=2,
+        on_result=streamed.append,
+    )
+
+    assert report.games == 20
+    assert len(streamed) == 20
+    assert len(report.rows()) == 4
+    assert all(entry.games == 5 for entry in report.rows())
+    assert "greedy" in report.format_table()
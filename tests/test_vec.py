@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from snake_game.config import GameConfig, UserSettings  # noqa: E402
+from snake_game.events import EventBus, GameEventType  # noqa: E402
+from snake_game.logic import advance_one_step, create_initial_state, queue_direction_change  # noqa: E402
+from snake_game.sim.vec import ACTIONS, NO_ACTION, STATUS_GAME_OVER, VecSnake  # noqa: E402
+from snake_game.types import Difficulty, GameStatus, MapMode  # noqa: E402
+
+
+def make_config() -> GameConfig:
+    config = GameConfig(window_width=200, window_height=160, cell_size=20, obstacle_count=6)
+    config.validate()
+    return config
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        UserSettings(difficulty=Difficulty.EASY, map_mode=MapMode.BOUNDED),
+        UserSettings(difficulty=Difficulty.NORMAL, map_mode=MapMode.WRAP, obstacles_enabled=True),
+        UserSettings(difficulty=Difficulty.HARD, map_mode=MapMode.BOUNDED, obstacles_enabled=True),
+    ],
+)
+def test_vec_snake_matches_scalar_engine(settings: UserSettings) -> None:
+    config = make_config()
+    num_games = 12
+    seeds = list(range(100, 100 + num_games))
+    engine = VecSnake(num_games, config, settings, seed=7)
+    engine.reset(seeds)
+
+    rngs = [random.Random(seed) for seed in seeds]
+    states = [create_initial_state(config, settings, rng) for rng in rngs]
+    buses = [EventBus() for _ in range(num_games)]
+    action_rng = random.Random(3)
+
+    for _ in range(150):
+        actions = [action_rng.choice([NO_ACTION, 0, 1, 2, 3]) for _ in range(num_games)]
+        for game, state in enumerate(states):
+            if actions[game] != NO_ACTION:
+                queue_direction_change(state, ACTIONS[actions[game]])
+            advance_one_step(state, config, rngs[game], emit=buses[game].emit)
+        engine.step(np.array(actions))
+
+        for game, state in enumerate(states):
+            events = buses[game].drain()
+            if any(event.type == GameEventType.FOOD_EATEN for event in events):
+                state.food = engine.food_position(game)
+            died = [event for event in events if event.type == GameEventType.PLAYER_DIED]
+
+            assert engine.snake(game) == list(state.snake)
+            assert int(engine.scores[game]) == state.score
+            assert float(engine.steps_per_second[game]) == pytest.approx(state.steps_per_second)
+            assert (engine.status[game] == STATUS_GAME_OVER) == (state.status == GameStatus.GAME_OVER)
+            if died:
+                assert engine.death_reason_label(game) == died[0].payload["reason"]
+
+
+def test_vec_snake_spawns_food_on_free_cells() -> None:
+    config = make_config()
+    engine = VecSnake(4, config, UserSettings(obstacles_enabled=True), seed=1)
+    engine.reset([1, 2, 3, 4])
+
+    for game in range(4):
+        head = engine.snake(game)[0]
+        engine.food[game] = (head[1]) * engine.width + head[0] + 1
+    engine.step(np.full(4, NO_ACTION))
+
+    assert (engine.length == 4).all()
+    for game in range(4):
+        food = int(engine.food[game])
+        assert not engine.occupancy[game, food]
+        assert not engine.obstacles[game, food]
+
+
+def test_vec_snake_rejects_unsupported_game_count() -> None:
+    with pytest.raises(ValueError):
+        VecSnake(0, make_config(), UserSettings())
@@ -0,0 +1,100 @@
+import dataclasses
+import random
+
+import pytest
+
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.persistence import leaderboard_key
+from snake_game.sim.replay import Replay, ReplayRecorder
+from snake_game.sim.session import GameSession
+from snake_game.sim import verify
+from snake_game.sim.verify import VerificationRequest, verify_all, verify_run
+from snake_game.types import MapMode
+
+
+def record_replay(settings: UserSettings, seed: int) -> Replay:
+    config = GameConfig()
+    session = GameSession(config, settings, seed=seed)
+    recorder = ReplayRecorder(session)
+    noise = random.Random(seed)
+    while not session.finished and session.tick < 2000:
+        direction = greedy_policy(session.state, config)
+        if direction is not None and noise.random() < 0.9:
+            recorder.queue_direction(direction)
+        session.step()
+    return recorder.finish()
+
+
+def test_honest_run_is_accepted() -> None:
+    settings = UserSettings(map_mode=MapMode.WRAP)
+    replay = record_replay(settings, 3)
+
+    result = verify_run(VerificationRequest(1, replay.to_bytes(), replay.final_score, leaderboard_key(settings)))
+
+    assert result.accepted, result.reason
+    assert result.simulated_score == replay.final_score
+    assert result.steps == replay.final_tick
+
+
+def test_inflated_claim_is_rejected_without_simulating() -> None:
+    replay = record_replay(UserSettings(), 4)
+
+    result = verify_run(VerificationRequest(2, replay.to_bytes(), replay.final_score + 50))
+
+    assert not result.accepted
+    assert result.steps == 0
+    assert "claimed score" in result.reason
+
+
+def test_tampered_replay_and_wrong_leaderboard_are_rejected() -> None:
+    replay = record_replay(UserSettings(obstacles_enabled=True), 5)
+    replay.final_score += 10
+    tampered = verify_run(VerificationRequest(3, replay.to_bytes(), replay.final_score))
+    wrong_board = verify_run(VerificationRequest(4, replay.to_bytes(), replay.final_score, "hard|open|clear"))
+    garbage = verify_run(VerificationRequest(5, b"not a replay", 0))
+
+    assert not tampered.accepted and tampered.reason.startswith("desync")
+    assert not wrong_board.accepted and "leaderboard" in wrong_board.reason
+    assert not garbage.accepted and garbage.reason.startswith("malformed")
+
+
+def test_process_pool_verifies_every_request() -> None:
+    replays = [record_replay(UserSettings(), seed) for seed in range(6)]
+    requests = [
+        VerificationRequest(index, replay.to_bytes(), replay.final_score) for index, replay in enumerate(replays)
+    ]
+    requests.append(VerificationRequest(len(requests), replays[0].to_bytes(), replays[0].final_score + 1))
+
+    results, report = verify_all(requests, max_workers=2, batch_size=2)
+
+    assert sorted(result.id for result in results) == list(range(len(requests)))
+    assert report.accepted == len(replays)
+    assert report.rejected == 1
+    assert report.steps == sum(replay.final_tick for replay in replays)
+    assert "7 runs: 6 accepted, 1 rejected" in report.format_summary()
+
+
+def test_forged_board_header_is_rejected_before_simulating() -> None:
+    replay = record_replay(UserSettings(obstacles_enabled=True), 6)
+    forged = dataclasses.replace(replay, grid_width=12, grid_height=12, obstacle_count=0)
+    huge = dataclasses.replace(replay, grid_width=65535, grid_height=65535)
+
+    for index, candidate in enumerate((forged, huge)):
+        key = leaderboard_key(candidate.settings)
+        result = verify_run(VerificationRequest(index, candidate.to_bytes(), candidate.final_score, key))
+        assert not result.accepted
+        assert "server configuration" in result.reason
+
+
+def test_simulation_crash_becomes_a_rejection(monkeypatch: pytest.MonkeyPatch) -> None:
+    replay = record_replay(UserSettings(), 7)
+
+    def crash(*args: object) -> None:
+        raise RuntimeError("board is full")
+
+    monkeypatch.setattr(verify, "run_replay", crash)
+    result = verify_run(VerificationRequest(8, replay.to_bytes(), replay.final_score))
+
+    assert not result.accepted
+    assert "board is full" in result.reason
@@ -0,0 +1,94 @@
+import random
+
+from snake_game.bots.greedy import greedy_policy
+from snake_game.config import GameConfig, UserSettings
+from snake_game.sim.codec import pack_state, unpack_state
+from snake_game.sim.replay import KIND_POWERUP_SPAWN, Replay, ReplayEvent
+from snake_game.sim.session import GameSession, SessionUndo
+from snake_game.systems.powerups import PowerUpType
+from snake_game.systems.world import ChunkedWorld
+from snake_game.types import Direction, GameStatus, MapMode
+
+
+def make_session(seed: int) -> GameSession:
+    config = GameConfig(window_width=200, window_height=160, cell_size=20, obstacle_count=4)
+    config.validate()
+    return GameSession(config, UserSettings(map_mode=MapMode.OPEN, obstacles_enabled=True), seed=seed)
+
+
+def test_evicted_chunks_regenerate_identically() -> None:
+    world = ChunkedWorld(seed=9, chunk_size=8, obstacles_per_chunk=5, max_chunks=4)
+    first = world.chunk((-3, 7))
+    for chunk_x in range(10):
+        world.chunk((chunk_x, 0))
+    assert world.cached_chunks == 4
+    assert world.chunk((-3, 7)) == first
+    assert ChunkedWorld(seed=9, chunk_size=8, obstacles_per_chunk=5).chunk((-3, 7)) == first
+
+
+def test_cache_stays_bounded_over_a_long_walk() -> None:
+    world = ChunkedWorld(seed=1, chunk_size=4, max_chunks=16)
+    for x in range(-5000, 5000):
+        _ = (x, x // 3) in world
+    assert world.cached_chunks == 16
+    assert world.generated_chunks > 16
+
+
+def test_safe_zone_has_no_obstacles() -> None:
+    world = ChunkedWorld(seed=3, chunk_size=4, obstacles_per_chunk=16, safe_center=(2, 2), safe_radius=2)
+    assert not list(world.obstacles_in(0, 0, 5, 5))
+    assert list(world.obstacles_in(-40, -40, 80, 80))
+
+
+def test_open_session_travels_far_from_the_origin() -> None:
+    session = make_session(5)
+    state = session.state
+    assert state.world is not None
+    start = state.body.head
+    while not session.finished and session.tick < 400:
+        head_x, head_y = state.body.head
+        direction = Direction.RIGHT
+        if (head_x + 1, head_y) in state.world:
+            direction = Direction.UP if (head_x, head_y - 1) not in state.world else Direction.DOWN
+        session.step(direction)
+        if not session.ate_this_tick:
+            continue
+        head_x, head_y = state.body.head
+        food_x, food_y = state.food
+        assert abs(food_x - head_x) <= state.world.spawn_radius + 1
+        assert abs(food_y - head_y) <= state.world.spawn_radius + 1
+    assert state.body.head[0] - start[0] > session.config.grid_width * 2
+    assert state.world.cached_chunks <= state.world.max_chunks
+
+
+def test_open_session_undo_and_codec_round_trip() -> None:
+    session = make_session(2)
+    rng = random.Random(2)
+    record = SessionUndo()
+    ate = 0
+    while not session.finished and session.tick < 300:
+        before = session.snapshot()
+        session.step(rng.choice(list(Direction)), undo=record)
+        session.undo(record)
+        assert session.snapshot() == before
+        session.step(greedy_policy(session.state, session.config))
+        ate += session.ate_this_tick
+    assert ate > 0
+
+    state, _, _ = unpack_state(pack_state(session.state, session.config))
+    assert list(state.body) == list(session.state.body)
+    assert state.world is not None and state.world.seed == session.state.world.seed
+    assert state.status in (GameStatus.RUNNING, GameStatus.GAME_OVER)
+
+
+def test_open_replay_keeps_negative_positions() -> None:
+    replay = Replay(
+        seed=1,
+        settings=UserSettings(map_mode=MapMode.OPEN),
+        grid_width=10,
+        grid_height=8,
+        obstacle_count=0,
+        events=[ReplayEvent(3, KIND_POWERUP_SPAWN, powerup=PowerUpType.SLOW_TIME, position=(-71, 4096))],
+        final_tick=5,
+    )
+    assert Replay.from_bytes(replay.to_bytes()).events == replay.events